@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Rendering benchmarks over the synthetic corpus in bench_corpus.json
+
+    python bench_markdown.py --save bench_baseline.json
+    # ...change things...
+    python bench_markdown.py --compare bench_baseline.json --threshold 0.1
+
+Reports throughput and p50/p99 latency per benchmark and
+corpus category. When comparing, exits with 1 if any p50
+latency got slower than the baseline by more than the threshold.
+"""
+
+from __future__ import unicode_literals
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "test_settings")
+django.setup()
+
+from sp_markdown import Markdown, quotify
+from sp_markdown.block import BlockGrammar, _classify_link
+from sp_markdown.inline import InlineGrammar
+from sp_markdown.utils.emoji import emojis
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_corpus.json')
+CATEGORIES = ('short', 'emoji', 'links', 'paragraphs', 'adversarial')
+
+_WORDS = (
+    'the', 'forum', 'post', 'reply', 'markdown', 'render', 'thread', 'user',
+    'comment', 'quick', 'brown', 'fox', 'jumps', 'over', 'lazy', 'dog', 'and',
+    'with', 'from', 'this', 'that', 'release', 'bug', 'fix', 'works', 'fine')
+_LINKS = (
+    'https://www.youtube.com/watch?v=Z0UISCEe52Y',
+    'https://www.youtube.com/watch?v=O1QQajfobPw&feature=youtu.be&t=3698',
+    'http://youtu.be/afyK1HSFfgw',
+    'https://vimeo.com/11111111',
+    'https://gfycat.com/PointedVengefulHyracotherium',
+    'http://foo.bar/image.png',
+    'http://foo.bar/path/to/photo.jpg?size=large',
+    'http://foo.bar/song.mp3',
+    'http://foo.bar/clip.mp4',
+    'http://foo.bar/some/page?foo=1&bar=2')
+
+
+def _sentence(rnd, size):
+    return ' '.join(rnd.choice(_WORDS) for _ in range(size)).capitalize() + '.'
+
+
+def generate_corpus(seed=42):
+    rnd = random.Random(seed)
+    names = sorted(emojis)
+    corpus = {c: [] for c in CATEGORIES}
+
+    for _ in range(200):
+        corpus['short'].append(_sentence(rnd, rnd.randint(3, 20)))
+
+    for _ in range(100):
+        corpus['emoji'].append(' '.join(
+            ':%s:' % rnd.choice(names) if rnd.random() < 0.5 else rnd.choice(_WORDS)
+            for _ in range(rnd.randint(10, 60))))
+
+    for _ in range(100):
+        lines = []
+
+        for _ in range(rnd.randint(2, 8)):
+            link = rnd.choice(_LINKS)
+            lines.append(link if rnd.random() < 0.6 else
+                         '%s %s %s' % (_sentence(rnd, 5), link, _sentence(rnd, 3)))
+
+        corpus['links'].append('\n\n'.join(lines))
+
+    for _ in range(20):
+        corpus['paragraphs'].append('\n\n'.join(
+            ' '.join(_sentence(rnd, rnd.randint(10, 25)) for _ in range(rnd.randint(5, 15)))
+            for _ in range(rnd.randint(3, 8))))
+
+    corpus['adversarial'].extend([
+        # Nested repetitions in the youtube link grammar
+        'https://youtu.be/xxxxxxxxxxx' + '?' * 20 + '&',
+        'https://www.youtube.com/watch?v=xxxxxxxxxxx' + '&t=1' * 12 + '&',
+        # Unclosed poll bodies
+        '[poll name=foo]\n' + '1. opt\n' * 14,
+        '[poll ' + 'x' * 2000 + '\n' + 'foo\n' * 500,
+        # Unclosed emphasis and emoji-like runs
+        '*' * 2000,
+        '_foo ' * 1000,
+        ':' * 5000,
+        ':foo' * 1000,
+        'x' * 50000,
+        '<' * 2000,
+        '[' * 300 + ']' * 300,
+        'http://' * 1000,
+        'a ' * 10000,
+        'http://foo.bar/' + '.png' * 1000 + ' x',
+    ])
+    return corpus
+
+
+def load_corpus():
+    with open(CORPUS_PATH) as fh:
+        return json.load(fh)
+
+
+def _benchmarks():
+    md = Markdown()
+    block = BlockGrammar()
+    inline = InlineGrammar()
+    inline.hard_wrap()
+
+    def lines(func):
+        def run_lines(text):
+            for line in text.splitlines():
+                func(line)
+        return run_lines
+
+    def rule(pattern):
+        return lines(pattern.match)
+
+    return (
+        ('render', md.render),
+        ('quotify', lambda text: quotify(text, 'foo')),
+        ('block_link', rule(block.block_link)),
+        # Block link classification, uncached
+        ('sub_block_link', lines(_classify_link)),
+        ('emoji', rule(inline.emoji)),
+        ('mention', rule(inline.mention)),
+        ('text', rule(inline.text)))
+
+
+def _percentile(values, percent):
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(percent / 100.0 * (len(values) - 1))))
+    return values[index]
+
+
+def run(corpus, repeat=3, only=None):
+    results = {}
+
+    for name, func in _benchmarks():
+        if only and name not in only:
+            continue
+
+        for category in CATEGORIES:
+            texts = corpus[category]
+            timings = []
+
+            for _ in range(repeat):
+                for text in texts:
+                    start = time.perf_counter()
+                    func(text)
+                    timings.append(time.perf_counter() - start)
+
+            total = sum(timings)
+            size = sum(len(t) for t in texts) * repeat
+            results['%s:%s' % (name, category)] = {
+                'ops': len(timings) / total if total else 0.0,
+                'chars': size / total if total else 0.0,
+                'p50': _percentile(timings, 50),
+                'p99': _percentile(timings, 99)}
+
+    return results
+
+
+def report(results, baseline=None, threshold=0.1, out=sys.stdout):
+    regressions = []
+    out.write('%-32s %12s %14s %12s %12s %10s\n' % (
+        'benchmark', 'ops/s', 'chars/s', 'p50 (us)', 'p99 (us)', 'vs base'))
+
+    for key in sorted(results):
+        res = results[key]
+        change = ''
+
+        if baseline and key in baseline and baseline[key]['p50']:
+            ratio = res['p50'] / baseline[key]['p50'] - 1
+            change = '%+.1f%%' % (ratio * 100)
+
+            if ratio > threshold:
+                regressions.append(key)
+                change += ' !'
+
+        out.write('%-32s %12.1f %14.1f %12.1f %12.1f %10s\n' % (
+            key, res['ops'], res['chars'], res['p50'] * 1e6, res['p99'] * 1e6, change))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='sp_markdown benchmarks')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--only', nargs='*', help='benchmark names to run')
+    parser.add_argument('--save', metavar='PATH', help='write the results as a baseline')
+    parser.add_argument('--compare', metavar='PATH', help='baseline to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='allowed p50 slowdown, 0.1 is 10%%')
+    parser.add_argument('--generate', action='store_true',
+                        help='regenerate the corpus file and exit')
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        with open(CORPUS_PATH, 'w') as fh:
+            json.dump(generate_corpus(), fh, indent=1, sort_keys=True)
+            fh.write('\n')
+        return 0
+
+    results = run(load_corpus(), repeat=args.repeat, only=args.only)
+    baseline = None
+
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+
+    regressions = report(results, baseline, args.threshold)
+
+    if args.save:
+        with open(args.save, 'w') as fh:
+            json.dump(results, fh, indent=1, sort_keys=True)
+
+    if regressions:
+        sys.stdout.write('\nRegressions over %.0f%%: %s\n' % (
+            args.threshold * 100, ', '.join(regressions)))
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from .sp_markdown import Markdown
+from .sp_markdown import Markdown, RenderContext, markdown
+from .extract import extract
 from .utils.quote import quotify
 
-__all__ = ['Markdown', 'quotify']
\ No newline at end of file
+__all__ = ['Markdown', 'RenderContext', 'markdown', 'extract', 'quotify']
@@ -4,9 +4,15 @@ from __future__ import unicode_literals
 
 import re
 import copy
+import time
+from functools import lru_cache
 
 import mistune
 
+from .providers import providers
+from .utils.cursor import cursor_matchers
+from .utils.dispatch import RuleDispatcher
+
 
 class BlockGrammar(mistune.BlockGrammar):
 
@@ -15,83 +21,37 @@ class BlockGrammar(mistune.BlockGrammar):
         r'(?:\n+|$)'
     )
 
-    # These used to be their own matching rule,
-    # but matching once instead of X times is way faster
-    sub_block_link = re.compile(
-        r'(?:'
-            # Try to get the video ID. Works for URLs of the form:
-            # * https://www.youtube.com/watch?v=Z0UISCEe52Y
-            # * http://youtu.be/afyK1HSFfgw
-            # * https://www.youtube.com/embed/vsF0K3Ou1v0
-            #
-            # Also works for timestamps:
-            # * https://www.youtube.com/watch?v=Z0UISCEe52Y&t=1m30s
-            # * https://www.youtube.com/watch?v=O1QQajfobPw&t=1h1m38s
-            # * https://www.youtube.com/watch?v=O1QQajfobPw&feature=youtu.be&t=3698
-            # * https://youtu.be/O1QQajfobPw?t=3698
-            # * https://youtu.be/O1QQajfobPw?t=1h1m38s
-            r'(?P<youtube_link>'
-                r'^https?://(?:www\.)?'
-                r'(?:youtube\.com/watch\?v='
-                r'|youtu\.be/'
-                r'|youtube\.com/embed/)'
-                r'(?P<youtube_id>[a-zA-Z0-9_\-]{11})'
-                r'(?:(?:&|\?)(?:'
-                    r'|(?:t=(?P<youtube_start_hours>[0-9]{1,2}h)?'
-                    r'(?P<youtube_start_minutes>[0-9]{1,4}m)?'
-                    r'(?P<youtube_start_seconds>[0-9]{1,5}s?)?)'
-                    r'|(?:[^&\s]+)'
-                r')){,10}'
-                r'(?:\n+|$)'
-            r')|'
-            # Try to get the video ID. Works for URLs of the form:
-            # * https://vimeo.com/11111111
-            # * https://www.vimeo.com/11111111
-            # * https://player.vimeo.com/video/11111111
-            # * https://vimeo.com/channels/11111111
-            # * https://vimeo.com/groups/name/videos/11111111
-            # * https://vimeo.com/album/2222222/video/11111111
-            # * https://vimeo.com/11111111?param=value
-            r'(?P<vimeo_link>'
-                r'^https?://(?:www\.|player\.)?'
-                r'vimeo\.com/'
-                r'(?:channels/'
-                r'|groups/[^/]+/videos/'
-                r'|album/(?:\d+)/video/'
-                r'|video/)?'
-                r'(?P<vimeo_id>\d+)'
-                r'(?:\?[^\s]+)?'
-                r'(?:\n+|$)'
-            r')|'
-            # Try to get the video ID. Works for URLs of the form:
-            # * https://gfycat.com/videoid
-            # * https://www.gfycat.com/videoid
-            # * http://gfycat.com/videoid
-            # * http://www.gfycat.com/videoid
-            r'(?P<gfycat_link>'
-                r'^https?://(?:www\.)?'
-                r'gfycat\.com/'
-                r'(?P<gfycat_id>\w+)'
-                r'(?:\?[^\s]+)?'
-                r'(?:\n+|$)'
-            r')|'
-            r'(?P<audio_link>'
-                r'^https?://[^\s]+\.(?:mp3|ogg|wav)'
-                r'(?:\?[^\s]+)?'
-                r'(?:\n+|$)'
-            r')|'
-            r'(?P<image_link>'
-                r'^https?://[^\s]+/(?P<image_name>[^\s]+)\.'
-                r'(?:png|jpg|jpeg|gif|bmp|tif|tiff)'
-                r'(?:\?[^\s]+)?'
-                r'(?:\n+|$)'
-            r')|'
-            r'(?P<video_link>'
-                r'^https?://[^\s]+\.(?:mov|mp4|webm|ogv)'
-                r'(?:\?[^\s]+)?'
-                r'(?:\n+|$)'
-            r')'
-        r')'
+    # Block links are classified by host (see ``providers``)
+    # and extension (see ``classify_link``), then the
+    # matching rule below is run to extract the data
+
+    audio_link = re.compile(
+        r'^https?://[^\s]+\.(?:mp3|ogg|wav)'
+        r'(?:\?[^\s]+)?'
+        r'(?:\n+|$)'
+    )
+
+    # The name can only end with a slash, otherwise
+    # the match would start at that slash instead
+    image_link = re.compile(
+        r'^https?://[^\s]+/(?P<image_name>[^\s/]+/?|/)\.'
+        r'(?:png|jpg|jpeg|gif|bmp|tif|tiff)'
+        r'(?:\?[^\s]+)?'
+        r'(?:\n+|$)'
+    )
+
+    video_link = re.compile(
+        r'^https?://[^\s]+\.(?:mov|mp4|webm|ogv)'
+        r'(?:\?[^\s]+)?'
+        r'(?:\n+|$)'
+    )
+
+    # Same as mistune's, but the label can't span a blank
+    # line (neither can CommonMark's), otherwise each "["
+    # starting a block scans up to the end of the text
+    def_links = re.compile(
+        r'^ *\[((?:[^^\]\n]|\n(?! *\n))+)\]: *'
+        r'<?([^\s>]+)>?(?: +["(]([^\n]+)[")])? *(?:\n+|$)'
     )
 
     # Capture polls:
@@ -107,59 +67,218 @@ class BlockGrammar(mistune.BlockGrammar):
         r'(?:\s+max=(?P<max>\d+))?'
         r'(?:\s+close=(?P<close>\d+)d)?'
         r'(?:\s+mode=(?P<mode>(default|secret)))?'
-        r'|(?P<invalid_params>[^\]]*))'
+        r'|(?P<invalid_params>[^\]\n]*))'
         r'\])\n'
-        r'((?:#\s*(?P<title>[^\n]+\n))?'
-        r'(?P<choices>(?:\d+\.\s*[^\n]+\n){2,})'
+        # Every line can be split in a single way,
+        # so a body without closing tag fails
+        # in linear time
+        r'((?:#[ \t]*(?P<title>[^\s][^\n]*\n))?'
+        r'(?P<choices>(?:\d+\.[^\n]+\n){2,})'
         r'|(?P<invalid_body>(?:[^\n]+\n)*))'
         r'(?:\[/poll\])'
     )
 
 
-class BlockLexer(mistune.BlockLexer):
+# Grammars are read-only, so a single
+# instance is shared by every lexer
+_grammar = BlockGrammar()
+
+_link_extensions = {
+    'mp3': 'audio_link',
+    'ogg': 'audio_link',
+    'wav': 'audio_link',
+    'png': 'image_link',
+    'jpg': 'image_link',
+    'jpeg': 'image_link',
+    'gif': 'image_link',
+    'bmp': 'image_link',
+    'tif': 'image_link',
+    'tiff': 'image_link',
+    'mov': 'video_link',
+    'mp4': 'video_link',
+    'webm': 'video_link',
+    'ogv': 'video_link',
+}
+
+# When more than one extension matches
+_media_links = ('audio_link', 'image_link', 'video_link')
+
+
+def _link_extension(link, end):
+    dot = link.rfind('.', max(0, end - 5), end)
+
+    if dot == -1:
+        return None
+
+    return _link_extensions.get(link[dot + 1:end])
+
+
+def _classify_link(link, revision=None):
+    scheme_end = link.find('://') + 3
+    host_end = link.find('/', scheme_end)
+
+    if host_end != -1:
+        for provider in providers.for_host(link[scheme_end:host_end]):
+            m = provider.match(link)
+
+            if m is not None:
+                return provider.name, m
+
+    # The extension goes either at the end or before
+    # a query, any "?" may be the start of the query
+    kinds = {_link_extension(link, len(link))}
+    end = link.find('?')
+
+    while end != -1 and end < len(link) - 1:
+        kinds.add(_link_extension(link, end))
+        end = link.find('?', end + 1)
+
+    for key in _media_links:
+        if key in kinds:
+            m = getattr(_grammar, key).match(link)
+
+            if m is not None:
+                return key, m
+
+    return 'block_link', None
+
+
+_classify_link_cached = lru_cache(maxsize=1024)(_classify_link)
+
+
+def classify_link(link):
+    """
+    Find out what a block link points to. Recently
+    classified links are cached, but long ones are not
+
+    :param link: a stripped URL, as matched by ``block_link``
+    :return: the provider or rule name (ie: ``'youtube_link'``)
+    and its match, or ``('block_link', None)`` if nothing matched
+    """
+    if len(link) > 512:
+        return _classify_link(link)
+
+    # Registering a provider invalidates the cached links
+    return _classify_link_cached(link, providers.revision)
+
+
+class BlockLexer(RuleDispatcher, mistune.BlockLexer):
 
     default_rules = copy.copy(mistune.BlockLexer.default_rules)
     default_rules.insert(0, 'block_link')
     default_rules.insert(0, 'poll')
 
-    _sub_block_links = (
-        'audio_link',
-        'image_link',
-        'video_link',
-        'youtube_link',
-        'vimeo_link',
-        'gfycat_link'
-    )
+    # The chars each rule can start matching at. Rules
+    # not listed here are tried at any char. Ours don't
+    # allow leading spaces, unlike most mistune rules
+    first_chars = {
+        'poll': '[',
+        'block_link': 'h',
+    }
 
-    def __init__(self, rules=None, **kwargs):
+    def __init__(self, rules=None, stats=None, **kwargs):
         if rules is None:
-            rules = BlockGrammar()
+            rules = _grammar
 
         super(BlockLexer, self).__init__(rules=rules, **kwargs)
 
+        self.stats = stats
         self.polls = {
             'polls': [],
             'choices': []
         }
 
+    # Override
+    def parse(self, text, rules=None):
+        text = text.rstrip('\n')
+
+        if not rules:
+            rules = self.default_rules
+
+        buckets, default = self.dispatch_table(rules)
+        pos = 0
+        size = len(text)
+
+        # Matching at a position instead of slicing
+        # the rest of the text after every block
+        while pos < size:
+            pos = self.parse_rule(
+                text, buckets.get(text[pos], default), pos).end()
+
+        return self.tokens
+
+    def parse_segments(self, text):
+        """
+        Lex the top level blocks, same as :py:meth:`parse`.
+
+        :return: a list of ``(source, tokens)``, one per top
+        level match, ``source`` being the matched text
+        """
+        text = text.rstrip('\n')
+        segments = []
+        buckets, default = self.dispatch_table(self.default_rules)
+
+        pos = 0
+        size = len(text)
+
+        while pos < size:
+            start = len(self.tokens)
+            m = self.parse_rule(text, buckets.get(text[pos], default), pos)
+            segments.append((m.group(0), self.tokens[start:]))
+            pos = m.end()
+
+        return segments
+
+    def parse_rule(self, text, rules, pos=0):
+        """
+        Parse the first matching rule at ``pos``
+
+        :return: the match
+        """
+        if self.stats is not None:
+            return self._parse_rule_stats(text, rules, pos)
+
+        for key in rules:
+            m = cursor_matchers[getattr(self.rules, key)](text, pos)
+
+            if m is not None:
+                getattr(self, 'parse_%s' % key)(m)
+                return m
+
+        raise RuntimeError('Infinite loop at: %s' % text[pos:])
+
+    def _parse_rule_stats(self, text, rules, pos):
+        timer = time.perf_counter
+
+        for key in rules:
+            start = timer()
+            m = cursor_matchers[getattr(self.rules, key)](text, pos)
+            matched = timer()
+
+            if m is None:
+                self.stats.record('block', key, False, matched - start)
+                continue
+
+            getattr(self, 'parse_%s' % key)(m)
+            self.stats.record(
+                'block', key, True, matched - start, timer() - matched)
+            return m
+
+        raise RuntimeError('Infinite loop at: %s' % text[pos:])
+
     def parse_block_link(self, m):
         link = m.group(0).strip()
-        sub_match = BlockGrammar.sub_block_link.match(link)
+        key, sub_match = classify_link(link)
 
-        if sub_match is not None:
-            groups = sub_match.groupdict()
-        else:
-            groups = {}
-
-        for sbl in self._sub_block_links:
-            if groups.get(sbl, None) is not None:
-                getattr(self, 'parse_%s' % sbl)(sub_match)
-                break
-        else:  # no-break
+        if sub_match is None:
             self.tokens.append({
                 'type': 'block_link',
                 'link': link
             })
+        elif key in providers:
+            self.parse_embed(providers[key], sub_match, link)
+        else:
+            getattr(self, 'parse_%s' % key)(sub_match)
 
     def parse_audio_link(self, m):
         self.tokens.append({
@@ -183,25 +302,20 @@ class BlockLexer(mistune.BlockLexer):
             'link': m.group(0).strip()
         })
 
-    def parse_youtube_link(self, m):
-        self.tokens.append({
-            'type': 'youtube_link',
-            'video_id': m.group("youtube_id"),
-            'start_hours': m.group("youtube_start_hours"),
-            'start_minutes': m.group("youtube_start_minutes"),
-            'start_seconds': m.group("youtube_start_seconds"),
-        })
-
-    def parse_vimeo_link(self, m):
-        self.tokens.append({
-            'type': 'vimeo_link',
-            'video_id': m.group("vimeo_id")
-        })
+    def parse_embed(self, provider, m, link):
+        # The link is kept in case the provider
+        # is gone by the time the token is rendered
+        token = provider.parse(m)
+        token['type'] = 'embed'
+        token['provider'] = provider.name
+        token['link'] = link
+        self.tokens.append(token)
 
-    def parse_gfycat_link(self, m):
+    # Polls are not supported, show them as typed
+    def parse_poll(self, m):
         self.tokens.append({
-            'type': 'gfycat_link',
-            'video_id': m.group("gfycat_id")
+            'type': 'paragraph',
+            'text': m.group(0)
         })
 
     # def parse_poll(self, m):
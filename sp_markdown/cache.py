@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import sys
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from .utils.emoji import emojis
+from .utils.emoji_unicode import unicode_emojis
+
+_KEY_PREFIX = 'sp_markdown:'
+_from_settings = object()
+
+
+@lru_cache(maxsize=None)
+def emoji_version():
+    """
+    Digest of the emoji set. Changing the
+    set changes the rendered emojis
+    """
+    data = '\n'.join(
+        sorted(emojis) +
+        sorted('%s %s' % item for item in unicode_emojis.items()))
+    data = data.encode('utf-8')
+    return hashlib.sha1(data).hexdigest()[:8]
+
+
+class RenderCache(object):
+    """
+    Rendered HTML cache. Entries live in a process-local
+    LRU bounded by their size in bytes and, if an alias
+    is given, in that django cache as a second tier
+
+    :param max_size: LRU size in bytes,
+    defaults to ``ST_MARKDOWN_CACHE_MAX_SIZE``
+    :param alias: django cache alias for the second tier,
+    defaults to ``ST_MARKDOWN_CACHE_ALIAS``. ``None`` (or
+    ``False``) means there's no second tier
+    :param timeout: second tier timeout,
+    defaults to ``ST_MARKDOWN_CACHE_TIMEOUT``
+    """
+
+    def __init__(self, max_size=None, alias=_from_settings, timeout=None):
+        if max_size is None:
+            max_size = getattr(
+                settings, 'ST_MARKDOWN_CACHE_MAX_SIZE', 8 * 1024 * 1024)
+
+        if alias is _from_settings:
+            alias = getattr(settings, 'ST_MARKDOWN_CACHE_ALIAS', None)
+
+        if timeout is None:
+            timeout = getattr(
+                settings, 'ST_MARKDOWN_CACHE_TIMEOUT', DEFAULT_TIMEOUT)
+
+        self.max_size = max_size
+        self.alias = alias or None
+        self.timeout = timeout
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def make_key(self, text, options):
+        data = '%r\n%s' % (options, text)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                html, _size = self._entries[key]
+            except KeyError:
+                pass
+            else:
+                self._entries.move_to_end(key)
+                return html
+
+        if self.alias is None:
+            return None
+
+        html = caches[self.alias].get(_KEY_PREFIX + key)
+
+        if html is not None:
+            self._set_local(key, html)
+
+        return html
+
+    def set(self, key, html):
+        self._set_local(key, html)
+
+        if self.alias is not None:
+            caches[self.alias].set(
+                _KEY_PREFIX + key, html, timeout=self.timeout)
+
+    def get_many(self, keys):
+        """
+        Same as :py:meth:`get`, with a single
+        round trip to the second tier
+
+        :return: dict of the found keys to their HTML
+        """
+        found = {}
+
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = entry[0]
+
+        missing = [key for key in keys if key not in found]
+
+        if self.alias is None or not missing:
+            return found
+
+        htmls = caches[self.alias].get_many(
+            [_KEY_PREFIX + key for key in missing])
+
+        for key in missing:
+            html = htmls.get(_KEY_PREFIX + key)
+
+            if html is not None:
+                self._set_local(key, html)
+                found[key] = html
+
+        return found
+
+    def set_many(self, htmls):
+        """
+        Same as :py:meth:`set`, with a single
+        round trip to the second tier
+
+        :param htmls: dict of key to HTML
+        """
+        for key, html in htmls.items():
+            self._set_local(key, html)
+
+        if self.alias is not None and htmls:
+            caches[self.alias].set_many(
+                {_KEY_PREFIX + key: html for key, html in htmls.items()},
+                timeout=self.timeout)
+
+    def _set_local(self, key, html):
+        size = sys.getsizeof(key) + sys.getsizeof(html)
+
+        if size > self.max_size:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+
+            if old is not None:
+                self.size -= old[1]
+
+            self._entries[key] = (html, size)
+            self.size += size
+
+            while self.size > self.max_size:
+                _key, (_html, old_size) = self._entries.popitem(last=False)
+                self.size -= old_size
+
+    def __getstate__(self):
+        # Workers of a process pool get an
+        # empty LRU and share the second tier
+        state = self.__dict__.copy()
+        state['size'] = 0
+        state['_entries'] = OrderedDict()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import re
+
+from django.conf import settings
+
+from .sp_markdown import RenderContext
+from .inline import InlineLexer
+from .utils.emoji_unicode import first_chars
+
+_block_links = frozenset((
+    'block_link',
+    'audio_link',
+    'image_link',
+    'video_link'))
+
+# Mentions, emojis, links and images can't
+# be found in texts without any of these
+_findable = re.compile(r'[@:\[<%s]' % first_chars)
+
+
+def _nothing(*args, **kwargs):
+    return ''
+
+
+class ExtractRenderer(object):
+    """
+    Renderer that outputs nothing and
+    collects what the lexers find instead
+    """
+
+    def __init__(self):
+        self.options = {}
+        self.links = []
+        self.images = []
+        self.block_links = []
+        self.emojis = []
+
+    def __getattr__(self, name):
+        if name in _block_links:
+            return lambda **kwargs: self._block_link(name, kwargs)
+
+        return _nothing
+
+    def _block_link(self, kind, data):
+        data['type'] = kind
+        self.block_links.append(data)
+        return ''
+
+    def embed(self, provider, **data):
+        data['type'] = provider
+        self.block_links.append(data)
+        return ''
+
+    def autolink(self, link, is_email=False):
+        if is_email:
+            link = 'mailto:%s' % link
+
+        self.links.append(link)
+        return ''
+
+    def link(self, link, title, text):
+        self.links.append(link)
+        return ''
+
+    def image(self, src, title, text):
+        self.images.append(src)
+        return ''
+
+    def emoji_fragment(self, name_class, name_raw):
+        self.emojis.append(name_raw)
+        return ''
+
+
+class ExtractLexer(InlineLexer):
+    """
+    Inline lexer that skips texts where
+    there's nothing to be extracted
+    """
+
+    # Override
+    def output(self, text, rules=None):
+        if _findable.search(text) is None:
+            return ''
+
+        return super(ExtractLexer, self).output(text, rules)
+
+
+class ExtractContext(RenderContext):
+
+    inline_class = ExtractLexer
+
+
+def extract(text):
+    """
+    Lex a text without rendering it and collect the
+    mentioned usernames (capped at ``ST_MENTIONS_PER_COMMENT``),
+    the links, images, block link embeds and emojis,
+    in order of appearance. Usernames are not looked up
+
+    :return: dict of ``mentions``, ``links``,
+    ``images``, ``block_links`` and ``emojis``
+    """
+    renderer = ExtractRenderer()
+    context = ExtractContext(renderer)
+    context.parse(text)
+    return {
+        'mentions': list(context.inline.mentions)[:settings.ST_MENTIONS_PER_COMMENT],
+        'links': renderer.links,
+        'images': renderer.images,
+        'block_links': renderer.block_links,
+        'emojis': renderer.emojis}
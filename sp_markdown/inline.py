@@ -3,24 +3,26 @@
 from __future__ import unicode_literals
 import re
 import copy
+import time
 
 
 import mistune
 
+from .mentions import PLACEHOLDER
 from .utils.emoji import emojis
+from .utils.emoji_unicode import unicode_emojis, first_chars
+from .utils.scanner import EmojiScanner, UnicodeEmojiScanner, TextScanner
+from .utils.cursor import cursor_matchers
+from .utils.dispatch import RuleDispatcher
 
 _linebreak = re.compile(r'^ *\n(?!\s*$)')
-_text = re.compile(
-    r'^[\s\S]+?(?=[\\<!\[_*`:@~]|https?://| *\n|$)'
-)
+_text = TextScanner(r'\\<!\[_*`:@~' + first_chars)
 
 
 class InlineGrammar(mistune.InlineGrammar):
 
-    # todo: match unicode emojis
-    emoji = re.compile(
-        r'^:(?P<emoji>[A-Za-z0-9_\-\+]+?):'
-    )
+    emoji = EmojiScanner(emojis)
+    unicode_emoji = UnicodeEmojiScanner(unicode_emojis, first_chars)
 
     mention = re.compile(
         r'^@(?P<username>[\w.@+-]+)',
@@ -29,36 +31,145 @@ class InlineGrammar(mistune.InlineGrammar):
 
     # Override
     def hard_wrap(self):
-        # Adds ":" and "@" as an invalid text character, so we can match emojis and mentions.
+        # Adds ":", "@" and the first char of unicode emojis as
+        # an invalid text character, so we can match emojis and mentions.
         self.linebreak = _linebreak
         self.text = _text
 
 
-class InlineLexer(mistune.InlineLexer):
+# Shared by all lexers. Calling hard_wrap()
+# again (mistune does) is harmless
+_grammar = InlineGrammar()
+_grammar.hard_wrap()
+
+
+class InlineLexer(RuleDispatcher, mistune.InlineLexer):
 
     default_rules = copy.copy(mistune.InlineLexer.default_rules)
     default_rules.insert(2, 'emoji')
     default_rules.insert(2, 'mention')
-
-    def __init__(self, renderer, rules=None, **kwargs):
-        rules = InlineGrammar()
-        rules.hard_wrap()
+    default_rules.insert(default_rules.index('text'), 'unicode_emoji')
+
+    # The chars each rule can start matching at. Rules
+    # not listed here (ie: text) are tried at any char.
+    # Changing a rule's pattern may require updating this
+    first_chars = {
+        'escape': '\\',
+        'inline_html': '<',
+        'autolink': '<',
+        'url': 'h',
+        'footnote': '[',
+        'link': '![',
+        'reflink': '![',
+        'nolink': '![',
+        'double_emphasis': '_*',
+        'emphasis': '_*',
+        'code': '`',
+        'linebreak': ' \n',
+        'strikethrough': '~',
+        'emoji': ':',
+        'mention': '@',
+    }
+
+    def __init__(self, renderer, rules=None, stats=None, **kwargs):
+        if rules is None:
+            rules = _grammar
 
         super(InlineLexer, self).__init__(renderer, rules, **kwargs)
 
+        self.stats = stats
         self.mentions = {}
-        self._mention_count = 0
+
+    # Override
+    def output(self, text, rules=None):
+        text = text.rstrip('\n')
+
+        if not rules:
+            rules = list(self.default_rules)
+
+        if self._in_footnote and 'footnote' in rules:
+            rules.remove('footnote')
+
+        buckets, default = self.dispatch_table(rules)
+        output = [self.renderer.placeholder()]
+        pos = 0
+        size = len(text)
+
+        while pos < size:
+            m, out = self.output_rule(
+                text, buckets.get(text[pos], default), pos)
+            output.append(out)
+            pos = m.end()
+
+        return ''.join(output)
+
+    def output_rule(self, text, rules, pos=0):
+        """
+        Render the first matching rule at ``pos``
+
+        :return: the match and its output
+        """
+        if self.stats is not None:
+            return self._output_rule_stats(text, rules, pos)
+
+        for key in rules:
+            m = cursor_matchers[getattr(self.rules, key)](text, pos)
+
+            if m is None:
+                continue
+
+            self.line_match = m
+            out = getattr(self, 'output_%s' % key)(m)
+
+            if out is not None:
+                return m, out
+
+        raise RuntimeError('Infinite loop at: %s' % text[pos:])
+
+    def _output_rule_stats(self, text, rules, pos):
+        timer = time.perf_counter
+
+        for key in rules:
+            start = timer()
+            m = cursor_matchers[getattr(self.rules, key)](text, pos)
+            matched = timer()
+
+            if m is None:
+                self.stats.record('inline', key, False, matched - start)
+                continue
+
+            self.line_match = m
+            out = getattr(self, 'output_%s' % key)(m)
+            self.stats.record(
+                'inline', key, out is not None, matched - start, timer() - matched)
+
+            if out is not None:
+                return m, out
+
+        raise RuntimeError('Infinite loop at: %s' % text[pos:])
 
     def output_emoji(self, m):
         emoji = m.group('emoji')
+        name_class = self.rules.emoji.name_classes.get(emoji)
 
-        if emoji not in emojis:
+        if name_class is None:
             return m.group(0)
 
-        name_raw = emoji
-        name_class = emoji.replace('_', '-').replace('+', 'plus')
-        return self.renderer.emoji(name_class=name_class, name_raw=name_raw)
-    
-    # remove def output_mention
-    # def output_mention(self, m):
+        return self.renderer.emoji_fragment(
+            name_class=name_class, name_raw=emoji)
+
+    def output_unicode_emoji(self, m):
+        emoji = m.group('emoji')
+        return self.renderer.emoji_fragment(
+            name_class=self.rules.emoji.name_classes[emoji],
+            name_raw=emoji)
+
+    def output_mention(self, m):
+        # Usernames are resolved (and capped per text) in
+        # bulk once the text is rendered, so the HTML of a
+        # block doesn't depend on the blocks before it.
+        # See mentions.render_mentions
+        username = m.group('username')
+        self.mentions[username] = None
+        return PLACEHOLDER % username
    
\ No newline at end of file
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import re
+import time
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, post_delete
+
+# Mentions are rendered as placeholders while lexing and
+# resolved once the whole text (or batch of texts) is
+# rendered. NUL chars never make it into the lexers
+PLACEHOLDER = '\x00@%s\x00'
+
+_placeholder = re.compile('\x00@(?P<username>[^\x00]+)\x00')
+_missing = object()
+_connected = False
+
+
+class UserURLCache(object):
+    """
+    Bounded LRU of username to profile URL, ``None``
+    for usernames that don't exist. Entries are
+    dropped when their user gets saved or deleted,
+    which only other processes won't notice, so
+    entries also expire after a while
+
+    :param max_size: max number of entries,
+    defaults to ``ST_MARKDOWN_MENTIONS_CACHE_SIZE``
+    :param timeout: seconds the entries last,
+    defaults to ``ST_MARKDOWN_MENTIONS_CACHE_TIMEOUT``
+    """
+
+    def __init__(self, max_size=None, timeout=None):
+        self._max_size = max_size
+        self._timeout = timeout
+        self._entries = OrderedDict()
+        self._usernames = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self):
+        # Settings may not be configured at import time
+        if self._max_size is None:
+            return getattr(settings, 'ST_MARKDOWN_MENTIONS_CACHE_SIZE', 10000)
+
+        return self._max_size
+
+    @property
+    def timeout(self):
+        if self._timeout is None:
+            return getattr(settings, 'ST_MARKDOWN_MENTIONS_CACHE_TIMEOUT', 60 * 5)
+
+        return self._timeout
+
+    def get_many(self, usernames):
+        """
+        :return: dict of the cached usernames to their URL
+        """
+        found = {}
+        now = time.monotonic()
+
+        with self._lock:
+            for username in usernames:
+                entry = self._entries.get(username, _missing)
+
+                if entry is _missing:
+                    continue
+
+                if entry[2] <= now:
+                    self._pop(username)
+                    continue
+
+                self._entries.move_to_end(username)
+                found[username] = entry[1]
+
+        return found
+
+    def set_many(self, users):
+        """
+        :param users: dict of username to
+        ``(pk, url)``, or ``None`` if there's no such user
+        """
+        max_size = self.max_size
+        expires = time.monotonic() + self.timeout
+
+        with self._lock:
+            for username, user in users.items():
+                pk, url = user or (None, None)
+                self._entries[username] = (pk, url, expires)
+                self._entries.move_to_end(username)
+
+                if pk is not None:
+                    self._usernames[pk] = username
+
+            while len(self._entries) > max_size:
+                _username, (pk, _url, _expires) = self._entries.popitem(last=False)
+                self._usernames.pop(pk, None)
+
+    def _pop(self, username):
+        pk = self._entries.pop(username)[0]
+
+        if self._usernames.get(pk) == username:
+            del self._usernames[pk]
+
+    def invalidate(self, pk, username):
+        with self._lock:
+            # The user may have been renamed
+            old = self._usernames.pop(pk, None)
+            self._entries.pop(old, None)
+            self._entries.pop(username, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._usernames.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+user_urls = UserURLCache()
+
+
+def _invalidate(sender, instance, **kwargs):
+    user_urls.invalidate(instance.pk, instance.get_username())
+
+
+def _connect():
+    # There's nothing to invalidate until
+    # something gets cached, so connect late
+    global _connected
+
+    if _connected:
+        return
+
+    _connected = True
+
+    for signal in (post_save, post_delete):
+        signal.connect(
+            _invalidate,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid='sp_markdown.mentions')
+
+
+def resolve(usernames):
+    """
+    Get the profile URL of each username. The
+    ones that are not cached take a single query
+
+    :return: dict of username to URL, for
+    the usernames of existing users
+    """
+    _connect()
+    urls = user_urls.get_many(usernames)
+    missing = [u for u in usernames if u not in urls]
+
+    if missing:
+        User = get_user_model()
+        users = dict.fromkeys(missing)
+        lookup = {'%s__in' % User.USERNAME_FIELD: missing}
+
+        for user in User.objects.filter(**lookup):
+            users[user.get_username()] = (user.pk, user.get_absolute_url())
+
+        user_urls.set_many(users)
+        urls.update(
+            (username, user[1])
+            for username, user in users.items()
+            if user is not None)
+
+    return {
+        username: url
+        for username, url in urls.items()
+        if url is not None}
+
+
+def _cap(html, mentioned, limit):
+    # The first ``limit`` usernames
+    # of a text are the mentioned ones
+    for username in _placeholder.findall(html):
+        if len(mentioned) >= limit:
+            break
+
+        if username not in mentioned:
+            mentioned.append(username)
+
+    return mentioned
+
+
+def render_mentions(htmls, renderer, mentioned=None):
+    """
+    Replace the mention placeholders of a list of rendered
+    texts, resolving all of the usernames at once. Only the
+    first ``ST_MENTIONS_PER_COMMENT`` usernames of each
+    text are linked
+
+    :param mentioned: if given, the HTMLs are chunks of a
+    single text and this is the list of the usernames
+    mentioned in the chunks before. It gets updated
+    :return: the list of final HTMLs
+    """
+    limit = settings.ST_MENTIONS_PER_COMMENT
+    allowed = []
+
+    for html in htmls:
+        if '\x00' not in html:
+            allowed.append(None)
+            continue
+
+        if mentioned is None:
+            allowed.append(set(_cap(html, [], limit)))
+        else:
+            allowed.append(set(_cap(html, mentioned, limit)))
+
+    if all(a is None for a in allowed):
+        return htmls
+
+    usernames = set().union(*(a for a in allowed if a is not None))
+    urls = resolve(sorted(usernames)) if usernames else {}
+
+    def render(html, allowed):
+        def mention(m):
+            username = m.group('username')
+            url = urls.get(username) if username in allowed else None
+
+            if url is None:
+                return '@%s' % username
+
+            return renderer.mention(username=username, url=url)
+
+        return _placeholder.sub(mention, html)
+
+    return [
+        render(html, a) if '\x00' in html else html
+        for html, a in zip(htmls, allowed)]
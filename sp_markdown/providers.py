@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class Provider(object):
+    """
+    Embeds the links of a site. Links are only
+    matched against the providers registered
+    for their host, so adding a provider
+    doesn't make other links slower
+
+    :cvar name: unique name, ie: ``'youtube_link'``
+    :cvar hosts: hosts the links can have
+    :cvar pattern: regex matching a whole link
+    """
+
+    name = None
+    hosts = ()
+    pattern = None
+
+    def match(self, link):
+        return self.pattern.match(link)
+
+    def parse(self, m):
+        """
+        Extract the data to embed, ie: the video ID
+
+        :param m: the match of ``pattern``
+        :return: a dict of keyword args for :py:meth:`render`
+        """
+        raise NotImplementedError
+
+    def embed_url(self, **data):
+        """
+        :return: the URL of the player
+        """
+        raise NotImplementedError
+
+    def thumbnail_url(self, **data):
+        """
+        :return: the URL of a preview image, if any
+        """
+        return None
+
+    def render(self, renderer, **data):
+        """
+        Render the player, or a facade of it when the
+        renderer has the ``facades`` option on, so the
+        player only loads once it's clicked
+
+        :param renderer: the renderer, for its options
+        :return: the HTML of the embed
+        """
+        if renderer.options.get('facades'):
+            return renderer.embed_facade(
+                provider=self.name,
+                src=self.embed_url(**data),
+                thumbnail=self.thumbnail_url(**data))
+
+        return self.render_player(renderer, **data)
+
+    def render_player(self, renderer, **data):
+        return (
+            '<span class="video"><iframe '
+            'src="{src}" '
+            'allowfullscreen></iframe></span>\n'
+            .format(src=self.embed_url(**data)))
+
+
+class YouTubeProvider(Provider):
+
+    name = 'youtube_link'
+    hosts = (
+        'youtube.com',
+        'www.youtube.com',
+        'youtu.be',
+        'www.youtu.be')
+
+    # Try to get the video ID. Works for URLs of the form:
+    # * https://www.youtube.com/watch?v=Z0UISCEe52Y
+    # * http://youtu.be/afyK1HSFfgw
+    # * https://www.youtube.com/embed/vsF0K3Ou1v0
+    #
+    # Also works for timestamps:
+    # * https://www.youtube.com/watch?v=Z0UISCEe52Y&t=1m30s
+    # * https://www.youtube.com/watch?v=O1QQajfobPw&t=1h1m38s
+    # * https://www.youtube.com/watch?v=O1QQajfobPw&feature=youtu.be&t=3698
+    # * https://youtu.be/O1QQajfobPw?t=3698
+    # * https://youtu.be/O1QQajfobPw?t=1h1m38s
+    #
+    # The query is captured whole and the timestamp is
+    # looked up afterwards, see ``timestamp``.
+    # Matching the params here used to backtrack a lot
+    pattern = re.compile(
+        r'^https?://(?:www\.)?'
+        r'(?:youtube\.com/watch\?v='
+        r'|youtu\.be/'
+        r'|youtube\.com/embed/)'
+        r'(?P<youtube_id>[a-zA-Z0-9_\-]{11})'
+        r'(?P<youtube_query>[&?][^\s]*)?'
+        r'(?:\n+|$)'
+    )
+
+    # Timestamp param of the query
+    timestamp = re.compile(
+        r'[&?]t=(?P<hours>[0-9]{1,2}h)?'
+        r'(?P<minutes>[0-9]{1,4}m)?'
+        r'(?P<seconds>[0-9]{1,5}s?)?'
+        r'(?=[&?]|$)'
+    )
+
+    def parse(self, m):
+        timestamp = {}
+
+        # The last one wins
+        for t in self.timestamp.finditer(m.group('youtube_query') or ''):
+            timestamp = t.groupdict()
+
+        return {
+            'video_id': m.group('youtube_id'),
+            'start_hours': timestamp.get('hours'),
+            'start_minutes': timestamp.get('minutes'),
+            'start_seconds': timestamp.get('seconds'),
+        }
+
+    def embed_url(
+            self,
+            video_id,
+            start_hours=None,
+            start_minutes=None,
+            start_seconds=None):
+        timestamp = 0
+
+        if start_hours:
+            timestamp += int(start_hours.replace('h', '')) * 60 * 60
+
+        if start_minutes:
+            timestamp += int(start_minutes.replace('m', '')) * 60
+
+        if start_seconds:
+            timestamp += int(start_seconds.replace('s', ''))
+
+        if timestamp:
+            timestamp = '&start=%s' % timestamp
+        else:
+            timestamp = ''
+
+        return (
+            'https://www.youtube.com/embed/{video_id}?html5=1{timestamp}'
+            .format(
+                video_id=video_id,
+                timestamp=timestamp))
+
+    def thumbnail_url(self, video_id, **data):
+        return 'https://i.ytimg.com/vi/%s/hqdefault.jpg' % video_id
+
+
+class VimeoProvider(Provider):
+
+    name = 'vimeo_link'
+    hosts = (
+        'vimeo.com',
+        'www.vimeo.com',
+        'player.vimeo.com')
+
+    # Try to get the video ID. Works for URLs of the form:
+    # * https://vimeo.com/11111111
+    # * https://www.vimeo.com/11111111
+    # * https://player.vimeo.com/video/11111111
+    # * https://vimeo.com/channels/11111111
+    # * https://vimeo.com/groups/name/videos/11111111
+    # * https://vimeo.com/album/2222222/video/11111111
+    # * https://vimeo.com/11111111?param=value
+    pattern = re.compile(
+        r'^https?://(?:www\.|player\.)?'
+        r'vimeo\.com/'
+        r'(?:channels/'
+        r'|groups/[^/]+/videos/'
+        r'|album/(?:\d+)/video/'
+        r'|video/)?'
+        r'(?P<vimeo_id>\d+)'
+        r'(?:\?[^\s]+)?'
+        r'(?:\n+|$)'
+    )
+
+    def parse(self, m):
+        return {'video_id': m.group('vimeo_id')}
+
+    # Vimeo thumbnails can only be found through its API
+    def embed_url(self, video_id):
+        return 'https://player.vimeo.com/video/%s' % video_id
+
+
+class GfycatProvider(Provider):
+
+    name = 'gfycat_link'
+    hosts = (
+        'gfycat.com',
+        'www.gfycat.com')
+
+    # Try to get the video ID. Works for URLs of the form:
+    # * https://gfycat.com/videoid
+    # * https://www.gfycat.com/videoid
+    # * http://gfycat.com/videoid
+    # * http://www.gfycat.com/videoid
+    pattern = re.compile(
+        r'^https?://(?:www\.)?'
+        r'gfycat\.com/'
+        r'(?P<gfycat_id>\w+)'
+        r'(?:\?[^\s]+)?'
+        r'(?:\n+|$)'
+    )
+
+    def parse(self, m):
+        return {'video_id': m.group('gfycat_id')}
+
+    def embed_url(self, video_id):
+        return 'https://gfycat.com/ifr/%s' % video_id
+
+    def thumbnail_url(self, video_id):
+        return 'https://thumbs.gfycat.com/%s-mobile.jpg' % video_id
+
+    # Override
+    def render_player(self, renderer, video_id):
+        return (
+            '<span class="video"><iframe src="{src}" '
+            'frameborder="0" scrolling="no" allowfullscreen></iframe></span>\n'
+            .format(src=self.embed_url(video_id)))
+
+
+class ProviderRegistry(object):
+    """
+    Embed providers by name and by host. Changing the
+    registry bumps its ``revision``, so whatever was
+    computed out of it can be invalidated
+    """
+
+    def __init__(self, providers=()):
+        self._providers = OrderedDict()
+        self._hosts = {}
+        self._lock = threading.Lock()
+        self._version = None
+        self.revision = 0
+
+        for provider in providers:
+            self.register(provider)
+
+    def register(self, provider):
+        """
+        Add a provider, replacing the one with the same name.
+        Providers of the same host are tried in order
+
+        :return: the provider
+        """
+        with self._lock:
+            self._providers.pop(provider.name, None)
+            self._providers[provider.name] = provider
+            self._rebuild()
+
+        return provider
+
+    def unregister(self, name):
+        with self._lock:
+            del self._providers[name]
+            self._rebuild()
+
+    def _rebuild(self):
+        hosts = {}
+
+        for provider in self._providers.values():
+            for host in provider.hosts:
+                hosts[host] = hosts.get(host, ()) + (provider,)
+
+        self._hosts = hosts
+        self._version = None
+        self.revision += 1
+
+    def for_host(self, host):
+        """
+        :return: tuple of the providers of a host
+        """
+        return self._hosts.get(host, ())
+
+    def version(self):
+        """
+        Digest of the registered providers. Changing
+        them changes the rendered embeds
+        """
+        if self._version is None:
+            data = '\n'.join(
+                '%s %s.%s' % (name, type(p).__module__, type(p).__name__)
+                for name, p in self._providers.items())
+            self._version = hashlib.sha1(data.encode('utf-8')).hexdigest()[:8]
+
+        return self._version
+
+    def __getitem__(self, name):
+        return self._providers[name]
+
+    def __contains__(self, name):
+        return name in self._providers
+
+    def __iter__(self):
+        return iter(list(self._providers.values()))
+
+    def __len__(self):
+        return len(self._providers)
+
+
+providers = ProviderRegistry((
+    YouTubeProvider(),
+    VimeoProvider(),
+    GfycatProvider()))
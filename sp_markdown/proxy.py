@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import hmac
+import hashlib
+import binascii
+from functools import lru_cache
+
+from django.conf import settings
+
+
+def _proxy_url(base_url, key, url):
+    data = url.encode('utf-8')
+    digest = hmac.new(key.encode('utf-8'), data, hashlib.sha1).hexdigest()
+    return '%s/%s/%s' % (
+        base_url.rstrip('/'),
+        digest,
+        binascii.hexlify(data).decode('ascii'))
+
+
+# The same images show up in
+# a lot of comments and pages
+_proxy_url_cached = lru_cache(maxsize=4096)(_proxy_url)
+
+
+def proxy_url(url):
+    """
+    Rewrite an image URL to go through a camo-style proxy
+    (``ST_IMAGE_PROXY_URL``), signed with ``ST_IMAGE_PROXY_KEY``.
+    Relative URLs and URLs of the proxy itself are left
+    as they are, so is everything when there's no proxy.
+    Protocol-relative URLs are proxied as ``https``
+
+    :param url: an unescaped URL
+    :return: ``<proxy>/<hex hmac-sha1>/<hex url>``
+    """
+    base_url = getattr(settings, 'ST_IMAGE_PROXY_URL', None)
+    key = getattr(settings, 'ST_IMAGE_PROXY_KEY', None)
+
+    if not base_url or not key:
+        return url
+
+    # Protocol-relative URLs point to other hosts, same
+    # as absolute ones. Browsers take a backslash for "/" there
+    if url.startswith(('//', '/\\')):
+        url = 'https://%s' % url[2:]
+
+    if not url.startswith(('http://', 'https://')):
+        return url
+
+    # The trailing slash prevents matching other
+    # hosts, ie: ``https://proxy.com.evil.net``
+    if url.startswith(base_url.rstrip('/') + '/'):
+        return url
+
+    if len(url) > 512:
+        return _proxy_url(base_url, key, url)
+
+    return _proxy_url_cached(base_url, key, url)
+
+
+def proxy_version():
+    """
+    Digest of the proxy settings. Changing
+    them changes the rendered images
+    """
+    data = '%s\n%s' % (
+        getattr(settings, 'ST_IMAGE_PROXY_URL', None),
+        getattr(settings, 'ST_IMAGE_PROXY_KEY', None))
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()[:8]
@@ -2,11 +2,22 @@
 
 from __future__ import unicode_literals
 
+import threading
+from types import MappingProxyType
+
 import mistune
 
 from django.conf import settings
 from django.utils.html import escape
 
+from .providers import providers
+from .proxy import proxy_url
+from .utils.emoji import emojis
+from .utils.scanner import EmojiScanner
+
+_emoji_fragments = {}
+_emoji_fragments_lock = threading.Lock()
+
 
 def sanitize_url(url):
     url = escape(url)  # & -> &amp; ...
@@ -61,7 +72,7 @@ class Renderer(mistune.Renderer):
 
     # Override
     def image(self, src, title, text):
-        src = sanitize_url(src)
+        src = self.image_src(src)
         text = escape(text)
 
         if title:
@@ -70,11 +81,28 @@ class Renderer(mistune.Renderer):
         else:
             html = '<img src="%s" alt="%s"' % (src, text)
 
+        if self.options.get('image_proxy'):
+            html = '%s loading="lazy" decoding="async"' % html
+
         if self.options.get('use_xhtml'):
             return '%s />' % html
 
         return '%s>' % html
 
+    def image_src(self, src):
+        """
+        Sanitize an image URL, and rewrite it to go through
+        the image proxy if the ``image_proxy`` option is on
+
+        :return: the escaped URL
+        """
+        url = sanitize_url(src)
+
+        if not url or not self.options.get('image_proxy'):
+            return url
+
+        return sanitize_url(proxy_url(src))
+
     def emoji(self, name_class, name_raw):
         return (
             '<i class="tw tw-{name_class}" '
@@ -83,6 +111,39 @@ class Renderer(mistune.Renderer):
                 name_class=name_class,
                 name_raw=name_raw))
 
+    def emoji_fragments(self):
+        """
+        Immutable mapping of every emoji name to its
+        :py:meth:`emoji` HTML. There is one table per
+        ``emoji`` implementation, built on first use
+        """
+        emoji = getattr(self.emoji, '__func__', self.emoji)
+
+        try:
+            return _emoji_fragments[emoji]
+        except KeyError:
+            pass
+
+        with _emoji_fragments_lock:
+            if emoji not in _emoji_fragments:
+                _emoji_fragments[emoji] = MappingProxyType({
+                    name: self.emoji(
+                        name_class=EmojiScanner.name_class(name),
+                        name_raw=name)
+                    for name in emojis})
+
+        return _emoji_fragments[emoji]
+
+    def emoji_fragment(self, name_class, name_raw):
+        """
+        Same as :py:meth:`emoji`, but known
+        emojis come out of :py:meth:`emoji_fragments`
+        """
+        try:
+            return self.emoji_fragments()[name_raw]
+        except KeyError:
+            return self.emoji(name_class=name_class, name_raw=name_raw)
+
     def mention(self, username, url):
         return (
             '<a class="comment-mention" rel="nofollow" '
@@ -97,10 +158,10 @@ class Renderer(mistune.Renderer):
     def audio_link(self, link):
         link = sanitize_url(link)
         return (
-            '<audio controls><source src="{link}">'
+            '<audio controls{preload}><source src="{link}">'
             '<a rel="nofollow" href="{link}">'
             '{link}</a></audio>\n'
-            .format(link=link))
+            .format(link=link, preload=self._preload()))
 
     def image_link(self, src, title, text):
         image = self.image(src, title, text)
@@ -109,52 +170,39 @@ class Renderer(mistune.Renderer):
     def video_link(self, link):
         link = sanitize_url(link)
         return (
-            '<video controls><source src="{link}">'
+            '<video controls{preload}><source src="{link}">'
             '<a rel="nofollow" href="{link}">{link}</a></video>\n'
-            .format(link=link))
-
-    def youtube_link(
-            self,
-            video_id,
-            start_hours=None,
-            start_minutes=None,
-            start_seconds=None):
-        timestamp = 0
-
-        if start_hours:
-            timestamp += int(start_hours.replace('h', '')) * 60 * 60
-
-        if start_minutes:
-            timestamp += int(start_minutes.replace('m', '')) * 60
-
-        if start_seconds:
-            timestamp += int(start_seconds.replace('s', ''))
-
-        if timestamp:
-            timestamp = '&start=%s' % timestamp
+            .format(link=link, preload=self._preload()))
+
+    def _preload(self):
+        # Facades defer loading the media until it's played
+        if self.options.get('facades'):
+            return ' preload="none"'
+
+        return ''
+
+    def embed_facade(self, provider, src, thumbnail=None):
+        """
+        Placeholder of an embed. Scripts are expected to
+        replace it by an ``iframe`` of ``data-src`` on click
+        """
+        if thumbnail:
+            thumbnail = (
+                '<img src="%s" alt="" loading="lazy">'
+                % self.image_src(thumbnail))
         else:
-            timestamp = ''
+            thumbnail = ''
 
         return (
-            '<span class="video"><iframe '
-            'src="https://www.youtube.com/embed/{video_id}?html5=1{timestamp}" '
-            'allowfullscreen></iframe></span>\n'
+            '<span class="video video-facade" data-provider="{provider}" '
+            'data-src="{src}">{thumbnail}</span>\n'
             .format(
-                video_id=video_id,
-                timestamp=timestamp))
-
-    def vimeo_link(self, video_id):
-        return (
-            '<span class="video"><iframe '
-            'src="https://player.vimeo.com/video/{video_id}" '
-            'allowfullscreen></iframe></span>\n'
-            .format(video_id=video_id))
+                provider=escape(provider),
+                src=escape(src),
+                thumbnail=thumbnail))
 
-    def gfycat_link(self, video_id):
-        return (
-            '<span class="video"><iframe src="https://gfycat.com/ifr/{video_id}" '
-            'frameborder="0" scrolling="no" allowfullscreen></iframe></span>\n'
-            .format(video_id=video_id))
+    def embed(self, provider, **data):
+        return providers[provider].render(self, **data)
 
     # def poll(self, name):
     #     return '<poll name={name}>\n'.format(name=name)
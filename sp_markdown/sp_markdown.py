@@ -2,36 +2,237 @@
 
 from __future__ import unicode_literals
 
+import asyncio
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import mistune
+from asgiref.sync import sync_to_async
+from django.conf import settings
 
 from .block import BlockLexer
 from .inline import InlineLexer
 from .renderer import Renderer
+from .cache import emoji_version
+from .mentions import render_mentions
+from .providers import providers
+from .proxy import proxy_version
+from .tokens import dump as dump_tokens, load as load_tokens
 
 
-class Markdown(mistune.Markdown):
+# Context class -> token handlers
+_token_handlers = {}
 
-    def __init__(self, no_follow=True):
-        renderer = Renderer(
-            escape=True,
-            hard_wrap=True,
-            no_follow=no_follow
-        )
-        super(Markdown, self).__init__(
-            renderer=renderer,
-            block=BlockLexer,
-            inline=InlineLexer,
-            parse_block_html=False,
-            parse_inline_html=False
-        )
+
+class RenderContext(mistune.Markdown):
+    """
+    State of a single render: the lexers, the token
+    stream and whatever gets collected along the way.
+    Contexts are cheap to build and must not be
+    shared between threads
+    """
+
+    block_class = BlockLexer
+    inline_class = InlineLexer
+
+    def __init__(self, renderer, stats=None):
+        # The grammars are shared by all lexers,
+        # only the lexing state is per render
+        self.renderer = renderer
+        self.block = self.block_class(stats=stats)
+        self.inline = self.inline_class(renderer, stats=stats)
+        self.footnotes = []
+        self.tokens = []
+        self._parse_block_html = False
 
     # Override
     def __call__(self, text):
-        return super(Markdown, self).__call__(text).strip()
+        return render_mentions([self.parse(text).strip()], self.renderer)[0]
 
     def render(self, text):
         return self(text)
 
+    # Override
+    def parse(self, text):
+        return ''.join(self.iter_parse(text))
+
+    def iter_parse(self, text):
+        """
+        Same as :py:meth:`parse`, but yields
+        the HTML of each top level block
+        """
+        tokens = self.block(_preprocessing(text))
+        yield from self.iter_output(tokens)
+
+    def iter_output(self, tokens):
+        """
+        Render block tokens, yielding the
+        HTML of each top level block
+        """
+        self.inline.setup(self.block.def_links, self.block.def_footnotes)
+        self.tokens = list(reversed(tokens))
+
+        while self.pop():
+            yield self.tok()
+
+        if self.footnotes:
+            yield self.output_footnotes()
+
+    def lex(self, text):
+        """
+        Run the block lexer only
+
+        :return: the token stream, see :py:func:`.tokens.dump`
+        """
+        tokens = self.block(_preprocessing(text))
+        return dump_tokens(
+            tokens, self.block.def_links, self.block.def_footnotes)
+
+    def parse_tokens(self, stream):
+        """
+        Same as :py:meth:`parse`, but
+        for a stream made by :py:meth:`lex`
+        """
+        tokens, def_links, def_footnotes = load_tokens(stream)
+        self.block.def_links = def_links
+        self.block.def_footnotes = def_footnotes
+        return ''.join(self.iter_output(tokens))
+
+    def output_footnotes(self):
+        keys = self.block.def_footnotes
+        footnotes = sorted(
+            (f for f in self.footnotes if keys.get(f['key'])),
+            key=lambda f: keys[f['key']])
+        body = [self.renderer.placeholder()]
+
+        for note in footnotes:
+            body.append(self.renderer.footnote_item(note['key'], note['text']))
+
+        self.footnotes = []
+        return self.renderer.footnotes(''.join(body))
+
+    # Override
+    def output(self, text, rules=None):
+        tokens = self.block(text, rules)
+        self.inline.setup(self.block.def_links, self.block.def_footnotes)
+        return self.output_tokens(tokens)
+
+    def output_tokens(self, tokens):
+        self.tokens = list(reversed(tokens))
+        out = [self.renderer.placeholder()]
+
+        while self.pop():
+            out.append(self.tok())
+
+        return ''.join(out)
+
+    # Override
+    def tok(self):
+        return self.token_handlers()[self.token['type']](self)
+
+    @classmethod
+    def token_handlers(cls):
+        """
+        Token type to its ``output_*`` method. The
+        table is built once per class, ``*_start``
+        types map to the same method as the type
+        """
+        try:
+            return _token_handlers[cls]
+        except KeyError:
+            pass
+
+        handlers = {}
+
+        for name in dir(cls):
+            if name.startswith('output_'):
+                handler = getattr(cls, name)
+                handlers[name[len('output_'):]] = handler
+                handlers[name[len('output_'):] + '_start'] = handler
+
+        _token_handlers[cls] = handlers
+        return handlers
+
+    def _output_until(self, end):
+        body = [self.renderer.placeholder()]
+
+        while self.pop()['type'] != end:
+            body.append(self.tok())
+
+        return ''.join(body)
+
+    # Override
+    def output_block_quote(self):
+        return self.renderer.block_quote(self._output_until('block_quote_end'))
+
+    # Override
+    def output_list(self):
+        ordered = self.token['ordered']
+        return self.renderer.list(self._output_until('list_end'), ordered)
+
+    # Override
+    def output_list_item(self):
+        body = [self.renderer.placeholder()]
+
+        while self.pop()['type'] != 'list_item_end':
+            if self.token['type'] == 'text':
+                body.append(self.tok_text())
+            else:
+                body.append(self.tok())
+
+        return self.renderer.list_item(''.join(body))
+
+    # Override
+    def output_loose_item(self):
+        return self.renderer.list_item(self._output_until('list_item_end'))
+
+    # Override
+    def output_footnote(self):
+        self.inline._in_footnote = True
+        key = self.token['key']
+        body = self._output_until('footnote_end')
+        self.footnotes.append({'key': key, 'text': body})
+        self.inline._in_footnote = False
+        return self.renderer.placeholder()
+
+    def render_blocks(self, text, cache, options):
+        """
+        Render each top level block on its own,
+        reusing the HTML cached for the unchanged ones
+        """
+        segments = self.block.parse_segments(_preprocessing(text))
+
+        # Footnotes get numbered document-wide
+        if self.block.def_footnotes:
+            return self.__class__(
+                self.renderer, stats=self.block.stats).parse(text).strip()
+
+        # A changed reference changes every key
+        links = sorted(
+            (k, v['link'], v['title'])
+            for k, v in self.block.def_links.items())
+        options = (options, links)
+        self.inline.setup(self.block.def_links, self.block.def_footnotes)
+        keys = [cache.make_key(source, options) for source, _tokens in segments]
+        cached = cache.get_many(keys)
+        rendered = {}
+        out = []
+
+        for key, (_source, tokens) in zip(keys, segments):
+            html = cached.get(key)
+
+            if html is None:
+                html = rendered.get(key)
+
+            if html is None:
+                html = rendered[key] = self.output_tokens(tokens)
+
+            out.append(html)
+
+        cache.set_many(rendered)
+        return ''.join(out).strip()
+
     # def get_mentions(self):
     #     return self.inline.mentions
 
@@ -58,23 +259,16 @@ class Markdown(mistune.Markdown):
             link=self.token['link']
         )
 
-    def output_youtube_link(self):
-        return self.renderer.youtube_link(
-            video_id=self.token['video_id'],
-            start_hours=self.token['start_hours'],
-            start_minutes=self.token['start_minutes'],
-            start_seconds=self.token['start_seconds']
-        )
+    def output_embed(self):
+        data = dict(self.token)
+        del data['type']
+        link = data.pop('link')
 
-    def output_vimeo_link(self):
-        return self.renderer.vimeo_link(
-            video_id=self.token['video_id']
-        )
+        if data['provider'] not in providers:
+            return self.renderer.block_link(link=link)
+
+        return self.renderer.embed(**data)
 
-    def output_gfycat_link(self):
-        return self.renderer.gfycat_link(
-            video_id=self.token['video_id']
-        )
     # remove `def output_poll(self):`
     # def output_poll(self):
     #     try:
@@ -85,3 +279,273 @@ class Markdown(mistune.Markdown):
     #         )
     #     else:
     #         return self.renderer.poll(name=name)
+
+
+class Markdown(object):
+    """
+    Markdown engine. It only holds the configuration,
+    so a single instance can be shared between threads.
+    Every render runs within its own :py:class:`RenderContext`
+
+    :param cache: a :py:class:`.cache.RenderCache`, to
+    skip rendering texts that were rendered before
+    :param stats: a :py:class:`.stats.RuleStats`, to
+    record what the lexing rules are up to
+    :param facades: render embeds as placeholders that load
+    the player on click, and don't preload audios and videos
+    :param image_proxy: load images through the image proxy
+    (see :py:func:`.proxy.proxy_url`), lazily
+    """
+
+    context_class = RenderContext
+
+    def __init__(
+            self,
+            no_follow=True,
+            cache=None,
+            stats=None,
+            facades=False,
+            image_proxy=False):
+        self.renderer = Renderer(
+            escape=True,
+            hard_wrap=True,
+            no_follow=no_follow,
+            facades=facades,
+            image_proxy=image_proxy
+        )
+        self.cache = cache
+        self.stats = stats
+
+    def context(self):
+        return self.context_class(self.renderer, stats=self.stats)
+
+    def cache_options(self):
+        """
+        Everything besides the text that
+        changes the output of a render
+        """
+        options = (
+            self.renderer.options['no_follow'],
+            self.renderer.options['facades'],
+            sorted(settings.ST_ALLOWED_URL_PROTOCOLS),
+            emoji_version(),
+            providers.version())
+
+        if self.renderer.options['image_proxy']:
+            options += (proxy_version(),)
+
+        return options
+
+    def __call__(self, text):
+        return self.render_mentions([self._render(text)])[0]
+
+    def render(self, text):
+        return self(text)
+
+    def _render(self, text):
+        # The HTML still has the mention placeholders,
+        # that's what gets cached as well
+        if self.cache is None:
+            return self.context().parse(text).strip()
+
+        key = self.cache.make_key(text, self.cache_options())
+        html = self.cache.get(key)
+
+        if html is None:
+            html = self.context().parse(text).strip()
+            self.cache.set(key, html)
+
+        return html
+
+    def lex(self, text):
+        """
+        Lex a text into a token stream that can be stored
+        next to it, so it can be rendered again (ie: with
+        other options) without running the block lexer.
+        Streams are not cached
+
+        :return: a JSON serializable dict,
+        see :py:func:`.tokens.dump`
+        """
+        return self.context().lex(text)
+
+    def render_tokens(self, stream):
+        """
+        Render a token stream made by :py:meth:`lex`
+
+        :raises .tokens.TokenVersionError: if the stream
+        was made by another version of the lexer
+        """
+        html = self.context().parse_tokens(stream).strip()
+        return self.render_mentions([html])[0]
+
+    def render_mentions(self, htmls, mentioned=None):
+        """
+        Resolve the mentions of a list of rendered
+        texts, with a single query for all of them.
+        See :py:func:`.mentions.render_mentions`
+        """
+        return render_mentions(htmls, self.renderer, mentioned)
+
+    def render_incremental(self, text):
+        """
+        Render a text reusing the HTML of its blocks that
+        were rendered before, so an edited text only pays
+        for the edited blocks. It needs the engine to have
+        a cache, otherwise it's a regular render
+        """
+        if self.cache is None:
+            return self.render(text)
+
+        options = self.cache_options()
+        key = self.cache.make_key(text, options)
+        html = self.cache.get(key)
+
+        if html is None:
+            html = self.context().render_blocks(text, self.cache, options)
+            self.cache.set(key, html)
+
+        return self.render_mentions([html])[0]
+
+    def iter_render(self, text):
+        """
+        Render a text lazily, yielding the HTML of each
+        top level block. The joined chunks are the same
+        as :py:meth:`render` output. Unless the text is
+        already in the cache, the result is not cached.
+        Mentions are resolved per chunk
+        """
+        if self.cache is not None:
+            html = self.cache.get(
+                self.cache.make_key(text, self.cache_options()))
+
+            if html is not None:
+                yield self.render_mentions([html])[0]
+                return
+
+        # The mentions are capped across chunks
+        mentioned = []
+
+        for chunk in _strip(self.context().iter_parse(text)):
+            yield self.render_mentions([chunk], mentioned)[0]
+
+    def render_many(self, texts, executor=None, chunk_size=64):
+        """
+        Render a list of texts. The work is split in chunks
+        of ``chunk_size`` texts and run in the given
+        ``concurrent.futures`` executor, if any. A
+        ``ProcessPoolExecutor`` will pickle the engine
+        once per chunk, so keep chunks reasonably big.
+        Mentions of all the texts are resolved at once
+
+        :return: the rendered texts, in order
+        """
+        texts = list(texts)
+
+        if executor is None:
+            return self.render_mentions([self._render(t) for t in texts])
+
+        chunks = [
+            texts[i:i + chunk_size]
+            for i in range(0, len(texts), chunk_size)]
+        return self.render_mentions(list(itertools.chain.from_iterable(
+            executor.map(_render_chunk, itertools.repeat(self), chunks))))
+
+    async def arender(self, text, executor=None):
+        """
+        Render in an executor, so the event loop is not
+        blocked. Defaults to :py:func:`get_executor`
+        """
+        loop = asyncio.get_running_loop()
+        html = await loop.run_in_executor(
+            executor or get_executor(), self._render, text)
+        htmls = await self._arender_mentions([html])
+        return htmls[0]
+
+    async def arender_many(self, texts, executor=None, chunk_size=64):
+        """
+        Same as :py:meth:`render_many`,
+        but without blocking the event loop
+        """
+        texts = list(texts)
+        executor = executor or get_executor()
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(*[
+            loop.run_in_executor(
+                executor, _render_chunk, self, texts[i:i + chunk_size])
+            for i in range(0, len(texts), chunk_size)])
+        return await self._arender_mentions(
+            list(itertools.chain.from_iterable(chunks)))
+
+    async def _arender_mentions(self, htmls):
+        # Queries can't run within the event loop, nor in
+        # the executor threads: django doesn't manage (close,
+        # health check) the connections of those. Texts
+        # without mentions don't wait on the sync thread
+        if not any('\x00' in html for html in htmls):
+            return htmls
+
+        return await sync_to_async(self.render_mentions)(htmls)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Executor used by the async API. It's created
+    on first use with ``ST_MARKDOWN_ASYNC_WORKERS``
+    threads, which caps the concurrent renders
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'ST_MARKDOWN_ASYNC_WORKERS', 4),
+                thread_name_prefix='sp_markdown')
+
+    return _executor
+
+
+def _strip(chunks):
+    """
+    Same as ``''.join(chunks).strip()``, but
+    without joining. Whitespace-only chunks
+    are held back until it's known whether
+    they are trailing
+    """
+    pending = ''
+    started = False
+
+    for chunk in chunks:
+        if not started:
+            chunk = chunk.lstrip()
+
+            if not chunk:
+                continue
+
+            started = True
+
+        body = chunk.rstrip()
+
+        if not body:
+            pending += chunk
+            continue
+
+        yield pending + body
+        pending = chunk[len(body):]
+
+
+def _render_chunk(md, texts):
+    return [md._render(t) for t in texts]
+
+
+def _preprocessing(text):
+    # NUL is reserved for the mention placeholders
+    return mistune.preprocessing(text.replace('\x00', '\ufffd'))
+
+
+# Shared engine, safe to use from any thread
+markdown = Markdown()
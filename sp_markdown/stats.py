@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import threading
+
+
+class RuleStats(object):
+    """
+    Lexing rule counters. Pass it to :py:class:`.Markdown`
+    and every render will record, per rule, how many times
+    it was tried, how many times it matched, the time spent
+    matching and the time spent in its ``parse_*`` or
+    ``output_*`` hook. Hook times include nested lexing.
+
+    Any object with a :py:meth:`record` method will do,
+    in case the numbers should go elsewhere
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rules = {}
+
+    def record(self, lexer, rule, matched, match_time, hook_time=0.0):
+        """
+        :param lexer: either ``'block'`` or ``'inline'``
+        :param rule: the rule name
+        """
+        key = '%s.%s' % (lexer, rule)
+
+        with self._lock:
+            counters = self._rules.get(key)
+
+            if counters is None:
+                counters = self._rules[key] = [0, 0, 0.0, 0.0]
+
+            counters[0] += 1
+            counters[1] += matched
+            counters[2] += match_time
+            counters[3] += hook_time
+
+    def snapshot(self):
+        """
+        :return: a dict of ``'lexer.rule'`` to a dict of
+        ``attempts``, ``matches``, ``time`` and ``hook_time``
+        """
+        with self._lock:
+            return {
+                key: {
+                    'attempts': attempts,
+                    'matches': matches,
+                    'time': match_time,
+                    'hook_time': hook_time}
+                for key, (attempts, matches, match_time, hook_time)
+                in self._rules.items()}
+
+    def __getstate__(self):
+        # Copies sent to process pool workers start
+        # empty, their numbers stay in the worker
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
+
+    def reset(self):
+        with self._lock:
+            self._rules.clear()
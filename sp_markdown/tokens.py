@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+# Bump it whenever the block lexer changes the tokens
+# it makes, streams of other versions get rejected
+VERSION = 2
+
+
+class TokenVersionError(ValueError):
+    """
+    The token stream was made by another
+    version of the lexer, the text must be
+    lexed again
+    """
+
+
+def dump(tokens, def_links, def_footnotes):
+    """
+    Make a token stream out of the block lexer output.
+    It's made of plain lists, dicts and strings, so it
+    can be stored as JSON (or pickled, or msgpack'ed).
+    The inline text is kept as is, inline lexing
+    happens when the stream is rendered
+
+    :param tokens: the block tokens
+    :param def_links: the reference links
+    :param def_footnotes: the footnote numbers
+    :return: dict of ``v`` (the version), ``t`` (the tokens,
+    as ``[type]`` or ``[type, fields]``), ``l`` (the
+    links) and ``f`` (the footnotes)
+    """
+    compact = []
+
+    for token in tokens:
+        fields = dict(token)
+        kind = fields.pop('type')
+
+        if fields:
+            compact.append([kind, fields])
+        else:
+            compact.append([kind])
+
+    return {
+        'v': VERSION,
+        't': compact,
+        'l': dict(def_links),
+        'f': dict(def_footnotes)}
+
+
+def load(stream):
+    """
+    Reverse of :py:func:`dump`
+
+    :return: the tokens, links and footnotes
+    :raises TokenVersionError: if the stream
+    is of another version
+    """
+    if stream.get('v') != VERSION:
+        raise TokenVersionError(
+            'Unsupported token stream version: %r' % stream.get('v'))
+
+    tokens = []
+
+    for token in stream['t']:
+        fields = dict(token[1]) if len(token) > 1 else {}
+        fields['type'] = token[0]
+        tokens.append(fields)
+
+    return tokens, dict(stream['l']), dict(stream['f'])
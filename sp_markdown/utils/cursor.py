@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import re
+
+_Pattern = type(re.compile(''))
+
+# What comes after a "(". Groups and lookarounds
+# start an alternative, other extensions such
+# as "(?P=name)" or "(?i)" don't
+_group_prefix = re.compile(
+    r'\?(?::|=|!|<=|<!|P<\w+>)'
+    r'|(?P<other>\?)'
+    r'|')
+
+
+def unanchor(pattern):
+    """
+    Remove the ``^`` at the start of every group and
+    alternative, so ``pattern.match(text, pos)`` works
+    as ``pattern.match(text[pos:])`` did. A ``\\b``
+    right after the anchor is removed as well, it
+    always matches at the start of a sliced text
+    followed by a word char (ie: ``^\\b_``), but it
+    would look at the previous char when given a ``pos``
+    """
+    source = pattern.pattern
+    out = []
+    in_class = False
+    alt_start = True
+    i = 0
+
+    while i < len(source):
+        char = source[i]
+
+        if alt_start and char == '^':
+            i += 1
+
+            if source.startswith('\\b', i):
+                i += 2
+
+            alt_start = False
+            continue
+
+        alt_start = False
+
+        if char == '\\':
+            out.append(source[i:i + 2])
+            i += 2
+            continue
+
+        if in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+
+            # A leading ']' or '^]' is a literal
+            if source.startswith('^]', i + 1):
+                out.append('[^]')
+                i += 3
+                continue
+
+            if source.startswith(']', i + 1):
+                out.append('[]')
+                i += 2
+                continue
+        elif char == '(':
+            prefix = _group_prefix.match(source, i + 1)
+            out.append('(' + prefix.group(0))
+            i = prefix.end()
+            alt_start = prefix.group('other') is None
+            continue
+        elif char == '|':
+            alt_start = True
+
+        out.append(char)
+        i += 1
+
+    return re.compile(''.join(out), pattern.flags)
+
+
+class CursorMatchers(dict):
+    """
+    Rule pattern to the ``match(text, pos)`` function
+    of its unanchored version. Scanners already
+    match at ``pos``, so they are used as they are
+    """
+
+    def __missing__(self, rule):
+        if isinstance(rule, _Pattern):
+            match = unanchor(rule).match
+        else:
+            match = rule.match
+
+        self[rule] = match
+        return match
+
+
+cursor_matchers = CursorMatchers()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import itertools
+
+
+def dispatch_table(rules, first_chars):
+    """
+    Split the rules by the first char they can
+    match, keeping their order. Rules not in
+    ``first_chars`` are tried at any char
+
+    :param first_chars: dict of rule to the chars it may start with
+    :return: dict of char to rules and the
+    rules for any other char
+    """
+    default = tuple(r for r in rules if r not in first_chars)
+    chars = set(itertools.chain.from_iterable(
+        first_chars[r] for r in rules if r in first_chars))
+    buckets = {
+        char: tuple(
+            r for r in rules
+            if r not in first_chars or char in first_chars[r])
+        for char in chars}
+    return buckets, default
+
+
+# (lexer class, rules) -> dispatch table
+_dispatch_tables = {}
+
+
+class RuleDispatcher(object):
+    """
+    Lexer mixin. Lexers list the chars each rule
+    can start with in ``first_chars``
+    """
+
+    first_chars = {}
+
+    def dispatch_table(self, rules):
+        """
+        Rules by first char, see :py:func:`dispatch_table`.
+        Tables are built once per lexer class and list of rules
+        """
+        key = (type(self), tuple(rules))
+
+        try:
+            return _dispatch_tables[key]
+        except KeyError:
+            table = _dispatch_tables[key] = dispatch_table(rules, self.first_chars)
+            return table
@@ -0,0 +1,1236 @@
+# -*- coding: utf-8 -*-
+
+# Emoji names and unicode sequences to names, sorted and
+# newline separated. Unicode sequences were generated from
+# the Unicode emoji data, do not edit them by hand
+
+from __future__ import unicode_literals
+
+
+NAMES = (
+    '+1\n+1_tone1\n+1_tone2\n+1_tone3\n+1_tone4\n+1_tone5\n-1\n-1_tone1\n'
+    '-1_tone2\n-1_tone3\n-1_tone4\n-1_tone5\n100\n1234\n8ball\na\nab\nabc\n'
+    'abcd\nac\naccept\nad\nadmission_tickets\nae\naerial_tramway\naf\nag\n'
+    'ai\nairplane\nairplane_arriving\nairplane_departure\nairplane_small\n'
+    'al\nalarm_clock\nalembic\nalien\nam\nambulance\namphora\nanchor\n'
+    'angel\nangel_tone1\nangel_tone2\nangel_tone3\nangel_tone4\n'
+    'angel_tone5\nanger\nanger_right\nangry\nanguished\nant\nao\napple\n'
+    'aq\naquarius\nar\narchery\naries\narrow_backward\narrow_double_down\n'
+    'arrow_double_up\narrow_down\narrow_down_small\narrow_forward\n'
+    'arrow_heading_down\narrow_heading_up\narrow_left\narrow_lower_left\n'
+    'arrow_lower_right\narrow_right\narrow_right_hook\narrow_up\n'
+    'arrow_up_down\narrow_up_small\narrow_upper_left\narrow_upper_right\n'
+    'arrows_clockwise\narrows_counterclockwise\nart\narticulated_lorry\n'
+    'as\nasterisk\nastonished\nat\nathletic_shoe\natm\natom\natom_symbol\n'
+    'au\naw\nax\naz\nb\nba\nbaby\nbaby_bottle\nbaby_chick\nbaby_symbol\n'
+    'baby_tone1\nbaby_tone2\nbaby_tone3\nbaby_tone4\nbaby_tone5\nback\n'
+    'badminton\nbaggage_claim\nballoon\nballot_box\n'
+    'ballot_box_with_ballot\nballot_box_with_check\nbamboo\nbanana\n'
+    'bangbang\nbank\nbar_chart\nbarber\nbaseball\nbasketball\n'
+    'basketball_player\nbasketball_player_tone1\nbasketball_player_tone2\n'
+    'basketball_player_tone3\nbasketball_player_tone4\n'
+    'basketball_player_tone5\nbath\nbath_tone1\nbath_tone2\nbath_tone3\n'
+    'bath_tone4\nbath_tone5\nbathtub\nbattery\nbb\nbd\nbe\nbeach\n'
+    'beach_umbrella\nbeach_with_umbrella\nbear\nbed\nbee\nbeer\nbeers\n'
+    'beetle\nbeginner\nbell\nbellhop\nbellhop_bell\nbento\nbf\nbg\nbh\nbi\n'
+    'bicyclist\nbicyclist_tone1\nbicyclist_tone2\nbicyclist_tone3\n'
+    'bicyclist_tone4\nbicyclist_tone5\nbike\nbikini\nbiohazard\n'
+    'biohazard_sign\nbird\nbirthday\nbj\nbl\nblack_circle\nblack_joker\n'
+    'black_large_square\nblack_medium_small_square\nblack_medium_square\n'
+    'black_nib\nblack_small_square\nblack_square_button\nblossom\n'
+    'blowfish\nblue_book\nblue_car\nblue_heart\nblush\nbm\nbn\nbo\nboar\n'
+    'bomb\nbook\nbookmark\nbookmark_tabs\nbooks\nboom\nboot\n'
+    'bottle_with_popping_cork\nbouquet\nbow\nbow_and_arrow\nbow_tone1\n'
+    'bow_tone2\nbow_tone3\nbow_tone4\nbow_tone5\nbowling\nboy\nboy_tone1\n'
+    'boy_tone2\nboy_tone3\nboy_tone4\nboy_tone5\nbq\nbr\nbread\n'
+    'bride_with_veil\nbride_with_veil_tone1\nbride_with_veil_tone2\n'
+    'bride_with_veil_tone3\nbride_with_veil_tone4\nbride_with_veil_tone5\n'
+    'bridge_at_night\nbriefcase\nbroken_heart\nbs\nbt\nbug\n'
+    'building_construction\nbulb\nbullettrain_front\nbullettrain_side\n'
+    'burrito\nbus\nbusstop\nbust_in_silhouette\nbusts_in_silhouette\nbv\n'
+    'bw\nby\nbz\nca\ncactus\ncake\ncalendar\ncalendar_spiral\ncalling\n'
+    'camel\ncamera\ncamera_with_flash\ncamping\ncancer\ncandle\ncandy\n'
+    'capital_abcd\ncapricorn\ncard_box\ncard_file_box\ncard_index\n'
+    'card_index_dividers\ncarousel_horse\ncat\ncat2\ncc\ncd\ncf\ncg\nch\n'
+    'chains\nchampagne\nchart\nchart_with_downwards_trend\n'
+    'chart_with_upwards_trend\ncheckered_flag\ncheese\ncheese_wedge\n'
+    'cherries\ncherry_blossom\nchestnut\nchicken\nchildren_crossing\n'
+    'chile\nchipmunk\nchocolate_bar\nchristmas_tree\nchurch\nci\ncinema\n'
+    'circus_tent\ncity_dusk\ncity_sunrise\ncity_sunset\ncityscape\nck\ncl\n'
+    'clap\nclap_tone1\nclap_tone2\nclap_tone3\nclap_tone4\nclap_tone5\n'
+    'clapper\nclassical_building\nclipboard\nclock\nclock1\nclock10\n'
+    'clock1030\nclock11\nclock1130\nclock12\nclock1230\nclock130\nclock2\n'
+    'clock230\nclock3\nclock330\nclock4\nclock430\nclock5\nclock530\n'
+    'clock6\nclock630\nclock7\nclock730\nclock8\nclock830\nclock9\n'
+    'clock930\nclosed_book\nclosed_lock_with_key\nclosed_umbrella\ncloud\n'
+    'cloud_lightning\ncloud_rain\ncloud_snow\ncloud_tornado\n'
+    'cloud_with_lightning\ncloud_with_rain\ncloud_with_snow\n'
+    'cloud_with_tornado\nclubs\ncm\ncn\nco\ncocktail\ncoffee\ncoffin\n'
+    'cold_sweat\ncomet\ncompression\ncomputer\nconfetti_ball\nconfounded\n'
+    'confused\ncongo\ncongratulations\nconstruction\nconstruction_site\n'
+    'construction_worker\nconstruction_worker_tone1\n'
+    'construction_worker_tone2\nconstruction_worker_tone3\n'
+    'construction_worker_tone4\nconstruction_worker_tone5\ncontrol_knobs\n'
+    'convenience_store\ncookie\ncool\ncop\ncop_tone1\ncop_tone2\n'
+    'cop_tone3\ncop_tone4\ncop_tone5\ncopyright\ncorn\ncouch\n'
+    'couch_and_lamp\ncouple\ncouple_mm\ncouple_with_heart\n'
+    'couple_with_heart_mm\ncouple_with_heart_ww\ncouple_ww\ncouplekiss\n'
+    'couplekiss_mm\ncouplekiss_ww\ncow\ncow2\ncp\ncr\ncrab\ncrayon\n'
+    'credit_card\ncrescent_moon\ncricket\ncricket_bat_ball\ncrocodile\n'
+    'cross\ncrossed_flags\ncrossed_swords\ncrown\ncruise_ship\ncry\n'
+    'crying_cat_face\ncrystal_ball\ncu\ncupid\ncurly_loop\n'
+    'currency_exchange\ncurry\ncustard\ncustoms\ncv\ncw\ncx\ncy\ncyclone\n'
+    'cz\ndagger\ndagger_knife\ndancer\ndancer_tone1\ndancer_tone2\n'
+    'dancer_tone3\ndancer_tone4\ndancer_tone5\ndancers\ndango\n'
+    'dark_sunglasses\ndart\ndash\ndate\nde\ndeciduous_tree\n'
+    'department_store\nderelict_house_building\ndesert\ndesert_island\n'
+    'desktop\ndesktop_computer\ndg\ndiamond_shape_with_a_dot_inside\n'
+    'diamonds\ndisappointed\ndisappointed_relieved\ndividers\ndizzy\n'
+    'dizzy_face\ndj\ndk\ndm\ndo\ndo_not_litter\ndog\ndog2\ndollar\ndolls\n'
+    'dolphin\ndoor\ndouble_vertical_bar\ndoughnut\ndove\ndove_of_peace\n'
+    'dragon\ndragon_face\ndress\ndromedary_camel\ndroplet\ndvd\ndz\n'
+    'e-mail\nea\near\near_of_rice\near_tone1\near_tone2\near_tone3\n'
+    'ear_tone4\near_tone5\nearth_africa\nearth_americas\nearth_asia\nec\n'
+    'ee\neg\negg\neggplant\neh\neight\neight_pointed_black_star\n'
+    'eight_spoked_asterisk\nelectric_plug\nelephant\nemail\nend\nenvelope\n'
+    'envelope_with_arrow\ner\nes\net\neu\neuro\neuropean_castle\n'
+    'european_post_office\nevergreen_tree\nexclamation\nexpressionless\n'
+    'eye\neye_in_speech_bubble\neyeglasses\neyes\nface_with_head_bandage\n'
+    'face_with_rolling_eyes\nface_with_thermometer\nfactory\nfallen_leaf\n'
+    'family\nfamily_mmb\nfamily_mmbb\nfamily_mmg\nfamily_mmgb\n'
+    'family_mmgg\nfamily_mwbb\nfamily_mwg\nfamily_mwgb\nfamily_mwgg\n'
+    'family_wwb\nfamily_wwbb\nfamily_wwg\nfamily_wwgb\nfamily_wwgg\n'
+    'fast_forward\nfax\nfearful\nfeet\nferris_wheel\nferry\nfi\n'
+    'field_hockey\nfile_cabinet\nfile_folder\nfilm_frames\nfilm_projector\n'
+    'fire\nfire_engine\nfireworks\nfirst_quarter_moon\n'
+    'first_quarter_moon_with_face\nfish\nfish_cake\nfishing_pole_and_fish\n'
+    'fist\nfist_tone1\nfist_tone2\nfist_tone3\nfist_tone4\nfist_tone5\n'
+    'five\nfj\nfk\nflag_ac\nflag_ad\nflag_ae\nflag_af\nflag_ag\nflag_ai\n'
+    'flag_al\nflag_am\nflag_ao\nflag_aq\nflag_ar\nflag_as\nflag_at\n'
+    'flag_au\nflag_aw\nflag_ax\nflag_az\nflag_ba\nflag_bb\nflag_bd\n'
+    'flag_be\nflag_bf\nflag_bg\nflag_bh\nflag_bi\nflag_bj\nflag_bl\n'
+    'flag_black\nflag_bm\nflag_bn\nflag_bo\nflag_bq\nflag_br\nflag_bs\n'
+    'flag_bt\nflag_bv\nflag_bw\nflag_by\nflag_bz\nflag_ca\nflag_cc\n'
+    'flag_cd\nflag_cf\nflag_cg\nflag_ch\nflag_ci\nflag_ck\nflag_cl\n'
+    'flag_cm\nflag_cn\nflag_co\nflag_cp\nflag_cr\nflag_cu\nflag_cv\n'
+    'flag_cw\nflag_cx\nflag_cy\nflag_cz\nflag_de\nflag_dg\nflag_dj\n'
+    'flag_dk\nflag_dm\nflag_do\nflag_dz\nflag_ea\nflag_ec\nflag_ee\n'
+    'flag_eg\nflag_eh\nflag_er\nflag_es\nflag_et\nflag_eu\nflag_fi\n'
+    'flag_fj\nflag_fk\nflag_fm\nflag_fo\nflag_fr\nflag_ga\nflag_gb\n'
+    'flag_gd\nflag_ge\nflag_gf\nflag_gg\nflag_gh\nflag_gi\nflag_gl\n'
+    'flag_gm\nflag_gn\nflag_gp\nflag_gq\nflag_gr\nflag_gs\nflag_gt\n'
+    'flag_gu\nflag_gw\nflag_gy\nflag_hk\nflag_hm\nflag_hn\nflag_hr\n'
+    'flag_ht\nflag_hu\nflag_ic\nflag_id\nflag_ie\nflag_il\nflag_im\n'
+    'flag_in\nflag_io\nflag_iq\nflag_ir\nflag_is\nflag_it\nflag_je\n'
+    'flag_jm\nflag_jo\nflag_jp\nflag_ke\nflag_kg\nflag_kh\nflag_ki\n'
+    'flag_km\nflag_kn\nflag_kp\nflag_kr\nflag_kw\nflag_ky\nflag_kz\n'
+    'flag_la\nflag_lb\nflag_lc\nflag_li\nflag_lk\nflag_lr\nflag_ls\n'
+    'flag_lt\nflag_lu\nflag_lv\nflag_ly\nflag_ma\nflag_mc\nflag_md\n'
+    'flag_me\nflag_mf\nflag_mg\nflag_mh\nflag_mk\nflag_ml\nflag_mm\n'
+    'flag_mn\nflag_mo\nflag_mp\nflag_mq\nflag_mr\nflag_ms\nflag_mt\n'
+    'flag_mu\nflag_mv\nflag_mw\nflag_mx\nflag_my\nflag_mz\nflag_na\n'
+    'flag_nc\nflag_ne\nflag_nf\nflag_ng\nflag_ni\nflag_nl\nflag_no\n'
+    'flag_np\nflag_nr\nflag_nu\nflag_nz\nflag_om\nflag_pa\nflag_pe\n'
+    'flag_pf\nflag_pg\nflag_ph\nflag_pk\nflag_pl\nflag_pm\nflag_pn\n'
+    'flag_pr\nflag_ps\nflag_pt\nflag_pw\nflag_py\nflag_qa\nflag_re\n'
+    'flag_ro\nflag_rs\nflag_ru\nflag_rw\nflag_sa\nflag_sb\nflag_sc\n'
+    'flag_sd\nflag_se\nflag_sg\nflag_sh\nflag_si\nflag_sj\nflag_sk\n'
+    'flag_sl\nflag_sm\nflag_sn\nflag_so\nflag_sr\nflag_ss\nflag_st\n'
+    'flag_sv\nflag_sx\nflag_sy\nflag_sz\nflag_ta\nflag_tc\nflag_td\n'
+    'flag_tf\nflag_tg\nflag_th\nflag_tj\nflag_tk\nflag_tl\nflag_tm\n'
+    'flag_tn\nflag_to\nflag_tr\nflag_tt\nflag_tv\nflag_tw\nflag_tz\n'
+    'flag_ua\nflag_ug\nflag_um\nflag_us\nflag_uy\nflag_uz\nflag_va\n'
+    'flag_vc\nflag_ve\nflag_vg\nflag_vi\nflag_vn\nflag_vu\nflag_wf\n'
+    'flag_white\nflag_ws\nflag_xk\nflag_ye\nflag_yt\nflag_za\nflag_zm\n'
+    'flag_zw\nflags\nflame\nflan\nflashlight\nfleur-de-lis\nfloppy_disk\n'
+    'flower_playing_cards\nflushed\nfm\nfo\nfog\nfoggy\nfootball\n'
+    'footprints\nfork_and_knife\nfork_and_knife_with_plate\n'
+    'fork_knife_plate\nfountain\nfour\nfour_leaf_clover\nfr\nframe_photo\n'
+    'frame_with_picture\nfree\nfried_shrimp\nfries\nfrog\nfrowning\n'
+    'frowning2\nfuelpump\nfull_moon\nfull_moon_with_face\nfuneral_urn\nga\n'
+    'game_die\ngb\ngd\nge\ngear\ngem\ngemini\ngf\ngg\ngh\nghost\ngi\ngift\n'
+    'gift_heart\ngirl\ngirl_tone1\ngirl_tone2\ngirl_tone3\ngirl_tone4\n'
+    'girl_tone5\ngl\nglobe_with_meridians\ngm\ngn\ngoat\ngolf\ngolfer\ngp\n'
+    'gq\ngr\ngrandma\ngrandma_tone1\ngrandma_tone2\ngrandma_tone3\n'
+    'grandma_tone4\ngrandma_tone5\ngrapes\ngreen_apple\ngreen_book\n'
+    'green_heart\ngrey_exclamation\ngrey_question\ngrimacing\ngrin\n'
+    'grinning\ngs\ngt\ngu\nguardsman\nguardsman_tone1\nguardsman_tone2\n'
+    'guardsman_tone3\nguardsman_tone4\nguardsman_tone5\nguitar\ngun\ngw\n'
+    'gy\nhaircut\nhaircut_tone1\nhaircut_tone2\nhaircut_tone3\n'
+    'haircut_tone4\nhaircut_tone5\nhamburger\nhammer\nhammer_and_pick\n'
+    'hammer_and_wrench\nhammer_pick\nhamster\nhand_splayed\n'
+    'hand_splayed_tone1\nhand_splayed_tone2\nhand_splayed_tone3\n'
+    'hand_splayed_tone4\nhand_splayed_tone5\nhandbag\nhankey\nhash\n'
+    'hatched_chick\nhatching_chick\nhead_bandage\nheadphones\n'
+    'hear_no_evil\nheart\nheart_decoration\nheart_exclamation\nheart_eyes\n'
+    'heart_eyes_cat\nheartbeat\nheartpulse\nhearts\nheavy_check_mark\n'
+    'heavy_division_sign\nheavy_dollar_sign\n'
+    'heavy_heart_exclamation_mark_ornament\nheavy_minus_sign\n'
+    'heavy_multiplication_x\nheavy_plus_sign\nhelicopter\n'
+    'helmet_with_cross\nhelmet_with_white_cross\nherb\nhibiscus\n'
+    'high_brightness\nhigh_heel\nhk\nhm\nhn\nhockey\nhole\nhomes\n'
+    'honey_pot\nhorse\nhorse_racing\nhorse_racing_tone1\n'
+    'horse_racing_tone2\nhorse_racing_tone3\nhorse_racing_tone4\n'
+    'horse_racing_tone5\nhospital\nhot_dog\nhot_pepper\nhotdog\nhotel\n'
+    'hotsprings\nhourglass\nhourglass_flowing_sand\nhouse\n'
+    'house_abandoned\nhouse_buildings\nhouse_with_garden\nhr\nht\nhu\n'
+    'hugging\nhugging_face\nhushed\nic\nice_cream\nice_skate\nicecream\n'
+    'id\nideograph_advantage\nie\nil\nim\nimp\nin\ninbox_tray\n'
+    'incoming_envelope\nindonesia\ninformation_desk_person\n'
+    'information_desk_person_tone1\ninformation_desk_person_tone2\n'
+    'information_desk_person_tone3\ninformation_desk_person_tone4\n'
+    'information_desk_person_tone5\ninformation_source\ninnocent\n'
+    'interrobang\nio\niphone\niq\nir\nis\nisland\nit\nizakaya_lantern\n'
+    'jack_o_lantern\njapan\njapanese_castle\njapanese_goblin\n'
+    'japanese_ogre\nje\njeans\njm\njo\njoy\njoy_cat\njoystick\njp\nkaaba\n'
+    'ke\nkey\nkey2\nkeyboard\nkeycap_asterisk\nkg\nkh\nki\nkimono\nkiss\n'
+    'kiss_mm\nkiss_ww\nkissing\nkissing_cat\nkissing_closed_eyes\n'
+    'kissing_heart\nkissing_smiling_eyes\nkm\nkn\nknife\nkoala\nkoko\nkp\n'
+    'kr\nkw\nky\nkz\nla\nlabel\nlarge_blue_circle\nlarge_blue_diamond\n'
+    'large_orange_diamond\nlast_quarter_moon\nlast_quarter_moon_with_face\n'
+    'latin_cross\nlaughing\nlb\nlc\nleaves\nledger\nleft_luggage\n'
+    'left_right_arrow\nleftwards_arrow_with_hook\nlemon\nleo\nleopard\n'
+    'level_slider\nlevitate\nli\nlibra\nlifter\nlifter_tone1\n'
+    'lifter_tone2\nlifter_tone3\nlifter_tone4\nlifter_tone5\nlight_rail\n'
+    'link\nlinked_paperclips\nlion\nlion_face\nlips\nlipstick\nlk\nlock\n'
+    'lock_with_ink_pen\nlollipop\nloop\nloud_sound\nloudspeaker\n'
+    'love_hotel\nlove_letter\nlow_brightness\nlower_left_ballpoint_pen\n'
+    'lower_left_crayon\nlower_left_fountain_pen\nlower_left_paintbrush\n'
+    'lr\nls\nlt\nlu\nlv\nly\nm\nma\nmag\nmag_right\nmahjong\nmailbox\n'
+    'mailbox_closed\nmailbox_with_mail\nmailbox_with_no_mail\nman\n'
+    'man_in_business_suit_levitating\nman_tone1\nman_tone2\nman_tone3\n'
+    'man_tone4\nman_tone5\nman_with_gua_pi_mao\nman_with_gua_pi_mao_tone1\n'
+    'man_with_gua_pi_mao_tone2\nman_with_gua_pi_mao_tone3\n'
+    'man_with_gua_pi_mao_tone4\nman_with_gua_pi_mao_tone5\n'
+    'man_with_turban\nman_with_turban_tone1\nman_with_turban_tone2\n'
+    'man_with_turban_tone3\nman_with_turban_tone4\nman_with_turban_tone5\n'
+    'mans_shoe\nmantlepiece_clock\nmap\nmaple_leaf\nmask\nmassage\n'
+    'massage_tone1\nmassage_tone2\nmassage_tone3\nmassage_tone4\n'
+    'massage_tone5\nmc\nmd\nme\nmeat_on_bone\nmedal\nmega\nmelon\nmenorah\n'
+    'mens\nmetal\nmetal_tone1\nmetal_tone2\nmetal_tone3\nmetal_tone4\n'
+    'metal_tone5\nmetro\nmf\nmg\nmh\nmicrophone\nmicrophone2\nmicroscope\n'
+    'middle_finger\nmiddle_finger_tone1\nmiddle_finger_tone2\n'
+    'middle_finger_tone3\nmiddle_finger_tone4\nmiddle_finger_tone5\n'
+    'military_medal\nmilky_way\nminibus\nminidisc\nmk\nml\nmm\nmn\nmo\n'
+    'mobile_phone_off\nmoney_mouth\nmoney_mouth_face\nmoney_with_wings\n'
+    'moneybag\nmonkey\nmonkey_face\nmonorail\nmortar_board\nmosque\n'
+    'motorboat\nmotorcycle\nmotorway\nmount_fuji\nmountain\n'
+    'mountain_bicyclist\nmountain_bicyclist_tone1\n'
+    'mountain_bicyclist_tone2\nmountain_bicyclist_tone3\n'
+    'mountain_bicyclist_tone4\nmountain_bicyclist_tone5\n'
+    'mountain_cableway\nmountain_railway\nmountain_snow\nmouse\nmouse2\n'
+    'mouse_three_button\nmovie_camera\nmoyai\nmp\nmq\nmr\nms\nmt\nmu\n'
+    'muscle\nmuscle_tone1\nmuscle_tone2\nmuscle_tone3\nmuscle_tone4\n'
+    'muscle_tone5\nmushroom\nmusical_keyboard\nmusical_note\n'
+    'musical_score\nmute\nmv\nmw\nmx\nmy\nmz\nna\nnail_care\n'
+    'nail_care_tone1\nnail_care_tone2\nnail_care_tone3\nnail_care_tone4\n'
+    'nail_care_tone5\nname_badge\nnational_park\nnc\nne\nnecktie\n'
+    'negative_squared_cross_mark\nnerd\nnerd_face\nneutral_face\nnew\n'
+    'new_moon\nnew_moon_with_face\nnewspaper\nnewspaper2\nnext_track\nnf\n'
+    'ng\nni\nnigeria\nnight_with_stars\nnine\nnl\nno\nno_bell\n'
+    'no_bicycles\nno_entry\nno_entry_sign\nno_good\nno_good_tone1\n'
+    'no_good_tone2\nno_good_tone3\nno_good_tone4\nno_good_tone5\n'
+    'no_mobile_phones\nno_mouth\nno_pedestrians\nno_smoking\n'
+    'non-potable_water\nnose\nnose_tone1\nnose_tone2\nnose_tone3\n'
+    'nose_tone4\nnose_tone5\nnotebook\nnotebook_with_decorative_cover\n'
+    'notepad_spiral\nnotes\nnp\nnr\nnu\nnut_and_bolt\nnz\no\no2\nocean\n'
+    'octopus\noden\noffice\noil\noil_drum\nok\nok_hand\nok_hand_tone1\n'
+    'ok_hand_tone2\nok_hand_tone3\nok_hand_tone4\nok_hand_tone5\nok_woman\n'
+    'ok_woman_tone1\nok_woman_tone2\nok_woman_tone3\nok_woman_tone4\n'
+    'ok_woman_tone5\nold_key\nolder_man\nolder_man_tone1\nolder_man_tone2\n'
+    'older_man_tone3\nolder_man_tone4\nolder_man_tone5\nolder_woman\n'
+    'older_woman_tone1\nolder_woman_tone2\nolder_woman_tone3\n'
+    'older_woman_tone4\nolder_woman_tone5\nom\nom_symbol\non\n'
+    'oncoming_automobile\noncoming_bus\noncoming_police_car\n'
+    'oncoming_taxi\none\nopen_file_folder\nopen_hands\nopen_hands_tone1\n'
+    'open_hands_tone2\nopen_hands_tone3\nopen_hands_tone4\n'
+    'open_hands_tone5\nopen_mouth\nophiuchus\norange_book\northodox_cross\n'
+    'outbox_tray\nox\npa\npackage\npage_facing_up\npage_with_curl\npager\n'
+    'paintbrush\npalm_tree\npanda_face\npaperclip\npaperclips\npark\n'
+    'parking\npart_alternation_mark\npartly_sunny\npassenger_ship\n'
+    'passport_control\npause_button\npaw_prints\npe\npeace\npeace_symbol\n'
+    'peach\npear\npen_ballpoint\npen_fountain\npencil\npencil2\npenguin\n'
+    'pensive\nperforming_arts\npersevere\nperson_frowning\n'
+    'person_frowning_tone1\nperson_frowning_tone2\nperson_frowning_tone3\n'
+    'person_frowning_tone4\nperson_frowning_tone5\nperson_with_ball\n'
+    'person_with_ball_tone1\nperson_with_ball_tone2\n'
+    'person_with_ball_tone3\nperson_with_ball_tone4\n'
+    'person_with_ball_tone5\nperson_with_blond_hair\n'
+    'person_with_blond_hair_tone1\nperson_with_blond_hair_tone2\n'
+    'person_with_blond_hair_tone3\nperson_with_blond_hair_tone4\n'
+    'person_with_blond_hair_tone5\nperson_with_pouting_face\n'
+    'person_with_pouting_face_tone1\nperson_with_pouting_face_tone2\n'
+    'person_with_pouting_face_tone3\nperson_with_pouting_face_tone4\n'
+    'person_with_pouting_face_tone5\npf\npg\nph\npick\npig\npig2\n'
+    'pig_nose\npill\npineapple\nping_pong\npisces\npizza\npk\npl\n'
+    'place_of_worship\nplay_pause\npm\npn\npoint_down\npoint_down_tone1\n'
+    'point_down_tone2\npoint_down_tone3\npoint_down_tone4\n'
+    'point_down_tone5\npoint_left\npoint_left_tone1\npoint_left_tone2\n'
+    'point_left_tone3\npoint_left_tone4\npoint_left_tone5\npoint_right\n'
+    'point_right_tone1\npoint_right_tone2\npoint_right_tone3\n'
+    'point_right_tone4\npoint_right_tone5\npoint_up\npoint_up_2\n'
+    'point_up_2_tone1\npoint_up_2_tone2\npoint_up_2_tone3\n'
+    'point_up_2_tone4\npoint_up_2_tone5\npoint_up_tone1\npoint_up_tone2\n'
+    'point_up_tone3\npoint_up_tone4\npoint_up_tone5\npolice_car\npoo\n'
+    'poodle\npoop\npopcorn\npost_office\npostal_horn\npostbox\n'
+    'potable_water\npouch\npoultry_leg\npound\npouting_cat\npr\npray\n'
+    'pray_tone1\npray_tone2\npray_tone3\npray_tone4\npray_tone5\n'
+    'prayer_beads\nprevious_track\nprincess\nprincess_tone1\n'
+    'princess_tone2\nprincess_tone3\nprincess_tone4\nprincess_tone5\n'
+    'printer\nprojector\nps\npt\npudding\npunch\npunch_tone1\npunch_tone2\n'
+    'punch_tone3\npunch_tone4\npunch_tone5\npurple_heart\npurse\npushpin\n'
+    'put_litter_in_its_place\npw\npy\nqa\nquestion\nrabbit\nrabbit2\n'
+    'race_car\nracehorse\nracing_car\nracing_motorcycle\nradio\n'
+    'radio_button\nradioactive\nradioactive_sign\nrage\nrailroad_track\n'
+    'railway_car\nrailway_track\nrainbow\nraised_hand\nraised_hand_tone1\n'
+    'raised_hand_tone2\nraised_hand_tone3\nraised_hand_tone4\n'
+    'raised_hand_tone5\nraised_hand_with_fingers_splayed\n'
+    'raised_hand_with_fingers_splayed_tone1\n'
+    'raised_hand_with_fingers_splayed_tone2\n'
+    'raised_hand_with_fingers_splayed_tone3\n'
+    'raised_hand_with_fingers_splayed_tone4\n'
+    'raised_hand_with_fingers_splayed_tone5\n'
+    'raised_hand_with_part_between_middle_and_ring_fingers\n'
+    'raised_hand_with_part_between_middle_and_ring_fingers_tone1\n'
+    'raised_hand_with_part_between_middle_and_ring_fingers_tone2\n'
+    'raised_hand_with_part_between_middle_and_ring_fingers_tone3\n'
+    'raised_hand_with_part_between_middle_and_ring_fingers_tone4\n'
+    'raised_hand_with_part_between_middle_and_ring_fingers_tone5\n'
+    'raised_hands\nraised_hands_tone1\nraised_hands_tone2\n'
+    'raised_hands_tone3\nraised_hands_tone4\nraised_hands_tone5\n'
+    'raising_hand\nraising_hand_tone1\nraising_hand_tone2\n'
+    'raising_hand_tone3\nraising_hand_tone4\nraising_hand_tone5\nram\n'
+    'ramen\nrat\nre\nrecord_button\nrecycle\nred_car\nred_circle\n'
+    'registered\nrelaxed\nrelieved\nreminder_ribbon\nrepeat\nrepeat_one\n'
+    'restroom\nreversed_hand_with_middle_finger_extended\n'
+    'reversed_hand_with_middle_finger_extended_tone1\n'
+    'reversed_hand_with_middle_finger_extended_tone2\n'
+    'reversed_hand_with_middle_finger_extended_tone3\n'
+    'reversed_hand_with_middle_finger_extended_tone4\n'
+    'reversed_hand_with_middle_finger_extended_tone5\nrevolving_hearts\n'
+    'rewind\nribbon\nrice\nrice_ball\nrice_cracker\nrice_scene\n'
+    'right_anger_bubble\nring\nro\nrobot\nrobot_face\nrocket\n'
+    'rolled_up_newspaper\nroller_coaster\nrolling_eyes\nrooster\nrose\n'
+    'rosette\nrotating_light\nround_pushpin\nrowboat\nrowboat_tone1\n'
+    'rowboat_tone2\nrowboat_tone3\nrowboat_tone4\nrowboat_tone5\nrs\nru\n'
+    'rugby_football\nrunner\nrunner_tone1\nrunner_tone2\nrunner_tone3\n'
+    'runner_tone4\nrunner_tone5\nrunning_shirt_with_sash\nrw\nsa\n'
+    'sagittarius\nsailboat\nsake\nsandal\nsanta\nsanta_tone1\nsanta_tone2\n'
+    'santa_tone3\nsanta_tone4\nsanta_tone5\nsatellite\nsatellite_orbital\n'
+    'satisfied\nsaudi\nsaudiarabia\nsaxophone\nsb\nsc\nscales\nschool\n'
+    'school_satchel\nscissors\nscorpion\nscorpius\nscream\nscream_cat\n'
+    'scroll\nsd\nse\nseat\nsecret\nsee_no_evil\nseedling\nseven\nsg\nsh\n'
+    'shamrock\nshaved_ice\nsheep\nshell\nshield\nshinto_shrine\nship\n'
+    'shirt\nshit\nshopping_bags\nshower\nsi\nsign_of_the_horns\n'
+    'sign_of_the_horns_tone1\nsign_of_the_horns_tone2\n'
+    'sign_of_the_horns_tone3\nsign_of_the_horns_tone4\n'
+    'sign_of_the_horns_tone5\nsignal_strength\nsix\nsix_pointed_star\nsj\n'
+    'sk\nskeleton\nski\nskier\nskull\nskull_and_crossbones\n'
+    'skull_crossbones\nsl\nsleeping\nsleeping_accommodation\nsleepy\n'
+    'sleuth_or_spy\nsleuth_or_spy_tone1\nsleuth_or_spy_tone2\n'
+    'sleuth_or_spy_tone3\nsleuth_or_spy_tone4\nsleuth_or_spy_tone5\n'
+    'slight_frown\nslight_smile\nslightly_frowning_face\n'
+    'slightly_smiling_face\nslot_machine\nsm\nsmall_airplane\n'
+    'small_blue_diamond\nsmall_orange_diamond\nsmall_red_triangle\n'
+    'small_red_triangle_down\nsmile\nsmile_cat\nsmiley\nsmiley_cat\n'
+    'smiling_imp\nsmirk\nsmirk_cat\nsmoking\nsn\nsnail\nsnake\n'
+    'snow_capped_mountain\nsnowboarder\nsnowflake\nsnowman\nsnowman2\nso\n'
+    'sob\nsoccer\nsoon\nsos\nsound\nspace_invader\nspades\nspaghetti\n'
+    'sparkle\nsparkler\nsparkles\nsparkling_heart\nspeak_no_evil\nspeaker\n'
+    'speaking_head\nspeaking_head_in_silhouette\nspeech_balloon\n'
+    'speedboat\nspider\nspider_web\nspiral_calendar_pad\nspiral_note_pad\n'
+    'sports_medal\nspy\nspy_tone1\nspy_tone2\nspy_tone3\nspy_tone4\n'
+    'spy_tone5\nsr\nss\nst\nstadium\nstar\nstar2\nstar_and_crescent\n'
+    'star_of_david\nstars\nstation\nstatue_of_liberty\nsteam_locomotive\n'
+    'stew\nstop_button\nstopwatch\nstraight_ruler\nstrawberry\n'
+    'stuck_out_tongue\nstuck_out_tongue_closed_eyes\n'
+    'stuck_out_tongue_winking_eye\nstudio_microphone\nsun_with_face\n'
+    'sunflower\nsunglasses\nsunny\nsunrise\nsunrise_over_mountains\n'
+    'surfer\nsurfer_tone1\nsurfer_tone2\nsurfer_tone3\nsurfer_tone4\n'
+    'surfer_tone5\nsushi\nsuspension_railway\nsv\nsweat\nsweat_drops\n'
+    'sweat_smile\nsweet_potato\nswimmer\nswimmer_tone1\nswimmer_tone2\n'
+    'swimmer_tone3\nswimmer_tone4\nswimmer_tone5\nsx\nsy\nsymbols\n'
+    'synagogue\nsyringe\nsz\nta\ntable_tennis\ntaco\ntada\ntanabata_tree\n'
+    'tangerine\ntaurus\ntaxi\ntc\ntd\ntea\ntelephone\ntelephone_receiver\n'
+    'telescope\nten\ntennis\ntent\ntf\ntg\nth\nthermometer\n'
+    'thermometer_face\nthinking\nthinking_face\nthought_balloon\nthree\n'
+    'three_button_mouse\nthumbdown\nthumbdown_tone1\nthumbdown_tone2\n'
+    'thumbdown_tone3\nthumbdown_tone4\nthumbdown_tone5\nthumbsdown\n'
+    'thumbsdown_tone1\nthumbsdown_tone2\nthumbsdown_tone3\n'
+    'thumbsdown_tone4\nthumbsdown_tone5\nthumbsup\nthumbsup_tone1\n'
+    'thumbsup_tone2\nthumbsup_tone3\nthumbsup_tone4\nthumbsup_tone5\n'
+    'thumbup\nthumbup_tone1\nthumbup_tone2\nthumbup_tone3\nthumbup_tone4\n'
+    'thumbup_tone5\nthunder_cloud_and_rain\nthunder_cloud_rain\nticket\n'
+    'tickets\ntiger\ntiger2\ntimer\ntimer_clock\ntired_face\ntj\ntk\ntl\n'
+    'tm\ntn\nto\ntoilet\ntokyo_tower\ntomato\ntongue\ntools\ntop\ntophat\n'
+    'tr\ntrack_next\ntrack_previous\ntrackball\ntractor\ntraffic_light\n'
+    'train\ntrain2\ntram\ntriangular_flag_on_post\ntriangular_ruler\n'
+    'trident\ntriumph\ntrolleybus\ntrophy\ntropical_drink\ntropical_fish\n'
+    'truck\ntrumpet\ntt\ntulip\nturkey\nturkmenistan\nturtle\ntuvalu\ntv\n'
+    'tw\ntwisted_rightwards_arrows\ntwo\ntwo_hearts\n'
+    'two_men_holding_hands\ntwo_women_holding_hands\ntz\nu5272\nu5408\n'
+    'u55b6\nu6307\nu6708\nu6709\nu6e80\nu7121\nu7533\nu7981\nu7a7a\nua\n'
+    'ug\num\numbrella\numbrella2\numbrella_on_ground\nunamused\nunderage\n'
+    'unicorn\nunicorn_face\nunlock\nup\nupside_down\nupside_down_face\n'
+    'urn\nus\nuy\nuz\nv\nv_tone1\nv_tone2\nv_tone3\nv_tone4\nv_tone5\nva\n'
+    'vc\nve\nvertical_traffic_light\nvg\nvhs\nvi\nvibration_mode\n'
+    'video_camera\nvideo_game\nviolin\nvirgo\nvn\nvolcano\nvolleyball\nvs\n'
+    'vu\nvulcan\nvulcan_tone1\nvulcan_tone2\nvulcan_tone3\nvulcan_tone4\n'
+    'vulcan_tone5\nwalking\nwalking_tone1\nwalking_tone2\nwalking_tone3\n'
+    'walking_tone4\nwalking_tone5\nwaning_crescent_moon\n'
+    'waning_gibbous_moon\nwarning\nwastebasket\nwatch\nwater_buffalo\n'
+    'watermelon\nwave\nwave_tone1\nwave_tone2\nwave_tone3\nwave_tone4\n'
+    'wave_tone5\nwaving_black_flag\nwaving_white_flag\nwavy_dash\n'
+    'waxing_crescent_moon\nwaxing_gibbous_moon\nwc\nweary\nwedding\n'
+    'weight_lifter\nweight_lifter_tone1\nweight_lifter_tone2\n'
+    'weight_lifter_tone3\nweight_lifter_tone4\nweight_lifter_tone5\nwf\n'
+    'whale\nwhale2\nwheel_of_dharma\nwheelchair\nwhite_check_mark\n'
+    'white_circle\nwhite_flower\nwhite_frowning_face\nwhite_large_square\n'
+    'white_medium_small_square\nwhite_medium_square\nwhite_small_square\n'
+    'white_square_button\nwhite_sun_behind_cloud\n'
+    'white_sun_behind_cloud_with_rain\nwhite_sun_cloud\n'
+    'white_sun_rain_cloud\nwhite_sun_small_cloud\n'
+    'white_sun_with_small_cloud\nwind_blowing_face\nwind_chime\n'
+    'wine_glass\nwink\nwolf\nwoman\nwoman_tone1\nwoman_tone2\nwoman_tone3\n'
+    'woman_tone4\nwoman_tone5\nwomans_clothes\nwomans_hat\nwomens\n'
+    'world_map\nworried\nworship_symbol\nwrench\nwriting_hand\n'
+    'writing_hand_tone1\nwriting_hand_tone2\nwriting_hand_tone3\n'
+    'writing_hand_tone4\nwriting_hand_tone5\nws\nx\nxk\nye\nyellow_heart\n'
+    'yen\nyin_yang\nyt\nyum\nza\nzap\nzero\nzipper_mouth\n'
+    'zipper_mouth_face\nzm\nzw\nzzz')
+
+UNICODE = (
+    '\u00a9\ufe0f\tcopyright\n\u00ae\ufe0f\tregistered\n'
+    '\u203c\ufe0f\tbangbang\n\u2049\ufe0f\tinterrobang\n'
+    '\u2139\ufe0f\tinformation_source\n\u2194\ufe0f\tleft_right_arrow\n'
+    '\u2195\ufe0f\tarrow_up_down\n\u2196\ufe0f\tarrow_upper_left\n'
+    '\u2197\ufe0f\tarrow_upper_right\n\u2198\ufe0f\tarrow_lower_right\n'
+    '\u2199\ufe0f\tarrow_lower_left\n'
+    '\u21a9\ufe0f\tleftwards_arrow_with_hook\n'
+    '\u21aa\ufe0f\tarrow_right_hook\n\u231a\twatch\n\u231b\thourglass\n'
+    '\u2328\ufe0f\tkeyboard\n\u23e9\tfast_forward\n\u23ea\trewind\n'
+    '\u23eb\tarrow_double_up\n\u23ec\tarrow_double_down\n'
+    '\u23f0\talarm_clock\n\u23f1\ufe0f\tstopwatch\n'
+    '\u23f2\ufe0f\ttimer_clock\n\u23f3\thourglass_flowing_sand\n'
+    '\u23f8\ufe0f\tdouble_vertical_bar\n\u23f9\ufe0f\tstop_button\n'
+    '\u23fa\ufe0f\trecord_button\n\u24c2\ufe0f\tm\n'
+    '\u25aa\ufe0f\tblack_small_square\n\u25ab\ufe0f\twhite_small_square\n'
+    '\u25b6\ufe0f\tarrow_forward\n\u25c0\ufe0f\tarrow_backward\n'
+    '\u25fb\ufe0f\twhite_medium_square\n\u25fc\ufe0f\tblack_medium_square\n'
+    '\u25fd\twhite_medium_small_square\n\u25fe\tblack_medium_small_square\n'
+    '\u2600\ufe0f\tsunny\n\u2601\ufe0f\tcloud\n\u2602\ufe0f\tumbrella\n'
+    '\u2603\ufe0f\tsnowman\n\u2604\ufe0f\tcomet\n\u260e\ufe0f\ttelephone\n'
+    '\u2611\ufe0f\tballot_box_with_check\n\u2615\tcoffee\n'
+    '\u2618\ufe0f\tshamrock\n\u261d\ufe0f\tpoint_up\n'
+    '\u261d\U0001f3fb\tpoint_up_tone1\n\u261d\U0001f3fc\tpoint_up_tone2\n'
+    '\u261d\U0001f3fd\tpoint_up_tone3\n\u261d\U0001f3fe\tpoint_up_tone4\n'
+    '\u261d\U0001f3ff\tpoint_up_tone5\n\u2620\ufe0f\tskull_and_crossbones\n'
+    '\u2622\ufe0f\tradioactive\n\u2623\ufe0f\tbiohazard\n'
+    '\u2626\ufe0f\torthodox_cross\n\u262a\ufe0f\tstar_and_crescent\n'
+    '\u262e\ufe0f\tpeace_symbol\n\u262f\ufe0f\tyin_yang\n'
+    '\u2638\ufe0f\twheel_of_dharma\n\u2639\ufe0f\twhite_frowning_face\n'
+    '\u263a\ufe0f\trelaxed\n\u2648\taries\n\u2649\ttaurus\n\u264a\tgemini\n'
+    '\u264b\tcancer\n\u264c\tleo\n\u264d\tvirgo\n\u264e\tlibra\n'
+    '\u264f\tscorpius\n\u2650\tsagittarius\n\u2651\tcapricorn\n'
+    '\u2652\taquarius\n\u2653\tpisces\n\u2660\ufe0f\tspades\n'
+    '\u2663\ufe0f\tclubs\n\u2665\ufe0f\thearts\n\u2666\ufe0f\tdiamonds\n'
+    '\u2668\ufe0f\thotsprings\n\u267b\ufe0f\trecycle\n\u267f\twheelchair\n'
+    '\u2692\ufe0f\thammer_and_pick\n\u2693\tanchor\n'
+    '\u2694\ufe0f\tcrossed_swords\n\u2696\ufe0f\tscales\n'
+    '\u2697\ufe0f\talembic\n\u2699\ufe0f\tgear\n\u269b\ufe0f\tatom_symbol\n'
+    '\u269c\ufe0f\tfleur-de-lis\n\u26a0\ufe0f\twarning\n\u26a1\tzap\n'
+    '\u26aa\twhite_circle\n\u26ab\tblack_circle\n\u26b0\ufe0f\tcoffin\n'
+    '\u26b1\ufe0f\tfuneral_urn\n\u26bd\tsoccer\n\u26be\tbaseball\n'
+    '\u26c5\tpartly_sunny\n\u26c8\ufe0f\tthunder_cloud_and_rain\n'
+    '\u26ce\tophiuchus\n\u26cf\ufe0f\tpick\n'
+    '\u26d1\ufe0f\thelmet_with_white_cross\n\u26d3\ufe0f\tchains\n'
+    '\u26d4\tno_entry\n\u26e9\ufe0f\tshinto_shrine\n\u26ea\tchurch\n'
+    '\u26f0\ufe0f\tmountain\n\u26f1\ufe0f\tumbrella_on_ground\n'
+    '\u26f2\tfountain\n\u26f3\tgolf\n\u26f4\ufe0f\tferry\n'
+    '\u26f5\tsailboat\n\u26f7\ufe0f\tskier\n\u26f8\ufe0f\tice_skate\n'
+    '\u26f9\ufe0f\tperson_with_ball\n'
+    '\u26f9\U0001f3fb\tperson_with_ball_tone1\n'
+    '\u26f9\U0001f3fc\tperson_with_ball_tone2\n'
+    '\u26f9\U0001f3fd\tperson_with_ball_tone3\n'
+    '\u26f9\U0001f3fe\tperson_with_ball_tone4\n'
+    '\u26f9\U0001f3ff\tperson_with_ball_tone5\n\u26fa\ttent\n'
+    '\u26fd\tfuelpump\n\u2702\ufe0f\tscissors\n\u2705\twhite_check_mark\n'
+    '\u2708\ufe0f\tairplane\n\u2709\ufe0f\tenvelope\n\u270a\tfist\n'
+    '\u270a\U0001f3fb\tfist_tone1\n\u270a\U0001f3fc\tfist_tone2\n'
+    '\u270a\U0001f3fd\tfist_tone3\n\u270a\U0001f3fe\tfist_tone4\n'
+    '\u270a\U0001f3ff\tfist_tone5\n\u270b\traised_hand\n'
+    '\u270b\U0001f3fb\traised_hand_tone1\n'
+    '\u270b\U0001f3fc\traised_hand_tone2\n'
+    '\u270b\U0001f3fd\traised_hand_tone3\n'
+    '\u270b\U0001f3fe\traised_hand_tone4\n'
+    '\u270b\U0001f3ff\traised_hand_tone5\n\u270c\ufe0f\tv\n'
+    '\u270c\U0001f3fb\tv_tone1\n\u270c\U0001f3fc\tv_tone2\n'
+    '\u270c\U0001f3fd\tv_tone3\n\u270c\U0001f3fe\tv_tone4\n'
+    '\u270c\U0001f3ff\tv_tone5\n\u270d\ufe0f\twriting_hand\n'
+    '\u270d\U0001f3fb\twriting_hand_tone1\n'
+    '\u270d\U0001f3fc\twriting_hand_tone2\n'
+    '\u270d\U0001f3fd\twriting_hand_tone3\n'
+    '\u270d\U0001f3fe\twriting_hand_tone4\n'
+    '\u270d\U0001f3ff\twriting_hand_tone5\n\u270f\ufe0f\tpencil2\n'
+    '\u2712\ufe0f\tblack_nib\n\u2714\ufe0f\theavy_check_mark\n'
+    '\u2716\ufe0f\theavy_multiplication_x\n\u271d\ufe0f\tlatin_cross\n'
+    '\u2721\ufe0f\tstar_of_david\n\u2728\tsparkles\n'
+    '\u2733\ufe0f\teight_spoked_asterisk\n'
+    '\u2734\ufe0f\teight_pointed_black_star\n\u2744\ufe0f\tsnowflake\n'
+    '\u2747\ufe0f\tsparkle\n\u274c\tx\n'
+    '\u274e\tnegative_squared_cross_mark\n\u2753\tquestion\n'
+    '\u2754\tgrey_question\n\u2755\tgrey_exclamation\n\u2757\texclamation\n'
+    '\u2763\ufe0f\theart_exclamation\n\u2764\ufe0f\theart\n'
+    '\u2795\theavy_plus_sign\n\u2796\theavy_minus_sign\n'
+    '\u2797\theavy_division_sign\n\u27a1\ufe0f\tarrow_right\n'
+    '\u27b0\tcurly_loop\n\u27bf\tloop\n\u2934\ufe0f\tarrow_heading_up\n'
+    '\u2935\ufe0f\tarrow_heading_down\n\u2b05\ufe0f\tarrow_left\n'
+    '\u2b06\ufe0f\tarrow_up\n\u2b07\ufe0f\tarrow_down\n'
+    '\u2b1b\tblack_large_square\n\u2b1c\twhite_large_square\n\u2b50\tstar\n'
+    '\u2b55\to\n\u3030\ufe0f\twavy_dash\n'
+    '\u303d\ufe0f\tpart_alternation_mark\n\u3297\ufe0f\tcongratulations\n'
+    '\u3299\ufe0f\tsecret\n\U0001f004\tmahjong\n\U0001f0cf\tblack_joker\n'
+    '\U0001f170\ufe0f\ta\n\U0001f171\ufe0f\tb\n\U0001f17e\ufe0f\to2\n'
+    '\U0001f17f\ufe0f\tparking\n\U0001f18e\tab\n\U0001f192\tcool\n'
+    '\U0001f193\tfree\n\U0001f195\tnew\n\U0001f197\tok\n\U0001f198\tsos\n'
+    '\U0001f199\tup\n\U0001f19a\tvs\n\U0001f1e6\U0001f1e8\tac\n'
+    '\U0001f1e6\U0001f1e9\tad\n\U0001f1e6\U0001f1ea\tae\n'
+    '\U0001f1e6\U0001f1eb\taf\n\U0001f1e6\U0001f1ec\tag\n'
+    '\U0001f1e6\U0001f1ee\tai\n\U0001f1e6\U0001f1f1\tal\n'
+    '\U0001f1e6\U0001f1f2\tam\n\U0001f1e6\U0001f1f4\tao\n'
+    '\U0001f1e6\U0001f1f6\taq\n\U0001f1e6\U0001f1f7\tar\n'
+    '\U0001f1e6\U0001f1f8\tas\n\U0001f1e6\U0001f1f9\tat\n'
+    '\U0001f1e6\U0001f1fa\tau\n\U0001f1e6\U0001f1fc\taw\n'
+    '\U0001f1e6\U0001f1fd\tax\n\U0001f1e6\U0001f1ff\taz\n'
+    '\U0001f1e7\U0001f1e6\tba\n\U0001f1e7\U0001f1e7\tbb\n'
+    '\U0001f1e7\U0001f1e9\tbd\n\U0001f1e7\U0001f1ea\tbe\n'
+    '\U0001f1e7\U0001f1eb\tbf\n\U0001f1e7\U0001f1ec\tbg\n'
+    '\U0001f1e7\U0001f1ed\tbh\n\U0001f1e7\U0001f1ee\tbi\n'
+    '\U0001f1e7\U0001f1ef\tbj\n\U0001f1e7\U0001f1f1\tbl\n'
+    '\U0001f1e7\U0001f1f2\tbm\n\U0001f1e7\U0001f1f3\tbn\n'
+    '\U0001f1e7\U0001f1f4\tbo\n\U0001f1e7\U0001f1f6\tbq\n'
+    '\U0001f1e7\U0001f1f7\tbr\n\U0001f1e7\U0001f1f8\tbs\n'
+    '\U0001f1e7\U0001f1f9\tbt\n\U0001f1e7\U0001f1fb\tbv\n'
+    '\U0001f1e7\U0001f1fc\tbw\n\U0001f1e7\U0001f1fe\tby\n'
+    '\U0001f1e7\U0001f1ff\tbz\n\U0001f1e8\U0001f1e6\tca\n'
+    '\U0001f1e8\U0001f1e8\tcc\n\U0001f1e8\U0001f1e9\tcd\n'
+    '\U0001f1e8\U0001f1eb\tcf\n\U0001f1e8\U0001f1ec\tcg\n'
+    '\U0001f1e8\U0001f1ed\tch\n\U0001f1e8\U0001f1ee\tci\n'
+    '\U0001f1e8\U0001f1f0\tck\n\U0001f1e8\U0001f1f1\tchile\n'
+    '\U0001f1e8\U0001f1f2\tcm\n\U0001f1e8\U0001f1f3\tcn\n'
+    '\U0001f1e8\U0001f1f4\tco\n\U0001f1e8\U0001f1f5\tcp\n'
+    '\U0001f1e8\U0001f1f7\tcr\n\U0001f1e8\U0001f1fa\tcu\n'
+    '\U0001f1e8\U0001f1fb\tcv\n\U0001f1e8\U0001f1fc\tcw\n'
+    '\U0001f1e8\U0001f1fd\tcx\n\U0001f1e8\U0001f1fe\tcy\n'
+    '\U0001f1e8\U0001f1ff\tcz\n\U0001f1e9\U0001f1ea\tde\n'
+    '\U0001f1e9\U0001f1ec\tdg\n\U0001f1e9\U0001f1ef\tdj\n'
+    '\U0001f1e9\U0001f1f0\tdk\n\U0001f1e9\U0001f1f2\tdm\n'
+    '\U0001f1e9\U0001f1f4\tdo\n\U0001f1e9\U0001f1ff\tdz\n'
+    '\U0001f1ea\U0001f1e6\tea\n\U0001f1ea\U0001f1e8\tec\n'
+    '\U0001f1ea\U0001f1ea\tee\n\U0001f1ea\U0001f1ec\teg\n'
+    '\U0001f1ea\U0001f1ed\teh\n\U0001f1ea\U0001f1f7\ter\n'
+    '\U0001f1ea\U0001f1f8\tes\n\U0001f1ea\U0001f1f9\tet\n'
+    '\U0001f1ea\U0001f1fa\teu\n\U0001f1eb\U0001f1ee\tfi\n'
+    '\U0001f1eb\U0001f1ef\tfj\n\U0001f1eb\U0001f1f0\tfk\n'
+    '\U0001f1eb\U0001f1f2\tflag_fm\n\U0001f1eb\U0001f1f4\tflag_fo\n'
+    '\U0001f1eb\U0001f1f7\tflag_fr\n\U0001f1ec\U0001f1e6\tflag_ga\n'
+    '\U0001f1ec\U0001f1e7\tflag_gb\n\U0001f1ec\U0001f1e9\tflag_gd\n'
+    '\U0001f1ec\U0001f1ea\tflag_ge\n\U0001f1ec\U0001f1eb\tflag_gf\n'
+    '\U0001f1ec\U0001f1ec\tflag_gg\n\U0001f1ec\U0001f1ed\tflag_gh\n'
+    '\U0001f1ec\U0001f1ee\tflag_gi\n\U0001f1ec\U0001f1f1\tflag_gl\n'
+    '\U0001f1ec\U0001f1f2\tflag_gm\n\U0001f1ec\U0001f1f3\tflag_gn\n'
+    '\U0001f1ec\U0001f1f5\tflag_gp\n\U0001f1ec\U0001f1f6\tflag_gq\n'
+    '\U0001f1ec\U0001f1f7\tflag_gr\n\U0001f1ec\U0001f1f8\tflag_gs\n'
+    '\U0001f1ec\U0001f1f9\tflag_gt\n\U0001f1ec\U0001f1fa\tflag_gu\n'
+    '\U0001f1ec\U0001f1fc\tflag_gw\n\U0001f1ec\U0001f1fe\tflag_gy\n'
+    '\U0001f1ed\U0001f1f0\tflag_hk\n\U0001f1ed\U0001f1f2\tflag_hm\n'
+    '\U0001f1ed\U0001f1f3\tflag_hn\n\U0001f1ed\U0001f1f7\tflag_hr\n'
+    '\U0001f1ed\U0001f1f9\tflag_ht\n\U0001f1ed\U0001f1fa\tflag_hu\n'
+    '\U0001f1ee\U0001f1e8\tflag_ic\n\U0001f1ee\U0001f1e9\tflag_id\n'
+    '\U0001f1ee\U0001f1ea\tflag_ie\n\U0001f1ee\U0001f1f1\tflag_il\n'
+    '\U0001f1ee\U0001f1f2\tflag_im\n\U0001f1ee\U0001f1f3\tflag_in\n'
+    '\U0001f1ee\U0001f1f4\tflag_io\n\U0001f1ee\U0001f1f6\tflag_iq\n'
+    '\U0001f1ee\U0001f1f7\tflag_ir\n\U0001f1ee\U0001f1f8\tflag_is\n'
+    '\U0001f1ee\U0001f1f9\tflag_it\n\U0001f1ef\U0001f1ea\tflag_je\n'
+    '\U0001f1ef\U0001f1f2\tflag_jm\n\U0001f1ef\U0001f1f4\tflag_jo\n'
+    '\U0001f1ef\U0001f1f5\tflag_jp\n\U0001f1f0\U0001f1ea\tflag_ke\n'
+    '\U0001f1f0\U0001f1ec\tflag_kg\n\U0001f1f0\U0001f1ed\tflag_kh\n'
+    '\U0001f1f0\U0001f1ee\tflag_ki\n\U0001f1f0\U0001f1f2\tflag_km\n'
+    '\U0001f1f0\U0001f1f3\tflag_kn\n\U0001f1f0\U0001f1f5\tflag_kp\n'
+    '\U0001f1f0\U0001f1f7\tflag_kr\n\U0001f1f0\U0001f1fc\tflag_kw\n'
+    '\U0001f1f0\U0001f1fe\tflag_ky\n\U0001f1f0\U0001f1ff\tflag_kz\n'
+    '\U0001f1f1\U0001f1e6\tflag_la\n\U0001f1f1\U0001f1e7\tflag_lb\n'
+    '\U0001f1f1\U0001f1e8\tflag_lc\n\U0001f1f1\U0001f1ee\tflag_li\n'
+    '\U0001f1f1\U0001f1f0\tflag_lk\n\U0001f1f1\U0001f1f7\tflag_lr\n'
+    '\U0001f1f1\U0001f1f8\tflag_ls\n\U0001f1f1\U0001f1f9\tflag_lt\n'
+    '\U0001f1f1\U0001f1fa\tflag_lu\n\U0001f1f1\U0001f1fb\tflag_lv\n'
+    '\U0001f1f1\U0001f1fe\tflag_ly\n\U0001f1f2\U0001f1e6\tflag_ma\n'
+    '\U0001f1f2\U0001f1e8\tflag_mc\n\U0001f1f2\U0001f1e9\tflag_md\n'
+    '\U0001f1f2\U0001f1ea\tflag_me\n\U0001f1f2\U0001f1eb\tflag_mf\n'
+    '\U0001f1f2\U0001f1ec\tflag_mg\n\U0001f1f2\U0001f1ed\tflag_mh\n'
+    '\U0001f1f2\U0001f1f0\tflag_mk\n\U0001f1f2\U0001f1f1\tflag_ml\n'
+    '\U0001f1f2\U0001f1f2\tflag_mm\n\U0001f1f2\U0001f1f3\tflag_mn\n'
+    '\U0001f1f2\U0001f1f4\tflag_mo\n\U0001f1f2\U0001f1f5\tflag_mp\n'
+    '\U0001f1f2\U0001f1f6\tflag_mq\n\U0001f1f2\U0001f1f7\tflag_mr\n'
+    '\U0001f1f2\U0001f1f8\tflag_ms\n\U0001f1f2\U0001f1f9\tflag_mt\n'
+    '\U0001f1f2\U0001f1fa\tflag_mu\n\U0001f1f2\U0001f1fb\tflag_mv\n'
+    '\U0001f1f2\U0001f1fc\tflag_mw\n\U0001f1f2\U0001f1fd\tflag_mx\n'
+    '\U0001f1f2\U0001f1fe\tflag_my\n\U0001f1f2\U0001f1ff\tflag_mz\n'
+    '\U0001f1f3\U0001f1e6\tflag_na\n\U0001f1f3\U0001f1e8\tflag_nc\n'
+    '\U0001f1f3\U0001f1ea\tflag_ne\n\U0001f1f3\U0001f1eb\tflag_nf\n'
+    '\U0001f1f3\U0001f1ec\tflag_ng\n\U0001f1f3\U0001f1ee\tflag_ni\n'
+    '\U0001f1f3\U0001f1f1\tflag_nl\n\U0001f1f3\U0001f1f4\tflag_no\n'
+    '\U0001f1f3\U0001f1f5\tflag_np\n\U0001f1f3\U0001f1f7\tflag_nr\n'
+    '\U0001f1f3\U0001f1fa\tflag_nu\n\U0001f1f3\U0001f1ff\tflag_nz\n'
+    '\U0001f1f4\U0001f1f2\tflag_om\n\U0001f1f5\U0001f1e6\tflag_pa\n'
+    '\U0001f1f5\U0001f1ea\tflag_pe\n\U0001f1f5\U0001f1eb\tflag_pf\n'
+    '\U0001f1f5\U0001f1ec\tflag_pg\n\U0001f1f5\U0001f1ed\tflag_ph\n'
+    '\U0001f1f5\U0001f1f0\tflag_pk\n\U0001f1f5\U0001f1f1\tflag_pl\n'
+    '\U0001f1f5\U0001f1f2\tflag_pm\n\U0001f1f5\U0001f1f3\tflag_pn\n'
+    '\U0001f1f5\U0001f1f7\tflag_pr\n\U0001f1f5\U0001f1f8\tflag_ps\n'
+    '\U0001f1f5\U0001f1f9\tflag_pt\n\U0001f1f5\U0001f1fc\tflag_pw\n'
+    '\U0001f1f5\U0001f1fe\tflag_py\n\U0001f1f6\U0001f1e6\tflag_qa\n'
+    '\U0001f1f7\U0001f1ea\tflag_re\n\U0001f1f7\U0001f1f4\tflag_ro\n'
+    '\U0001f1f7\U0001f1f8\tflag_rs\n\U0001f1f7\U0001f1fa\tflag_ru\n'
+    '\U0001f1f7\U0001f1fc\tflag_rw\n\U0001f1f8\U0001f1e6\tflag_sa\n'
+    '\U0001f1f8\U0001f1e7\tflag_sb\n\U0001f1f8\U0001f1e8\tflag_sc\n'
+    '\U0001f1f8\U0001f1e9\tflag_sd\n\U0001f1f8\U0001f1ea\tflag_se\n'
+    '\U0001f1f8\U0001f1ec\tflag_sg\n\U0001f1f8\U0001f1ed\tflag_sh\n'
+    '\U0001f1f8\U0001f1ee\tflag_si\n\U0001f1f8\U0001f1ef\tflag_sj\n'
+    '\U0001f1f8\U0001f1f0\tflag_sk\n\U0001f1f8\U0001f1f1\tflag_sl\n'
+    '\U0001f1f8\U0001f1f2\tflag_sm\n\U0001f1f8\U0001f1f3\tflag_sn\n'
+    '\U0001f1f8\U0001f1f4\tflag_so\n\U0001f1f8\U0001f1f7\tflag_sr\n'
+    '\U0001f1f8\U0001f1f8\tflag_ss\n\U0001f1f8\U0001f1f9\tflag_st\n'
+    '\U0001f1f8\U0001f1fb\tflag_sv\n\U0001f1f8\U0001f1fd\tflag_sx\n'
+    '\U0001f1f8\U0001f1fe\tflag_sy\n\U0001f1f8\U0001f1ff\tflag_sz\n'
+    '\U0001f1f9\U0001f1e6\tflag_ta\n\U0001f1f9\U0001f1e8\tflag_tc\n'
+    '\U0001f1f9\U0001f1e9\tflag_td\n\U0001f1f9\U0001f1eb\tflag_tf\n'
+    '\U0001f1f9\U0001f1ec\tflag_tg\n\U0001f1f9\U0001f1ed\tflag_th\n'
+    '\U0001f1f9\U0001f1ef\tflag_tj\n\U0001f1f9\U0001f1f0\tflag_tk\n'
+    '\U0001f1f9\U0001f1f1\tflag_tl\n\U0001f1f9\U0001f1f2\tflag_tm\n'
+    '\U0001f1f9\U0001f1f3\tflag_tn\n\U0001f1f9\U0001f1f4\tflag_to\n'
+    '\U0001f1f9\U0001f1f7\tflag_tr\n\U0001f1f9\U0001f1f9\tflag_tt\n'
+    '\U0001f1f9\U0001f1fb\tflag_tv\n\U0001f1f9\U0001f1fc\tflag_tw\n'
+    '\U0001f1f9\U0001f1ff\tflag_tz\n\U0001f1fa\U0001f1e6\tflag_ua\n'
+    '\U0001f1fa\U0001f1ec\tflag_ug\n\U0001f1fa\U0001f1f2\tflag_um\n'
+    '\U0001f1fa\U0001f1f8\tflag_us\n\U0001f1fa\U0001f1fe\tflag_uy\n'
+    '\U0001f1fa\U0001f1ff\tflag_uz\n\U0001f1fb\U0001f1e6\tflag_va\n'
+    '\U0001f1fb\U0001f1e8\tflag_vc\n\U0001f1fb\U0001f1ea\tflag_ve\n'
+    '\U0001f1fb\U0001f1ec\tflag_vg\n\U0001f1fb\U0001f1ee\tflag_vi\n'
+    '\U0001f1fb\U0001f1f3\tflag_vn\n\U0001f1fb\U0001f1fa\tflag_vu\n'
+    '\U0001f1fc\U0001f1eb\tflag_wf\n\U0001f1fc\U0001f1f8\tflag_ws\n'
+    '\U0001f1fd\U0001f1f0\tflag_xk\n\U0001f1fe\U0001f1ea\tflag_ye\n'
+    '\U0001f1fe\U0001f1f9\tflag_yt\n\U0001f1ff\U0001f1e6\tflag_za\n'
+    '\U0001f1ff\U0001f1f2\tflag_zm\n\U0001f1ff\U0001f1fc\tflag_zw\n'
+    '\U0001f201\tkoko\n\U0001f21a\tu7121\n\U0001f22f\tu6307\n'
+    '\U0001f232\tu7981\n\U0001f233\tu7a7a\n\U0001f234\tu5408\n'
+    '\U0001f235\tu6e80\n\U0001f236\tu6709\n\U0001f237\ufe0f\tu6708\n'
+    '\U0001f238\tu7533\n\U0001f239\tu5272\n\U0001f23a\tu55b6\n'
+    '\U0001f250\tideograph_advantage\n\U0001f251\taccept\n'
+    '\U0001f300\tcyclone\n\U0001f301\tfoggy\n\U0001f302\tclosed_umbrella\n'
+    '\U0001f303\tnight_with_stars\n\U0001f304\tsunrise_over_mountains\n'
+    '\U0001f305\tsunrise\n\U0001f306\tcity_sunset\n'
+    '\U0001f307\tcity_sunrise\n\U0001f308\trainbow\n'
+    '\U0001f309\tbridge_at_night\n\U0001f30a\tocean\n\U0001f30b\tvolcano\n'
+    '\U0001f30c\tmilky_way\n\U0001f30d\tearth_africa\n'
+    '\U0001f30e\tearth_americas\n\U0001f30f\tearth_asia\n'
+    '\U0001f310\tglobe_with_meridians\n\U0001f311\tnew_moon\n'
+    '\U0001f312\twaxing_crescent_moon\n\U0001f313\tfirst_quarter_moon\n'
+    '\U0001f314\twaxing_gibbous_moon\n\U0001f315\tfull_moon\n'
+    '\U0001f316\twaning_gibbous_moon\n\U0001f317\tlast_quarter_moon\n'
+    '\U0001f318\twaning_crescent_moon\n\U0001f319\tcrescent_moon\n'
+    '\U0001f31a\tnew_moon_with_face\n'
+    '\U0001f31b\tfirst_quarter_moon_with_face\n'
+    '\U0001f31c\tlast_quarter_moon_with_face\n'
+    '\U0001f31d\tfull_moon_with_face\n\U0001f31e\tsun_with_face\n'
+    '\U0001f31f\tstar2\n\U0001f320\tstars\n\U0001f321\ufe0f\tthermometer\n'
+    '\U0001f324\ufe0f\twhite_sun_with_small_cloud\n'
+    '\U0001f325\ufe0f\twhite_sun_behind_cloud\n'
+    '\U0001f326\ufe0f\twhite_sun_behind_cloud_with_rain\n'
+    '\U0001f327\ufe0f\tcloud_with_rain\n\U0001f328\ufe0f\tcloud_with_snow\n'
+    '\U0001f329\ufe0f\tcloud_with_lightning\n'
+    '\U0001f32a\ufe0f\tcloud_with_tornado\n\U0001f32b\ufe0f\tfog\n'
+    '\U0001f32c\ufe0f\twind_blowing_face\n\U0001f32d\thot_dog\n'
+    '\U0001f32e\ttaco\n\U0001f32f\tburrito\n\U0001f330\tchestnut\n'
+    '\U0001f331\tseedling\n\U0001f332\tevergreen_tree\n'
+    '\U0001f333\tdeciduous_tree\n\U0001f334\tpalm_tree\n'
+    '\U0001f335\tcactus\n\U0001f336\ufe0f\thot_pepper\n\U0001f337\ttulip\n'
+    '\U0001f338\tcherry_blossom\n\U0001f339\trose\n\U0001f33a\thibiscus\n'
+    '\U0001f33b\tsunflower\n\U0001f33c\tblossom\n\U0001f33d\tcorn\n'
+    '\U0001f33e\tear_of_rice\n\U0001f33f\therb\n'
+    '\U0001f340\tfour_leaf_clover\n\U0001f341\tmaple_leaf\n'
+    '\U0001f342\tfallen_leaf\n\U0001f343\tleaves\n\U0001f344\tmushroom\n'
+    '\U0001f345\ttomato\n\U0001f346\teggplant\n\U0001f347\tgrapes\n'
+    '\U0001f348\tmelon\n\U0001f349\twatermelon\n\U0001f34a\ttangerine\n'
+    '\U0001f34b\tlemon\n\U0001f34c\tbanana\n\U0001f34d\tpineapple\n'
+    '\U0001f34e\tapple\n\U0001f34f\tgreen_apple\n\U0001f350\tpear\n'
+    '\U0001f351\tpeach\n\U0001f352\tcherries\n\U0001f353\tstrawberry\n'
+    '\U0001f354\thamburger\n\U0001f355\tpizza\n\U0001f356\tmeat_on_bone\n'
+    '\U0001f357\tpoultry_leg\n\U0001f358\trice_cracker\n'
+    '\U0001f359\trice_ball\n\U0001f35a\trice\n\U0001f35b\tcurry\n'
+    '\U0001f35c\tramen\n\U0001f35d\tspaghetti\n\U0001f35e\tbread\n'
+    '\U0001f35f\tfries\n\U0001f360\tsweet_potato\n\U0001f361\tdango\n'
+    '\U0001f362\toden\n\U0001f363\tsushi\n\U0001f364\tfried_shrimp\n'
+    '\U0001f365\tfish_cake\n\U0001f366\ticecream\n\U0001f367\tshaved_ice\n'
+    '\U0001f368\tice_cream\n\U0001f369\tdoughnut\n\U0001f36a\tcookie\n'
+    '\U0001f36b\tchocolate_bar\n\U0001f36c\tcandy\n\U0001f36d\tlollipop\n'
+    '\U0001f36e\tcustard\n\U0001f36f\thoney_pot\n\U0001f370\tcake\n'
+    '\U0001f371\tbento\n\U0001f372\tstew\n\U0001f373\tegg\n'
+    '\U0001f374\tfork_and_knife\n\U0001f375\ttea\n\U0001f376\tsake\n'
+    '\U0001f377\twine_glass\n\U0001f378\tcocktail\n'
+    '\U0001f379\ttropical_drink\n\U0001f37a\tbeer\n\U0001f37b\tbeers\n'
+    '\U0001f37c\tbaby_bottle\n\U0001f37d\ufe0f\tfork_and_knife_with_plate\n'
+    '\U0001f37e\tbottle_with_popping_cork\n\U0001f37f\tpopcorn\n'
+    '\U0001f380\tribbon\n\U0001f381\tgift\n\U0001f382\tbirthday\n'
+    '\U0001f383\tjack_o_lantern\n\U0001f384\tchristmas_tree\n'
+    '\U0001f385\tsanta\n\U0001f385\U0001f3fb\tsanta_tone1\n'
+    '\U0001f385\U0001f3fc\tsanta_tone2\n\U0001f385\U0001f3fd\tsanta_tone3\n'
+    '\U0001f385\U0001f3fe\tsanta_tone4\n\U0001f385\U0001f3ff\tsanta_tone5\n'
+    '\U0001f386\tfireworks\n\U0001f387\tsparkler\n\U0001f388\tballoon\n'
+    '\U0001f389\ttada\n\U0001f38a\tconfetti_ball\n'
+    '\U0001f38b\ttanabata_tree\n\U0001f38c\tcrossed_flags\n'
+    '\U0001f38d\tbamboo\n\U0001f38e\tdolls\n\U0001f38f\tflags\n'
+    '\U0001f390\twind_chime\n\U0001f391\trice_scene\n'
+    '\U0001f392\tschool_satchel\n\U0001f393\tmortar_board\n'
+    '\U0001f396\ufe0f\tmilitary_medal\n\U0001f397\ufe0f\treminder_ribbon\n'
+    '\U0001f399\ufe0f\tstudio_microphone\n\U0001f39a\ufe0f\tlevel_slider\n'
+    '\U0001f39b\ufe0f\tcontrol_knobs\n\U0001f39e\ufe0f\tfilm_frames\n'
+    '\U0001f39f\ufe0f\tadmission_tickets\n\U0001f3a0\tcarousel_horse\n'
+    '\U0001f3a1\tferris_wheel\n\U0001f3a2\troller_coaster\n'
+    '\U0001f3a3\tfishing_pole_and_fish\n\U0001f3a4\tmicrophone\n'
+    '\U0001f3a5\tmovie_camera\n\U0001f3a6\tcinema\n\U0001f3a7\theadphones\n'
+    '\U0001f3a8\tart\n\U0001f3a9\ttophat\n\U0001f3aa\tcircus_tent\n'
+    '\U0001f3ab\tticket\n\U0001f3ac\tclapper\n\U0001f3ad\tperforming_arts\n'
+    '\U0001f3ae\tvideo_game\n\U0001f3af\tdart\n\U0001f3b0\tslot_machine\n'
+    '\U0001f3b1\t8ball\n\U0001f3b2\tgame_die\n\U0001f3b3\tbowling\n'
+    '\U0001f3b4\tflower_playing_cards\n\U0001f3b5\tmusical_note\n'
+    '\U0001f3b6\tnotes\n\U0001f3b7\tsaxophone\n\U0001f3b8\tguitar\n'
+    '\U0001f3b9\tmusical_keyboard\n\U0001f3ba\ttrumpet\n'
+    '\U0001f3bb\tviolin\n\U0001f3bc\tmusical_score\n'
+    '\U0001f3bd\trunning_shirt_with_sash\n\U0001f3be\ttennis\n'
+    '\U0001f3bf\tski\n\U0001f3c0\tbasketball\n\U0001f3c1\tcheckered_flag\n'
+    '\U0001f3c2\tsnowboarder\n\U0001f3c3\trunner\n'
+    '\U0001f3c3\U0001f3fb\trunner_tone1\n'
+    '\U0001f3c3\U0001f3fc\trunner_tone2\n'
+    '\U0001f3c3\U0001f3fd\trunner_tone3\n'
+    '\U0001f3c3\U0001f3fe\trunner_tone4\n'
+    '\U0001f3c3\U0001f3ff\trunner_tone5\n\U0001f3c4\tsurfer\n'
+    '\U0001f3c4\U0001f3fb\tsurfer_tone1\n'
+    '\U0001f3c4\U0001f3fc\tsurfer_tone2\n'
+    '\U0001f3c4\U0001f3fd\tsurfer_tone3\n'
+    '\U0001f3c4\U0001f3fe\tsurfer_tone4\n'
+    '\U0001f3c4\U0001f3ff\tsurfer_tone5\n\U0001f3c5\tsports_medal\n'
+    '\U0001f3c6\ttrophy\n\U0001f3c7\thorse_racing\n'
+    '\U0001f3c7\U0001f3fb\thorse_racing_tone1\n'
+    '\U0001f3c7\U0001f3fc\thorse_racing_tone2\n'
+    '\U0001f3c7\U0001f3fd\thorse_racing_tone3\n'
+    '\U0001f3c7\U0001f3fe\thorse_racing_tone4\n'
+    '\U0001f3c7\U0001f3ff\thorse_racing_tone5\n\U0001f3c8\tfootball\n'
+    '\U0001f3c9\trugby_football\n\U0001f3ca\tswimmer\n'
+    '\U0001f3ca\U0001f3fb\tswimmer_tone1\n'
+    '\U0001f3ca\U0001f3fc\tswimmer_tone2\n'
+    '\U0001f3ca\U0001f3fd\tswimmer_tone3\n'
+    '\U0001f3ca\U0001f3fe\tswimmer_tone4\n'
+    '\U0001f3ca\U0001f3ff\tswimmer_tone5\n\U0001f3cb\ufe0f\tweight_lifter\n'
+    '\U0001f3cb\U0001f3fb\tweight_lifter_tone1\n'
+    '\U0001f3cb\U0001f3fc\tweight_lifter_tone2\n'
+    '\U0001f3cb\U0001f3fd\tweight_lifter_tone3\n'
+    '\U0001f3cb\U0001f3fe\tweight_lifter_tone4\n'
+    '\U0001f3cb\U0001f3ff\tweight_lifter_tone5\n\U0001f3cc\ufe0f\tgolfer\n'
+    '\U0001f3cd\ufe0f\tmotorcycle\n\U0001f3ce\ufe0f\tracing_car\n'
+    '\U0001f3d0\tvolleyball\n\U0001f3d1\tfield_hockey\n'
+    '\U0001f3d3\tping_pong\n\U0001f3d4\ufe0f\tmountain_snow\n'
+    '\U0001f3d5\ufe0f\tcamping\n\U0001f3d6\ufe0f\tbeach_umbrella\n'
+    '\U0001f3d7\ufe0f\tbuilding_construction\n'
+    '\U0001f3d8\ufe0f\thouse_buildings\n\U0001f3d9\ufe0f\tcityscape\n'
+    '\U0001f3da\ufe0f\tderelict_house_building\n'
+    '\U0001f3db\ufe0f\tclassical_building\n\U0001f3dc\ufe0f\tdesert\n'
+    '\U0001f3dd\ufe0f\tdesert_island\n\U0001f3de\ufe0f\tnational_park\n'
+    '\U0001f3df\ufe0f\tstadium\n\U0001f3e0\thouse\n'
+    '\U0001f3e1\thouse_with_garden\n\U0001f3e2\toffice\n'
+    '\U0001f3e3\tpost_office\n\U0001f3e4\teuropean_post_office\n'
+    '\U0001f3e5\thospital\n\U0001f3e6\tbank\n\U0001f3e7\tatm\n'
+    '\U0001f3e8\thotel\n\U0001f3e9\tlove_hotel\n'
+    '\U0001f3ea\tconvenience_store\n\U0001f3eb\tschool\n'
+    '\U0001f3ec\tdepartment_store\n\U0001f3ed\tfactory\n'
+    '\U0001f3ee\tizakaya_lantern\n\U0001f3ef\tjapanese_castle\n'
+    '\U0001f3f0\teuropean_castle\n\U0001f3f3\ufe0f\twaving_white_flag\n'
+    '\U0001f3f4\twaving_black_flag\n\U0001f3f5\ufe0f\trosette\n'
+    '\U0001f3f7\ufe0f\tlabel\n\U0001f3f8\tbadminton\n'
+    '\U0001f3f9\tbow_and_arrow\n\U0001f3fa\tamphora\n\U0001f400\trat\n'
+    '\U0001f401\tmouse\n\U0001f402\tox\n\U0001f403\twater_buffalo\n'
+    '\U0001f404\tcow\n\U0001f405\ttiger\n\U0001f406\tleopard\n'
+    '\U0001f407\trabbit\n\U0001f408\tcat\n\U0001f409\tdragon\n'
+    '\U0001f40a\tcrocodile\n\U0001f40b\twhale2\n\U0001f40c\tsnail\n'
+    '\U0001f40d\tsnake\n\U0001f40e\thorse\n\U0001f40f\tram\n'
+    '\U0001f410\tgoat\n\U0001f411\tsheep\n\U0001f412\tmonkey\n'
+    '\U0001f413\trooster\n\U0001f414\tchicken\n\U0001f415\tdog\n'
+    '\U0001f416\tpig\n\U0001f417\tboar\n\U0001f418\telephant\n'
+    '\U0001f419\toctopus\n\U0001f41a\tshell\n\U0001f41b\tbug\n'
+    '\U0001f41c\tant\n\U0001f41d\tbee\n\U0001f41f\tfish\n'
+    '\U0001f420\ttropical_fish\n\U0001f421\tblowfish\n\U0001f422\tturtle\n'
+    '\U0001f423\thatching_chick\n\U0001f424\tbaby_chick\n'
+    '\U0001f425\thatched_chick\n\U0001f426\tbird\n\U0001f427\tpenguin\n'
+    '\U0001f428\tkoala\n\U0001f429\tpoodle\n\U0001f42a\tcamel\n'
+    '\U0001f42c\tdolphin\n\U0001f432\tdragon_face\n\U0001f433\twhale\n'
+    '\U0001f435\tmonkey_face\n\U0001f438\tfrog\n\U0001f439\thamster\n'
+    '\U0001f43a\twolf\n\U0001f43b\tbear\n\U0001f43c\tpanda_face\n'
+    '\U0001f43d\tpig_nose\n\U0001f43e\tfeet\n\U0001f43f\ufe0f\tchipmunk\n'
+    '\U0001f440\teyes\n\U0001f441\u200d\U0001f5e8\teye_in_speech_bubble\n'
+    '\U0001f441\ufe0f\teye\n'
+    '\U0001f441\ufe0f\u200d\U0001f5e8\ufe0f\teye_in_speech_bubble\n'
+    '\U0001f442\tear\n\U0001f442\U0001f3fb\tear_tone1\n'
+    '\U0001f442\U0001f3fc\tear_tone2\n\U0001f442\U0001f3fd\tear_tone3\n'
+    '\U0001f442\U0001f3fe\tear_tone4\n\U0001f442\U0001f3ff\tear_tone5\n'
+    '\U0001f443\tnose\n\U0001f443\U0001f3fb\tnose_tone1\n'
+    '\U0001f443\U0001f3fc\tnose_tone2\n\U0001f443\U0001f3fd\tnose_tone3\n'
+    '\U0001f443\U0001f3fe\tnose_tone4\n\U0001f443\U0001f3ff\tnose_tone5\n'
+    '\U0001f444\tlips\n\U0001f445\ttongue\n\U0001f446\tpoint_up_2\n'
+    '\U0001f446\U0001f3fb\tpoint_up_2_tone1\n'
+    '\U0001f446\U0001f3fc\tpoint_up_2_tone2\n'
+    '\U0001f446\U0001f3fd\tpoint_up_2_tone3\n'
+    '\U0001f446\U0001f3fe\tpoint_up_2_tone4\n'
+    '\U0001f446\U0001f3ff\tpoint_up_2_tone5\n\U0001f447\tpoint_down\n'
+    '\U0001f447\U0001f3fb\tpoint_down_tone1\n'
+    '\U0001f447\U0001f3fc\tpoint_down_tone2\n'
+    '\U0001f447\U0001f3fd\tpoint_down_tone3\n'
+    '\U0001f447\U0001f3fe\tpoint_down_tone4\n'
+    '\U0001f447\U0001f3ff\tpoint_down_tone5\n\U0001f448\tpoint_left\n'
+    '\U0001f448\U0001f3fb\tpoint_left_tone1\n'
+    '\U0001f448\U0001f3fc\tpoint_left_tone2\n'
+    '\U0001f448\U0001f3fd\tpoint_left_tone3\n'
+    '\U0001f448\U0001f3fe\tpoint_left_tone4\n'
+    '\U0001f448\U0001f3ff\tpoint_left_tone5\n\U0001f449\tpoint_right\n'
+    '\U0001f449\U0001f3fb\tpoint_right_tone1\n'
+    '\U0001f449\U0001f3fc\tpoint_right_tone2\n'
+    '\U0001f449\U0001f3fd\tpoint_right_tone3\n'
+    '\U0001f449\U0001f3fe\tpoint_right_tone4\n'
+    '\U0001f449\U0001f3ff\tpoint_right_tone5\n\U0001f44a\tpunch\n'
+    '\U0001f44a\U0001f3fb\tpunch_tone1\n\U0001f44a\U0001f3fc\tpunch_tone2\n'
+    '\U0001f44a\U0001f3fd\tpunch_tone3\n\U0001f44a\U0001f3fe\tpunch_tone4\n'
+    '\U0001f44a\U0001f3ff\tpunch_tone5\n\U0001f44b\twave\n'
+    '\U0001f44b\U0001f3fb\twave_tone1\n\U0001f44b\U0001f3fc\twave_tone2\n'
+    '\U0001f44b\U0001f3fd\twave_tone3\n\U0001f44b\U0001f3fe\twave_tone4\n'
+    '\U0001f44b\U0001f3ff\twave_tone5\n\U0001f44c\tok_hand\n'
+    '\U0001f44c\U0001f3fb\tok_hand_tone1\n'
+    '\U0001f44c\U0001f3fc\tok_hand_tone2\n'
+    '\U0001f44c\U0001f3fd\tok_hand_tone3\n'
+    '\U0001f44c\U0001f3fe\tok_hand_tone4\n'
+    '\U0001f44c\U0001f3ff\tok_hand_tone5\n\U0001f44d\t+1\n'
+    '\U0001f44d\U0001f3fb\t+1_tone1\n\U0001f44d\U0001f3fc\t+1_tone2\n'
+    '\U0001f44d\U0001f3fd\t+1_tone3\n\U0001f44d\U0001f3fe\t+1_tone4\n'
+    '\U0001f44d\U0001f3ff\t+1_tone5\n\U0001f44e\t-1\n'
+    '\U0001f44e\U0001f3fb\t-1_tone1\n\U0001f44e\U0001f3fc\t-1_tone2\n'
+    '\U0001f44e\U0001f3fd\t-1_tone3\n\U0001f44e\U0001f3fe\t-1_tone4\n'
+    '\U0001f44e\U0001f3ff\t-1_tone5\n\U0001f44f\tclap\n'
+    '\U0001f44f\U0001f3fb\tclap_tone1\n\U0001f44f\U0001f3fc\tclap_tone2\n'
+    '\U0001f44f\U0001f3fd\tclap_tone3\n\U0001f44f\U0001f3fe\tclap_tone4\n'
+    '\U0001f44f\U0001f3ff\tclap_tone5\n\U0001f450\topen_hands\n'
+    '\U0001f450\U0001f3fb\topen_hands_tone1\n'
+    '\U0001f450\U0001f3fc\topen_hands_tone2\n'
+    '\U0001f450\U0001f3fd\topen_hands_tone3\n'
+    '\U0001f450\U0001f3fe\topen_hands_tone4\n'
+    '\U0001f450\U0001f3ff\topen_hands_tone5\n\U0001f451\tcrown\n'
+    '\U0001f452\twomans_hat\n\U0001f453\teyeglasses\n\U0001f454\tnecktie\n'
+    '\U0001f455\tshirt\n\U0001f456\tjeans\n\U0001f457\tdress\n'
+    '\U0001f458\tkimono\n\U0001f459\tbikini\n\U0001f45a\twomans_clothes\n'
+    '\U0001f45b\tpurse\n\U0001f45c\thandbag\n\U0001f45d\tpouch\n'
+    '\U0001f45e\tmans_shoe\n\U0001f45f\tathletic_shoe\n'
+    '\U0001f460\thigh_heel\n\U0001f461\tsandal\n\U0001f462\tboot\n'
+    '\U0001f463\tfootprints\n\U0001f464\tbust_in_silhouette\n'
+    '\U0001f465\tbusts_in_silhouette\n\U0001f466\tboy\n'
+    '\U0001f466\U0001f3fb\tboy_tone1\n\U0001f466\U0001f3fc\tboy_tone2\n'
+    '\U0001f466\U0001f3fd\tboy_tone3\n\U0001f466\U0001f3fe\tboy_tone4\n'
+    '\U0001f466\U0001f3ff\tboy_tone5\n\U0001f467\tgirl\n'
+    '\U0001f467\U0001f3fb\tgirl_tone1\n\U0001f467\U0001f3fc\tgirl_tone2\n'
+    '\U0001f467\U0001f3fd\tgirl_tone3\n\U0001f467\U0001f3fe\tgirl_tone4\n'
+    '\U0001f467\U0001f3ff\tgirl_tone5\n\U0001f468\tman\n'
+    '\U0001f468\u200d\u2764\u200d\U0001f468\tcouple_with_heart_mm\n'
+    '\U0001f468\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\tcouplekiss_mm\n'
+    '\U0001f468\u200d\u2764\ufe0f\u200d\U0001f468\tcouple_with_heart_mm\n'
+    '\U0001f468\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\tcouplekiss_mm\n'
+    '\U0001f468\u200d\U0001f468\u200d\U0001f466\tfamily_mmb\n'
+    '\U0001f468\u200d\U0001f468\u200d\U0001f466\u200d\U0001f466\tfamily_mmbb\n'
+    '\U0001f468\u200d\U0001f468\u200d\U0001f467\tfamily_mmg\n'
+    '\U0001f468\u200d\U0001f468\u200d\U0001f467\u200d\U0001f466\tfamily_mmgb\n'
+    '\U0001f468\u200d\U0001f468\u200d\U0001f467\u200d\U0001f467\tfamily_mmgg\n'
+    '\U0001f468\u200d\U0001f469\u200d\U0001f466\u200d\U0001f466\tfamily_mwbb\n'
+    '\U0001f468\u200d\U0001f469\u200d\U0001f467\tfamily_mwg\n'
+    '\U0001f468\u200d\U0001f469\u200d\U0001f467\u200d\U0001f466\tfamily_mwgb\n'
+    '\U0001f468\u200d\U0001f469\u200d\U0001f467\u200d\U0001f467\tfamily_mwgg\n'
+    '\U0001f468\U0001f3fb\tman_tone1\n\U0001f468\U0001f3fc\tman_tone2\n'
+    '\U0001f468\U0001f3fd\tman_tone3\n\U0001f468\U0001f3fe\tman_tone4\n'
+    '\U0001f468\U0001f3ff\tman_tone5\n\U0001f469\twoman\n'
+    '\U0001f469\u200d\u2764\u200d\U0001f469\tcouple_with_heart_ww\n'
+    '\U0001f469\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\tcouplekiss_ww\n'
+    '\U0001f469\u200d\u2764\ufe0f\u200d\U0001f469\tcouple_with_heart_ww\n'
+    '\U0001f469\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\tcouplekiss_ww\n'
+    '\U0001f469\u200d\U0001f469\u200d\U0001f466\tfamily_wwb\n'
+    '\U0001f469\u200d\U0001f469\u200d\U0001f466\u200d\U0001f466\tfamily_wwbb\n'
+    '\U0001f469\u200d\U0001f469\u200d\U0001f467\tfamily_wwg\n'
+    '\U0001f469\u200d\U0001f469\u200d\U0001f467\u200d\U0001f466\tfamily_wwgb\n'
+    '\U0001f469\u200d\U0001f469\u200d\U0001f467\u200d\U0001f467\tfamily_wwgg\n'
+    '\U0001f469\U0001f3fb\twoman_tone1\n\U0001f469\U0001f3fc\twoman_tone2\n'
+    '\U0001f469\U0001f3fd\twoman_tone3\n\U0001f469\U0001f3fe\twoman_tone4\n'
+    '\U0001f469\U0001f3ff\twoman_tone5\n\U0001f46a\tfamily\n'
+    '\U0001f46b\tcouple\n\U0001f46c\ttwo_men_holding_hands\n'
+    '\U0001f46d\ttwo_women_holding_hands\n\U0001f46e\tcop\n'
+    '\U0001f46e\U0001f3fb\tcop_tone1\n\U0001f46e\U0001f3fc\tcop_tone2\n'
+    '\U0001f46e\U0001f3fd\tcop_tone3\n\U0001f46e\U0001f3fe\tcop_tone4\n'
+    '\U0001f46e\U0001f3ff\tcop_tone5\n\U0001f46f\tdancers\n'
+    '\U0001f470\u200d\u2640\tbride_with_veil\n'
+    '\U0001f470\u200d\u2640\ufe0f\tbride_with_veil\n'
+    '\U0001f470\U0001f3fb\u200d\u2640\tbride_with_veil_tone1\n'
+    '\U0001f470\U0001f3fc\u200d\u2640\tbride_with_veil_tone2\n'
+    '\U0001f470\U0001f3fd\u200d\u2640\tbride_with_veil_tone3\n'
+    '\U0001f470\U0001f3fe\u200d\u2640\tbride_with_veil_tone4\n'
+    '\U0001f470\U0001f3ff\u200d\u2640\tbride_with_veil_tone5\n'
+    '\U0001f471\tperson_with_blond_hair\n'
+    '\U0001f471\U0001f3fb\tperson_with_blond_hair_tone1\n'
+    '\U0001f471\U0001f3fc\tperson_with_blond_hair_tone2\n'
+    '\U0001f471\U0001f3fd\tperson_with_blond_hair_tone3\n'
+    '\U0001f471\U0001f3fe\tperson_with_blond_hair_tone4\n'
+    '\U0001f471\U0001f3ff\tperson_with_blond_hair_tone5\n'
+    '\U0001f472\tman_with_gua_pi_mao\n'
+    '\U0001f472\U0001f3fb\tman_with_gua_pi_mao_tone1\n'
+    '\U0001f472\U0001f3fc\tman_with_gua_pi_mao_tone2\n'
+    '\U0001f472\U0001f3fd\tman_with_gua_pi_mao_tone3\n'
+    '\U0001f472\U0001f3fe\tman_with_gua_pi_mao_tone4\n'
+    '\U0001f472\U0001f3ff\tman_with_gua_pi_mao_tone5\n'
+    '\U0001f473\u200d\u2642\tman_with_turban\n'
+    '\U0001f473\u200d\u2642\ufe0f\tman_with_turban\n'
+    '\U0001f473\U0001f3fb\u200d\u2642\tman_with_turban_tone1\n'
+    '\U0001f473\U0001f3fc\u200d\u2642\tman_with_turban_tone2\n'
+    '\U0001f473\U0001f3fd\u200d\u2642\tman_with_turban_tone3\n'
+    '\U0001f473\U0001f3fe\u200d\u2642\tman_with_turban_tone4\n'
+    '\U0001f473\U0001f3ff\u200d\u2642\tman_with_turban_tone5\n'
+    '\U0001f474\tolder_man\n\U0001f474\U0001f3fb\tolder_man_tone1\n'
+    '\U0001f474\U0001f3fc\tolder_man_tone2\n'
+    '\U0001f474\U0001f3fd\tolder_man_tone3\n'
+    '\U0001f474\U0001f3fe\tolder_man_tone4\n'
+    '\U0001f474\U0001f3ff\tolder_man_tone5\n\U0001f475\tolder_woman\n'
+    '\U0001f475\U0001f3fb\tolder_woman_tone1\n'
+    '\U0001f475\U0001f3fc\tolder_woman_tone2\n'
+    '\U0001f475\U0001f3fd\tolder_woman_tone3\n'
+    '\U0001f475\U0001f3fe\tolder_woman_tone4\n'
+    '\U0001f475\U0001f3ff\tolder_woman_tone5\n\U0001f476\tbaby\n'
+    '\U0001f476\U0001f3fb\tbaby_tone1\n\U0001f476\U0001f3fc\tbaby_tone2\n'
+    '\U0001f476\U0001f3fd\tbaby_tone3\n\U0001f476\U0001f3fe\tbaby_tone4\n'
+    '\U0001f476\U0001f3ff\tbaby_tone5\n\U0001f477\tconstruction_worker\n'
+    '\U0001f477\U0001f3fb\tconstruction_worker_tone1\n'
+    '\U0001f477\U0001f3fc\tconstruction_worker_tone2\n'
+    '\U0001f477\U0001f3fd\tconstruction_worker_tone3\n'
+    '\U0001f477\U0001f3fe\tconstruction_worker_tone4\n'
+    '\U0001f477\U0001f3ff\tconstruction_worker_tone5\n'
+    '\U0001f478\tprincess\n\U0001f478\U0001f3fb\tprincess_tone1\n'
+    '\U0001f478\U0001f3fc\tprincess_tone2\n'
+    '\U0001f478\U0001f3fd\tprincess_tone3\n'
+    '\U0001f478\U0001f3fe\tprincess_tone4\n'
+    '\U0001f478\U0001f3ff\tprincess_tone5\n\U0001f479\tjapanese_ogre\n'
+    '\U0001f47a\tjapanese_goblin\n\U0001f47b\tghost\n\U0001f47c\tangel\n'
+    '\U0001f47c\U0001f3fb\tangel_tone1\n\U0001f47c\U0001f3fc\tangel_tone2\n'
+    '\U0001f47c\U0001f3fd\tangel_tone3\n\U0001f47c\U0001f3fe\tangel_tone4\n'
+    '\U0001f47c\U0001f3ff\tangel_tone5\n\U0001f47d\talien\n'
+    '\U0001f47e\tspace_invader\n\U0001f47f\timp\n\U0001f480\tskull\n'
+    '\U0001f481\tinformation_desk_person\n'
+    '\U0001f481\U0001f3fb\tinformation_desk_person_tone1\n'
+    '\U0001f481\U0001f3fc\tinformation_desk_person_tone2\n'
+    '\U0001f481\U0001f3fd\tinformation_desk_person_tone3\n'
+    '\U0001f481\U0001f3fe\tinformation_desk_person_tone4\n'
+    '\U0001f481\U0001f3ff\tinformation_desk_person_tone5\n'
+    '\U0001f482\u200d\u2642\tguardsman\n'
+    '\U0001f482\u200d\u2642\ufe0f\tguardsman\n'
+    '\U0001f482\U0001f3fb\u200d\u2642\tguardsman_tone1\n'
+    '\U0001f482\U0001f3fc\u200d\u2642\tguardsman_tone2\n'
+    '\U0001f482\U0001f3fd\u200d\u2642\tguardsman_tone3\n'
+    '\U0001f482\U0001f3fe\u200d\u2642\tguardsman_tone4\n'
+    '\U0001f482\U0001f3ff\u200d\u2642\tguardsman_tone5\n'
+    '\U0001f483\tdancer\n\U0001f483\U0001f3fb\tdancer_tone1\n'
+    '\U0001f483\U0001f3fc\tdancer_tone2\n'
+    '\U0001f483\U0001f3fd\tdancer_tone3\n'
+    '\U0001f483\U0001f3fe\tdancer_tone4\n'
+    '\U0001f483\U0001f3ff\tdancer_tone5\n\U0001f484\tlipstick\n'
+    '\U0001f485\tnail_care\n\U0001f485\U0001f3fb\tnail_care_tone1\n'
+    '\U0001f485\U0001f3fc\tnail_care_tone2\n'
+    '\U0001f485\U0001f3fd\tnail_care_tone3\n'
+    '\U0001f485\U0001f3fe\tnail_care_tone4\n'
+    '\U0001f485\U0001f3ff\tnail_care_tone5\n\U0001f486\tmassage\n'
+    '\U0001f486\U0001f3fb\tmassage_tone1\n'
+    '\U0001f486\U0001f3fc\tmassage_tone2\n'
+    '\U0001f486\U0001f3fd\tmassage_tone3\n'
+    '\U0001f486\U0001f3fe\tmassage_tone4\n'
+    '\U0001f486\U0001f3ff\tmassage_tone5\n\U0001f487\thaircut\n'
+    '\U0001f487\U0001f3fb\thaircut_tone1\n'
+    '\U0001f487\U0001f3fc\thaircut_tone2\n'
+    '\U0001f487\U0001f3fd\thaircut_tone3\n'
+    '\U0001f487\U0001f3fe\thaircut_tone4\n'
+    '\U0001f487\U0001f3ff\thaircut_tone5\n\U0001f488\tbarber\n'
+    '\U0001f489\tsyringe\n\U0001f48a\tpill\n\U0001f48c\tlove_letter\n'
+    '\U0001f48d\tring\n\U0001f48e\tgem\n\U0001f48f\tcouplekiss\n'
+    '\U0001f490\tbouquet\n\U0001f491\tcouple_with_heart\n'
+    '\U0001f492\twedding\n\U0001f493\theartbeat\n\U0001f494\tbroken_heart\n'
+    '\U0001f495\ttwo_hearts\n\U0001f496\tsparkling_heart\n'
+    '\U0001f497\theartpulse\n\U0001f498\tcupid\n\U0001f499\tblue_heart\n'
+    '\U0001f49a\tgreen_heart\n\U0001f49b\tyellow_heart\n'
+    '\U0001f49c\tpurple_heart\n\U0001f49d\tgift_heart\n'
+    '\U0001f49e\trevolving_hearts\n\U0001f49f\theart_decoration\n'
+    '\U0001f4a0\tdiamond_shape_with_a_dot_inside\n\U0001f4a1\tbulb\n'
+    '\U0001f4a2\tanger\n\U0001f4a3\tbomb\n\U0001f4a4\tzzz\n'
+    '\U0001f4a5\tboom\n\U0001f4a6\tsweat_drops\n\U0001f4a7\tdroplet\n'
+    '\U0001f4a8\tdash\n\U0001f4a9\thankey\n\U0001f4aa\tmuscle\n'
+    '\U0001f4aa\U0001f3fb\tmuscle_tone1\n'
+    '\U0001f4aa\U0001f3fc\tmuscle_tone2\n'
+    '\U0001f4aa\U0001f3fd\tmuscle_tone3\n'
+    '\U0001f4aa\U0001f3fe\tmuscle_tone4\n'
+    '\U0001f4aa\U0001f3ff\tmuscle_tone5\n\U0001f4ab\tdizzy\n'
+    '\U0001f4ac\tspeech_balloon\n\U0001f4ad\tthought_balloon\n'
+    '\U0001f4ae\twhite_flower\n\U0001f4af\t100\n\U0001f4b0\tmoneybag\n'
+    '\U0001f4b1\tcurrency_exchange\n\U0001f4b2\theavy_dollar_sign\n'
+    '\U0001f4b3\tcredit_card\n\U0001f4b4\tyen\n\U0001f4b5\tdollar\n'
+    '\U0001f4b6\teuro\n\U0001f4b7\tpound\n\U0001f4b8\tmoney_with_wings\n'
+    '\U0001f4b9\tchart\n\U0001f4ba\tseat\n\U0001f4bb\tcomputer\n'
+    '\U0001f4bc\tbriefcase\n\U0001f4bd\tminidisc\n\U0001f4be\tfloppy_disk\n'
+    '\U0001f4c0\tdvd\n\U0001f4c1\tfile_folder\n'
+    '\U0001f4c2\topen_file_folder\n\U0001f4c3\tpage_with_curl\n'
+    '\U0001f4c4\tpage_facing_up\n\U0001f4c5\tcalendar\n'
+    '\U0001f4c7\tcard_index\n\U0001f4c8\tchart_with_upwards_trend\n'
+    '\U0001f4c9\tchart_with_downwards_trend\n\U0001f4ca\tbar_chart\n'
+    '\U0001f4cb\tclipboard\n\U0001f4cc\tpushpin\n'
+    '\U0001f4cd\tround_pushpin\n\U0001f4ce\tpaperclip\n'
+    '\U0001f4cf\tstraight_ruler\n\U0001f4d0\ttriangular_ruler\n'
+    '\U0001f4d1\tbookmark_tabs\n\U0001f4d2\tledger\n\U0001f4d3\tnotebook\n'
+    '\U0001f4d4\tnotebook_with_decorative_cover\n\U0001f4d5\tclosed_book\n'
+    '\U0001f4d6\tbook\n\U0001f4d7\tgreen_book\n\U0001f4d8\tblue_book\n'
+    '\U0001f4d9\torange_book\n\U0001f4da\tbooks\n\U0001f4db\tname_badge\n'
+    '\U0001f4dc\tscroll\n\U0001f4dd\tpencil\n'
+    '\U0001f4de\ttelephone_receiver\n\U0001f4df\tpager\n\U0001f4e0\tfax\n'
+    '\U0001f4e2\tloudspeaker\n\U0001f4e3\tmega\n\U0001f4e4\toutbox_tray\n'
+    '\U0001f4e5\tinbox_tray\n\U0001f4e6\tpackage\n\U0001f4e7\te-mail\n'
+    '\U0001f4e8\tincoming_envelope\n\U0001f4e9\tenvelope_with_arrow\n'
+    '\U0001f4ea\tmailbox_closed\n\U0001f4eb\tmailbox\n'
+    '\U0001f4ec\tmailbox_with_mail\n\U0001f4ed\tmailbox_with_no_mail\n'
+    '\U0001f4ee\tpostbox\n\U0001f4ef\tpostal_horn\n\U0001f4f0\tnewspaper\n'
+    '\U0001f4f1\tiphone\n\U0001f4f2\tcalling\n\U0001f4f3\tvibration_mode\n'
+    '\U0001f4f4\tmobile_phone_off\n\U0001f4f5\tno_mobile_phones\n'
+    '\U0001f4f6\tsignal_strength\n\U0001f4f7\tcamera\n'
+    '\U0001f4f8\tcamera_with_flash\n\U0001f4f9\tvideo_camera\n'
+    '\U0001f4fb\tradio\n\U0001f4fc\tvhs\n\U0001f4fd\ufe0f\tfilm_projector\n'
+    '\U0001f4ff\tprayer_beads\n\U0001f500\ttwisted_rightwards_arrows\n'
+    '\U0001f501\trepeat\n\U0001f502\trepeat_one\n'
+    '\U0001f503\tarrows_clockwise\n\U0001f504\tarrows_counterclockwise\n'
+    '\U0001f505\tlow_brightness\n\U0001f506\thigh_brightness\n'
+    '\U0001f507\tmute\n\U0001f508\tspeaker\n\U0001f509\tsound\n'
+    '\U0001f50a\tloud_sound\n\U0001f50b\tbattery\n'
+    '\U0001f50c\telectric_plug\n\U0001f50d\tmag\n\U0001f50e\tmag_right\n'
+    '\U0001f50f\tlock_with_ink_pen\n\U0001f510\tclosed_lock_with_key\n'
+    '\U0001f511\tkey\n\U0001f512\tlock\n\U0001f513\tunlock\n'
+    '\U0001f514\tbell\n\U0001f515\tno_bell\n\U0001f516\tbookmark\n'
+    '\U0001f517\tlink\n\U0001f518\tradio_button\n\U0001f519\tback\n'
+    '\U0001f51a\tend\n\U0001f51b\ton\n\U0001f51c\tsoon\n\U0001f51d\ttop\n'
+    '\U0001f51e\tunderage\n\U0001f51f\tten\n\U0001f520\tcapital_abcd\n'
+    '\U0001f521\tabcd\n\U0001f522\t1234\n\U0001f523\tsymbols\n'
+    '\U0001f524\tabc\n\U0001f525\tfire\n\U0001f526\tflashlight\n'
+    '\U0001f527\twrench\n\U0001f528\thammer\n\U0001f529\tnut_and_bolt\n'
+    '\U0001f52a\tknife\n\U0001f52b\tgun\n\U0001f52c\tmicroscope\n'
+    '\U0001f52d\ttelescope\n\U0001f52e\tcrystal_ball\n'
+    '\U0001f52f\tsix_pointed_star\n\U0001f530\tbeginner\n'
+    '\U0001f531\ttrident\n\U0001f532\tblack_square_button\n'
+    '\U0001f533\twhite_square_button\n\U0001f534\tred_circle\n'
+    '\U0001f535\tlarge_blue_circle\n\U0001f536\tlarge_orange_diamond\n'
+    '\U0001f537\tlarge_blue_diamond\n\U0001f538\tsmall_orange_diamond\n'
+    '\U0001f539\tsmall_blue_diamond\n\U0001f53a\tsmall_red_triangle\n'
+    '\U0001f53b\tsmall_red_triangle_down\n\U0001f53c\tarrow_up_small\n'
+    '\U0001f53d\tarrow_down_small\n\U0001f549\ufe0f\tom_symbol\n'
+    '\U0001f54a\ufe0f\tdove\n\U0001f54b\tkaaba\n\U0001f54c\tmosque\n'
+    '\U0001f54d\tsynagogue\n\U0001f54e\tmenorah\n\U0001f550\tclock1\n'
+    '\U0001f551\tclock2\n\U0001f552\tclock3\n\U0001f553\tclock4\n'
+    '\U0001f554\tclock5\n\U0001f555\tclock6\n\U0001f556\tclock7\n'
+    '\U0001f557\tclock8\n\U0001f558\tclock9\n\U0001f559\tclock10\n'
+    '\U0001f55a\tclock11\n\U0001f55b\tclock12\n\U0001f55c\tclock130\n'
+    '\U0001f55d\tclock230\n\U0001f55e\tclock330\n\U0001f55f\tclock430\n'
+    '\U0001f560\tclock530\n\U0001f561\tclock630\n\U0001f562\tclock730\n'
+    '\U0001f563\tclock830\n\U0001f564\tclock930\n\U0001f565\tclock1030\n'
+    '\U0001f566\tclock1130\n\U0001f567\tclock1230\n'
+    '\U0001f56f\ufe0f\tcandle\n\U0001f573\ufe0f\thole\n'
+    '\U0001f574\ufe0f\tman_in_business_suit_levitating\n'
+    '\U0001f575\ufe0f\tsleuth_or_spy\n'
+    '\U0001f575\U0001f3fb\tsleuth_or_spy_tone1\n'
+    '\U0001f575\U0001f3fc\tsleuth_or_spy_tone2\n'
+    '\U0001f575\U0001f3fd\tsleuth_or_spy_tone3\n'
+    '\U0001f575\U0001f3fe\tsleuth_or_spy_tone4\n'
+    '\U0001f575\U0001f3ff\tsleuth_or_spy_tone5\n'
+    '\U0001f576\ufe0f\tdark_sunglasses\n\U0001f577\ufe0f\tspider\n'
+    '\U0001f578\ufe0f\tspider_web\n\U0001f579\ufe0f\tjoystick\n'
+    '\U0001f587\ufe0f\tlinked_paperclips\n'
+    '\U0001f58a\ufe0f\tlower_left_ballpoint_pen\n'
+    '\U0001f58b\ufe0f\tlower_left_fountain_pen\n'
+    '\U0001f58c\ufe0f\tlower_left_paintbrush\n\U0001f58d\ufe0f\tcrayon\n'
+    '\U0001f590\ufe0f\traised_hand_with_fingers_splayed\n'
+    '\U0001f590\U0001f3fb\traised_hand_with_fingers_splayed_tone1\n'
+    '\U0001f590\U0001f3fc\traised_hand_with_fingers_splayed_tone2\n'
+    '\U0001f590\U0001f3fd\traised_hand_with_fingers_splayed_tone3\n'
+    '\U0001f590\U0001f3fe\traised_hand_with_fingers_splayed_tone4\n'
+    '\U0001f590\U0001f3ff\traised_hand_with_fingers_splayed_tone5\n'
+    '\U0001f595\tmiddle_finger\n\U0001f595\U0001f3fb\tmiddle_finger_tone1\n'
+    '\U0001f595\U0001f3fc\tmiddle_finger_tone2\n'
+    '\U0001f595\U0001f3fd\tmiddle_finger_tone3\n'
+    '\U0001f595\U0001f3fe\tmiddle_finger_tone4\n'
+    '\U0001f595\U0001f3ff\tmiddle_finger_tone5\n'
+    '\U0001f596\traised_hand_with_part_between_middle_and_ring_fingers\n'
+    '\U0001f596\U0001f3fb\traised_hand_with_part_between_middle_and_ring_fingers_tone1\n'
+    '\U0001f596\U0001f3fc\traised_hand_with_part_between_middle_and_ring_fingers_tone2\n'
+    '\U0001f596\U0001f3fd\traised_hand_with_part_between_middle_and_ring_fingers_tone3\n'
+    '\U0001f596\U0001f3fe\traised_hand_with_part_between_middle_and_ring_fingers_tone4\n'
+    '\U0001f596\U0001f3ff\traised_hand_with_part_between_middle_and_ring_fingers_tone5\n'
+    '\U0001f5a5\ufe0f\tdesktop_computer\n\U0001f5a8\ufe0f\tprinter\n'
+    '\U0001f5b1\ufe0f\tthree_button_mouse\n\U0001f5b2\ufe0f\ttrackball\n'
+    '\U0001f5bc\ufe0f\tframe_with_picture\n'
+    '\U0001f5c2\ufe0f\tcard_index_dividers\n'
+    '\U0001f5c3\ufe0f\tcard_file_box\n\U0001f5c4\ufe0f\tfile_cabinet\n'
+    '\U0001f5d1\ufe0f\twastebasket\n\U0001f5d2\ufe0f\tspiral_note_pad\n'
+    '\U0001f5d3\ufe0f\tspiral_calendar_pad\n\U0001f5dc\ufe0f\tcompression\n'
+    '\U0001f5dd\ufe0f\told_key\n\U0001f5de\ufe0f\trolled_up_newspaper\n'
+    '\U0001f5e1\ufe0f\tdagger\n\U0001f5e3\ufe0f\tspeaking_head\n'
+    '\U0001f5ef\ufe0f\tright_anger_bubble\n\U0001f5f3\ufe0f\tballot_box\n'
+    '\U0001f5fa\ufe0f\tworld_map\n\U0001f5fb\tmount_fuji\n'
+    '\U0001f5fc\ttokyo_tower\n\U0001f5fd\tstatue_of_liberty\n'
+    '\U0001f5ff\tmoyai\n\U0001f600\tgrinning\n\U0001f601\tgrin\n'
+    '\U0001f602\tjoy\n\U0001f603\tsmiley\n\U0001f604\tsmile\n'
+    '\U0001f605\tsweat_smile\n\U0001f606\tlaughing\n\U0001f607\tinnocent\n'
+    '\U0001f608\tsmiling_imp\n\U0001f609\twink\n\U0001f60a\tblush\n'
+    '\U0001f60b\tyum\n\U0001f60c\trelieved\n\U0001f60d\theart_eyes\n'
+    '\U0001f60e\tsunglasses\n\U0001f60f\tsmirk\n\U0001f610\tneutral_face\n'
+    '\U0001f611\texpressionless\n\U0001f612\tunamused\n\U0001f613\tsweat\n'
+    '\U0001f614\tpensive\n\U0001f615\tconfused\n\U0001f616\tconfounded\n'
+    '\U0001f617\tkissing\n\U0001f618\tkissing_heart\n'
+    '\U0001f619\tkissing_smiling_eyes\n\U0001f61a\tkissing_closed_eyes\n'
+    '\U0001f61b\tstuck_out_tongue\n'
+    '\U0001f61c\tstuck_out_tongue_winking_eye\n'
+    '\U0001f61d\tstuck_out_tongue_closed_eyes\n\U0001f61e\tdisappointed\n'
+    '\U0001f61f\tworried\n\U0001f620\tangry\n\U0001f621\trage\n'
+    '\U0001f622\tcry\n\U0001f623\tpersevere\n\U0001f624\ttriumph\n'
+    '\U0001f625\tdisappointed_relieved\n\U0001f626\tfrowning\n'
+    '\U0001f627\tanguished\n\U0001f628\tfearful\n\U0001f629\tweary\n'
+    '\U0001f62a\tsleepy\n\U0001f62b\ttired_face\n\U0001f62c\tgrimacing\n'
+    '\U0001f62d\tsob\n\U0001f62e\topen_mouth\n\U0001f62f\thushed\n'
+    '\U0001f630\tcold_sweat\n\U0001f631\tscream\n\U0001f632\tastonished\n'
+    '\U0001f633\tflushed\n\U0001f634\tsleeping\n\U0001f635\tdizzy_face\n'
+    '\U0001f636\tno_mouth\n\U0001f637\tmask\n\U0001f638\tsmile_cat\n'
+    '\U0001f639\tjoy_cat\n\U0001f63a\tsmiley_cat\n'
+    '\U0001f63b\theart_eyes_cat\n\U0001f63c\tsmirk_cat\n'
+    '\U0001f63d\tkissing_cat\n\U0001f63e\tpouting_cat\n'
+    '\U0001f63f\tcrying_cat_face\n\U0001f640\tscream_cat\n'
+    '\U0001f641\tslightly_frowning_face\n'
+    '\U0001f642\tslightly_smiling_face\n\U0001f643\tupside_down_face\n'
+    '\U0001f644\tface_with_rolling_eyes\n\U0001f645\tno_good\n'
+    '\U0001f645\U0001f3fb\tno_good_tone1\n'
+    '\U0001f645\U0001f3fc\tno_good_tone2\n'
+    '\U0001f645\U0001f3fd\tno_good_tone3\n'
+    '\U0001f645\U0001f3fe\tno_good_tone4\n'
+    '\U0001f645\U0001f3ff\tno_good_tone5\n'
+    '\U0001f646\u200d\u2640\tok_woman\n'
+    '\U0001f646\u200d\u2640\ufe0f\tok_woman\n'
+    '\U0001f646\U0001f3fb\u200d\u2640\tok_woman_tone1\n'
+    '\U0001f646\U0001f3fc\u200d\u2640\tok_woman_tone2\n'
+    '\U0001f646\U0001f3fd\u200d\u2640\tok_woman_tone3\n'
+    '\U0001f646\U0001f3fe\u200d\u2640\tok_woman_tone4\n'
+    '\U0001f646\U0001f3ff\u200d\u2640\tok_woman_tone5\n\U0001f647\tbow\n'
+    '\U0001f647\U0001f3fb\tbow_tone1\n\U0001f647\U0001f3fc\tbow_tone2\n'
+    '\U0001f647\U0001f3fd\tbow_tone3\n\U0001f647\U0001f3fe\tbow_tone4\n'
+    '\U0001f647\U0001f3ff\tbow_tone5\n\U0001f648\tsee_no_evil\n'
+    '\U0001f649\thear_no_evil\n\U0001f64a\tspeak_no_evil\n'
+    '\U0001f64b\traising_hand\n\U0001f64b\U0001f3fb\traising_hand_tone1\n'
+    '\U0001f64b\U0001f3fc\traising_hand_tone2\n'
+    '\U0001f64b\U0001f3fd\traising_hand_tone3\n'
+    '\U0001f64b\U0001f3fe\traising_hand_tone4\n'
+    '\U0001f64b\U0001f3ff\traising_hand_tone5\n\U0001f64c\traised_hands\n'
+    '\U0001f64c\U0001f3fb\traised_hands_tone1\n'
+    '\U0001f64c\U0001f3fc\traised_hands_tone2\n'
+    '\U0001f64c\U0001f3fd\traised_hands_tone3\n'
+    '\U0001f64c\U0001f3fe\traised_hands_tone4\n'
+    '\U0001f64c\U0001f3ff\traised_hands_tone5\n'
+    '\U0001f64d\tperson_frowning\n'
+    '\U0001f64d\U0001f3fb\tperson_frowning_tone1\n'
+    '\U0001f64d\U0001f3fc\tperson_frowning_tone2\n'
+    '\U0001f64d\U0001f3fd\tperson_frowning_tone3\n'
+    '\U0001f64d\U0001f3fe\tperson_frowning_tone4\n'
+    '\U0001f64d\U0001f3ff\tperson_frowning_tone5\n'
+    '\U0001f64e\tperson_with_pouting_face\n'
+    '\U0001f64e\U0001f3fb\tperson_with_pouting_face_tone1\n'
+    '\U0001f64e\U0001f3fc\tperson_with_pouting_face_tone2\n'
+    '\U0001f64e\U0001f3fd\tperson_with_pouting_face_tone3\n'
+    '\U0001f64e\U0001f3fe\tperson_with_pouting_face_tone4\n'
+    '\U0001f64e\U0001f3ff\tperson_with_pouting_face_tone5\n'
+    '\U0001f64f\tpray\n\U0001f64f\U0001f3fb\tpray_tone1\n'
+    '\U0001f64f\U0001f3fc\tpray_tone2\n\U0001f64f\U0001f3fd\tpray_tone3\n'
+    '\U0001f64f\U0001f3fe\tpray_tone4\n\U0001f64f\U0001f3ff\tpray_tone5\n'
+    '\U0001f680\trocket\n\U0001f681\thelicopter\n'
+    '\U0001f682\tsteam_locomotive\n\U0001f683\trailway_car\n'
+    '\U0001f684\tbullettrain_side\n\U0001f685\tbullettrain_front\n'
+    '\U0001f686\ttrain\n\U0001f687\tmetro\n\U0001f688\tlight_rail\n'
+    '\U0001f689\tstation\n\U0001f68a\ttram\n\U0001f68c\tbus\n'
+    '\U0001f68d\toncoming_bus\n\U0001f68e\ttrolleybus\n'
+    '\U0001f68f\tbusstop\n\U0001f690\tminibus\n\U0001f691\tambulance\n'
+    '\U0001f692\tfire_engine\n\U0001f693\tpolice_car\n'
+    '\U0001f694\toncoming_police_car\n\U0001f695\ttaxi\n'
+    '\U0001f696\toncoming_taxi\n\U0001f697\tred_car\n'
+    '\U0001f698\toncoming_automobile\n\U0001f699\tblue_car\n'
+    '\U0001f69a\ttruck\n\U0001f69b\tarticulated_lorry\n'
+    '\U0001f69c\ttractor\n\U0001f69d\tmonorail\n'
+    '\U0001f69e\tmountain_railway\n\U0001f69f\tsuspension_railway\n'
+    '\U0001f6a0\tmountain_cableway\n\U0001f6a1\taerial_tramway\n'
+    '\U0001f6a2\tship\n\U0001f6a3\trowboat\n'
+    '\U0001f6a3\U0001f3fb\trowboat_tone1\n'
+    '\U0001f6a3\U0001f3fc\trowboat_tone2\n'
+    '\U0001f6a3\U0001f3fd\trowboat_tone3\n'
+    '\U0001f6a3\U0001f3fe\trowboat_tone4\n'
+    '\U0001f6a3\U0001f3ff\trowboat_tone5\n\U0001f6a4\tspeedboat\n'
+    '\U0001f6a5\ttraffic_light\n\U0001f6a6\tvertical_traffic_light\n'
+    '\U0001f6a7\tconstruction\n\U0001f6a8\trotating_light\n'
+    '\U0001f6a9\ttriangular_flag_on_post\n\U0001f6aa\tdoor\n'
+    '\U0001f6ab\tno_entry_sign\n\U0001f6ac\tsmoking\n'
+    '\U0001f6ad\tno_smoking\n\U0001f6ae\tput_litter_in_its_place\n'
+    '\U0001f6af\tdo_not_litter\n\U0001f6b0\tpotable_water\n'
+    '\U0001f6b1\tnon-potable_water\n\U0001f6b2\tbike\n'
+    '\U0001f6b3\tno_bicycles\n\U0001f6b4\tbicyclist\n'
+    '\U0001f6b4\U0001f3fb\tbicyclist_tone1\n'
+    '\U0001f6b4\U0001f3fc\tbicyclist_tone2\n'
+    '\U0001f6b4\U0001f3fd\tbicyclist_tone3\n'
+    '\U0001f6b4\U0001f3fe\tbicyclist_tone4\n'
+    '\U0001f6b4\U0001f3ff\tbicyclist_tone5\n'
+    '\U0001f6b5\tmountain_bicyclist\n'
+    '\U0001f6b5\U0001f3fb\tmountain_bicyclist_tone1\n'
+    '\U0001f6b5\U0001f3fc\tmountain_bicyclist_tone2\n'
+    '\U0001f6b5\U0001f3fd\tmountain_bicyclist_tone3\n'
+    '\U0001f6b5\U0001f3fe\tmountain_bicyclist_tone4\n'
+    '\U0001f6b5\U0001f3ff\tmountain_bicyclist_tone5\n\U0001f6b6\twalking\n'
+    '\U0001f6b6\U0001f3fb\twalking_tone1\n'
+    '\U0001f6b6\U0001f3fc\twalking_tone2\n'
+    '\U0001f6b6\U0001f3fd\twalking_tone3\n'
+    '\U0001f6b6\U0001f3fe\twalking_tone4\n'
+    '\U0001f6b6\U0001f3ff\twalking_tone5\n\U0001f6b7\tno_pedestrians\n'
+    '\U0001f6b8\tchildren_crossing\n\U0001f6b9\tmens\n\U0001f6ba\twomens\n'
+    '\U0001f6bb\trestroom\n\U0001f6bc\tbaby_symbol\n\U0001f6bd\ttoilet\n'
+    '\U0001f6be\twc\n\U0001f6bf\tshower\n\U0001f6c0\tbath\n'
+    '\U0001f6c0\U0001f3fb\tbath_tone1\n\U0001f6c0\U0001f3fc\tbath_tone2\n'
+    '\U0001f6c0\U0001f3fd\tbath_tone3\n\U0001f6c0\U0001f3fe\tbath_tone4\n'
+    '\U0001f6c0\U0001f3ff\tbath_tone5\n\U0001f6c1\tbathtub\n'
+    '\U0001f6c2\tpassport_control\n\U0001f6c3\tcustoms\n'
+    '\U0001f6c4\tbaggage_claim\n\U0001f6c5\tleft_luggage\n'
+    '\U0001f6cb\ufe0f\tcouch_and_lamp\n\U0001f6cc\tsleeping_accommodation\n'
+    '\U0001f6cd\ufe0f\tshopping_bags\n\U0001f6ce\ufe0f\tbellhop_bell\n'
+    '\U0001f6cf\ufe0f\tbed\n\U0001f6d0\tplace_of_worship\n'
+    '\U0001f6e0\ufe0f\thammer_and_wrench\n\U0001f6e1\ufe0f\tshield\n'
+    '\U0001f6e2\ufe0f\toil_drum\n\U0001f6e3\ufe0f\tmotorway\n'
+    '\U0001f6e4\ufe0f\trailway_track\n\U0001f6e9\ufe0f\tsmall_airplane\n'
+    '\U0001f6eb\tairplane_departure\n\U0001f6ec\tairplane_arriving\n'
+    '\U0001f6f0\ufe0f\tsatellite\n\U0001f6f3\ufe0f\tpassenger_ship\n'
+    '\U0001f910\tzipper_mouth_face\n\U0001f911\tmoney_mouth_face\n'
+    '\U0001f912\tface_with_thermometer\n\U0001f913\tnerd_face\n'
+    '\U0001f914\tthinking\n\U0001f915\tface_with_head_bandage\n'
+    '\U0001f916\trobot\n\U0001f917\thugging_face\n\U0001f918\tmetal\n'
+    '\U0001f918\U0001f3fb\tmetal_tone1\n\U0001f918\U0001f3fc\tmetal_tone2\n'
+    '\U0001f918\U0001f3fd\tmetal_tone3\n\U0001f918\U0001f3fe\tmetal_tone4\n'
+    '\U0001f918\U0001f3ff\tmetal_tone5\n\U0001f980\tcrab\n'
+    '\U0001f981\tlion\n\U0001f982\tscorpion\n\U0001f984\tunicorn\n'
+    '\U0001f997\tcricket\n\U0001f9c0\tcheese\n\U0001fab2\tbeetle')
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from collections.abc import Mapping
+
+from .emoji import load_data, search
+
+# First char of every sequence, merged into
+# broad ranges. The tests check it's in sync
+first_chars = (
+    '\xa9-\xae\u203c-\u21aa\u231a-\u27bf\u2934-\u2935'
+    '\u2b05-\u2b55\u3030-\u303d\u3297-\u3299'
+    '\U0001f004-\U0001f6f3\U0001f910-\U0001fab2')
+
+
+class UnicodeEmojis(Mapping):
+    """
+    Read-only mapping of unicode emoji sequences to
+    emoji names. The data is loaded on first use
+    """
+
+    def __getitem__(self, sequence):
+        line = None
+
+        if isinstance(sequence, str):
+            line = search(load_data().UNICODE, sequence, '\t')
+
+        if line is None:
+            raise KeyError(sequence)
+
+        return line.split('\t', 1)[1]
+
+    def __iter__(self):
+        return (sequence for sequence, _name in self.items())
+
+    def __len__(self):
+        return load_data().UNICODE.count('\n') + 1
+
+    # Override
+    def items(self):
+        return [
+            tuple(line.split('\t', 1))
+            for line in load_data().UNICODE.split('\n')]
+
+
+unicode_emojis = UnicodeEmojis()
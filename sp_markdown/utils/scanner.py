@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import re
+import threading
+
+
+class EmojiScanner(object):
+    """
+    Match ``:name:`` spans and resolve them to emojis.
+    ``name_classes`` maps every known name to its
+    precomputed CSS class name, it's built on first use.
+
+    Matches have an ``emoji`` group holding the name,
+    it may not be a known one (ie: ``:foo:``)
+    """
+
+    pattern = re.compile(r':(?P<emoji>[A-Za-z0-9_\-\+]+?):')
+
+    def __init__(self, names):
+        self._names = names
+        self._name_classes = None
+        self._lock = threading.Lock()
+        self.match = self.pattern.match
+
+    @staticmethod
+    def name_class(name):
+        return name.replace('_', '-').replace('+', 'plus')
+
+    @property
+    def name_classes(self):
+        if self._name_classes is None:
+            with self._lock:
+                if self._name_classes is None:
+                    self._name_classes = {
+                        name: self.name_class(name)
+                        for name in self._names}
+
+        return self._name_classes
+
+
+class ScanMatch(object):
+    """
+    Minimal ``re`` match lookalike for the scanners
+    """
+
+    __slots__ = ('string', '_start', '_end', '_groups')
+
+    def __init__(self, string, start, end, groups):
+        self.string = string
+        self._start = start
+        self._end = end
+        self._groups = groups
+
+    def group(self, name=0):
+        if name == 0:
+            return self.string[self._start:self._end]
+
+        return self._groups[name]
+
+    def groupdict(self):
+        return dict(self._groups)
+
+    def start(self):
+        return self._start
+
+    def end(self):
+        return self._end
+
+    def span(self):
+        return self._start, self._end
+
+
+class UnicodeEmojiScanner(object):
+    """
+    Match the longest Unicode emoji sequence
+    (ie: with skin tone modifiers or ZWJ) at the
+    start of the text. The sequences are walked
+    codepoint by codepoint through a trie that's
+    built on first use. Text not starting with an
+    emoji is rejected by a single dict lookup, or
+    by ``first_chars`` before the trie is built.
+
+    Matches have an ``emoji`` group holding the name
+
+    :param sequences: dict of sequence to emoji name
+    :param first_chars: regex char class content, holding
+    (at least) the first char of every sequence
+    """
+
+    def __init__(self, sequences, first_chars=None):
+        self._sequences = sequences
+        self._trie = None
+        self._lock = threading.Lock()
+        self._first = None
+
+        if first_chars is not None:
+            self._first = re.compile('[%s]' % first_chars).match
+
+    def _build(self):
+        with self._lock:
+            if self._trie is None:
+                trie = {}
+
+                for sequence, name in self._sequences.items():
+                    node = trie
+
+                    for char in sequence:
+                        node = node.setdefault(char, {})
+
+                    # No sequence has an empty char
+                    node[''] = name
+
+                self._trie = trie
+
+        return self._trie
+
+    def match(self, text, pos=0):
+        trie = self._trie
+
+        # Loading the sequences takes a lot of memory,
+        # so it's done once an emoji char is found
+        if trie is None:
+            if self._first is not None and self._first(text, pos) is None:
+                return None
+
+            trie = self._build()
+
+        node = trie.get(text[pos:pos + 1])
+
+        if node is None:
+            return None
+
+        name = None
+        end = index = pos + 1
+        size = len(text)
+
+        while True:
+            if '' in node:
+                name = node['']
+                end = index
+
+            if index >= size:
+                break
+
+            node = node.get(text[index])
+
+            if node is None:
+                break
+
+            index += 1
+
+        if name is None:
+            return None
+
+        return ScanMatch(text, pos, end, {'emoji': name})
+
+
+class TextScanner(object):
+    """
+    Match a run of text, same as
+    ``^[\\s\\S]+?(?=[<stops>]|https?://| *\\n|$)`` does,
+    except it jumps straight to the next stop char
+    instead of trying the lookahead at every char
+
+    :param stops: character class contents,
+    without a newline
+    """
+
+    def __init__(self, stops):
+        self._stop = re.compile('[%s\\n]' % stops)
+        self._run = re.compile('[\\s\\S]+')
+
+    def match(self, text, pos=0):
+        start = pos + 1
+        m = self._stop.search(text, start)
+
+        if m is None:
+            return self._run.match(text, pos)
+
+        end = m.start()
+        char = m.group()
+
+        if char == '\n':
+            while end > start and text[end - 1] == ' ':
+                end -= 1
+        elif char == ':' and text.startswith('//', end + 1):
+            if end - 5 >= start and text.startswith('https', end - 5):
+                end -= 5
+            elif end - 4 >= start and text.startswith('http', end - 4):
+                end -= 4
+
+        return self._run.match(text, pos, end)
@@ -58,3 +58,6 @@ ST_ALLOWED_URL_PROTOCOLS = {
     'git', 'svn', 'magnet', 'irc', 'ircs'}
 
 ST_MENTIONS_PER_COMMENT = 30
+
+ABSOLUTE_URL_OVERRIDES = {
+    'auth.user': lambda user: '/user/%s/' % user.pk}
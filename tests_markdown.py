@@ -2,14 +2,42 @@
 
 from __future__ import unicode_literals
 
+import re
+from unittest import mock
+import json
+import hmac
+import time
+import threading
+import hashlib
+import binascii
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
 from django.test import TestCase
 from django.test.utils import override_settings
 from django.utils import translation
 from django.utils import timezone
 
 import utils
-from sp_markdown import Markdown, quotify
+from sp_markdown import Markdown, RenderContext, quotify, markdown, extract
+from sp_markdown.cache import RenderCache
+from sp_markdown.stats import RuleStats
+from sp_markdown.block import BlockLexer, classify_link
+from sp_markdown.providers import Provider, providers
+from sp_markdown.proxy import proxy_url
+from sp_markdown import tokens
+from sp_markdown.tokens import TokenVersionError
+from sp_markdown.renderer import Renderer
+from sp_markdown.inline import InlineLexer
+from sp_markdown.mentions import user_urls
+from sp_markdown.utils.scanner import EmojiScanner, UnicodeEmojiScanner, TextScanner
+from sp_markdown.utils import emoji
+from sp_markdown.utils.cursor import unanchor
+from sp_markdown.utils.emoji import emojis
+from sp_markdown.utils.emoji_unicode import unicode_emojis, first_chars
 from django.conf import settings
+from django.core.cache import caches
 import test_settings
 
 now_fixed = timezone.now()
@@ -19,6 +47,7 @@ class UtilsMarkdownTests(TestCase):
   
     def setUp(self):
         utils.cache_clear()
+        user_urls.clear()
         self.user = utils.create_user(username="nitely")
         # self.user2 = utils.create_user(username="esteban")
         # self.user3 = utils.create_user(username="áéíóú")
@@ -64,28 +93,99 @@ class UtilsMarkdownTests(TestCase):
             '<em>&lt;em&gt;foobar&lt;/em&gt;</em></p>'
         ) )
 
-    # def test_markdown_mentions(self):
-    #     """
-    #     markdown mentions
-    #     """
-    #     comment = "@nitely, @esteban,@áéíóú, @fakeone"
-    #     comment_md = Markdown().render(comment)
-    #     self.assertEqual(comment_md, '<p><a class="comment-mention" rel="nofollow" href="%s">@nitely</a>, '
-    #                                  '<a class="comment-mention" rel="nofollow" href="%s">@esteban</a>,'
-    #                                  '<a class="comment-mention" rel="nofollow" href="%s">@áéíóú</a>, '
-    #                                  '@fakeone</p>' %
-    #                                  (self.user.st.get_absolute_url(),
-    #                                   self.user2.st.get_absolute_url(),
-    #                                   self.user3.st.get_absolute_url()))
-
-    # @override_settings(ST_MENTIONS_PER_COMMENT=2)
-    # def test_markdown_mentions_limit(self):
-    #     """
-    #     markdown mentions limit
-    #     """
-    #     comment = "@a, @b, @nitely"
-    #     comment_md = Markdown().render(comment)
-    #     self.assertEqual(comment_md, "<p>@a, @b, @nitely</p>")
+    def test_markdown_mentions(self):
+        """
+        markdown mentions
+        """
+        self.user2 = utils.create_user(username="esteban")
+        self.user3 = utils.create_user(username="áéíóú")
+        comment = "@nitely, @esteban,@áéíóú, @fakeone"
+
+        with self.assertNumQueries(1):
+            comment_md = Markdown().render(comment)
+
+        self.assertEqual(comment_md, '<p><a class="comment-mention" rel="nofollow" href="%s">@nitely</a>, '
+                                     '<a class="comment-mention" rel="nofollow" href="%s">@esteban</a>,'
+                                     '<a class="comment-mention" rel="nofollow" href="%s">@áéíóú</a>, '
+                                     '@fakeone</p>' %
+                                     (self.user.get_absolute_url(),
+                                      self.user2.get_absolute_url(),
+                                      self.user3.get_absolute_url()))
+
+    @override_settings(ST_MENTIONS_PER_COMMENT=2)
+    def test_markdown_mentions_limit(self):
+        """
+        markdown mentions limit
+        """
+        comment = "@a, @b, @nitely"
+        comment_md = Markdown().render(comment)
+        self.assertEqual(comment_md, "<p>@a, @b, @nitely</p>")
+
+    @override_settings(ST_MENTIONS_PER_COMMENT=2)
+    def test_markdown_mentions_limit_blocks(self):
+        """
+        Should cap the mentions per text, not per cached block
+        """
+        md = Markdown(cache=RenderCache(alias=None))
+        self.assertEqual(
+            md.render_incremental("@x @y\n\nping @nitely"),
+            "<p>@x @y</p>\n<p>ping @nitely</p>")
+        self.assertIn('comment-mention', md.render_incremental("hello\n\nping @nitely"))
+        self.assertIn('comment-mention', md.render("ping @nitely"))
+        self.assertEqual(
+            list(Markdown().iter_render("@x @y\n\nping @nitely")),
+            ["<p>@x @y</p>", "\n<p>ping @nitely</p>"])
+        self.assertEqual(
+            md.render_many(["@x @y @nitely", "@nitely"])[1],
+            Markdown().render("@nitely"))
+        self.assertEqual(extract("@x @y @nitely")['mentions'], ['x', 'y'])
+
+    def test_markdown_mentions_bulk(self):
+        """
+        Should resolve the mentions of many texts at once, and cache them
+        """
+        self.user2 = utils.create_user(username="esteban")
+        comments = ["@nitely", "@esteban @nitely", "@fakeone", "\x00@nitely\x00"]
+
+        with self.assertNumQueries(1):
+            comments_md = markdown.render_many(comments)
+
+        self.assertEqual(comments_md, [
+            '<p><a class="comment-mention" rel="nofollow" href="%s">@nitely</a></p>'
+            % self.user.get_absolute_url(),
+            '<p><a class="comment-mention" rel="nofollow" href="%s">@esteban</a> '
+            '<a class="comment-mention" rel="nofollow" href="%s">@nitely</a></p>'
+            % (self.user2.get_absolute_url(), self.user.get_absolute_url()),
+            '<p>@fakeone</p>',
+            '<p>\ufffd<a class="comment-mention" rel="nofollow" href="%s">@nitely</a>\ufffd</p>'
+            % self.user.get_absolute_url()])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(markdown.render_many(comments), comments_md)
+
+        utils.create_user(username="fakeone")
+        self.assertIn('comment-mention', markdown.render("@fakeone"))
+        self.user.username = 'nitely2'
+        self.user.save()
+        self.assertEqual(markdown.render("@nitely"), '<p>@nitely</p>')
+
+    def test_markdown_mentions_expire(self):
+        """
+        Should look up the cached mentions again once they expire,
+        as other processes don't get the invalidations
+        """
+        self.assertEqual(markdown.render("@ghost"), '<p>@ghost</p>')
+        # Renamed by another process, no signal here
+        type(self.user).objects.filter(pk=self.user.pk).update(username='ghost')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(markdown.render("@ghost"), '<p>@ghost</p>')
+
+        later = time.monotonic() + user_urls.timeout + 1
+
+        with mock.patch('sp_markdown.mentions.time.monotonic', return_value=later):
+            self.assertIn('comment-mention', markdown.render("@ghost"))
+            self.assertEqual(len(user_urls), 1)
 
     # def test_markdown_mentions_dict(self):
     #     """
@@ -431,3 +531,756 @@ class UtilsMarkdownTests(TestCase):
             self.assertEqual(
                 Markdown().render('[atk](%s)' % vector),
                 '<p><a rel="nofollow" href="%s">atk</a></p>' % expected)
+
+    def test_markdown_shared_engine(self):
+        """
+        Should render the same output
+        when the engine is shared between threads
+        """
+        comments = [
+            "foo *%d* :airplane: http://foo.bar/%d" % (i, i)
+            for i in range(50)]
+        expected = [Markdown().render(c) for c in comments]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            result = list(executor.map(markdown.render, comments))
+
+        self.assertListEqual(result, expected)
+
+    def test_markdown_context(self):
+        """
+        Should keep the render state in a per call context
+        """
+        md = Markdown()
+        context = md.context()
+        self.assertIsNot(context.block, md.context().block)
+        self.assertIsNot(context.inline, md.context().inline)
+        self.assertIs(context.renderer, md.renderer)
+        self.assertEqual(context.render("[foo][1]\n\n[1]: http://foo.com"),
+                         '<p><a rel="nofollow" href="http://foo.com">foo</a></p>')
+        self.assertEqual(md.render("[foo][1]"), '<p>[foo][1]</p>')
+
+    def test_markdown_cache(self):
+        """
+        Should render once and then hit the cache
+        """
+        cache = RenderCache(alias=None)
+        md = Markdown(cache=cache)
+        self.assertEqual(md.render("*foo*"), '<p><em>foo</em></p>')
+        self.assertEqual(len(cache), 1)
+        key = cache.make_key("*foo*", md.cache_options())
+        cache.set(key, 'cached')
+        self.assertEqual(md.render("*foo*"), 'cached')
+        self.assertEqual(len(cache), 1)
+
+    def test_markdown_cache_options(self):
+        """
+        Should not share entries between render options
+        """
+        cache = RenderCache(alias=None)
+        comment = "http://foo.com"
+        self.assertEqual(Markdown(cache=cache).render(comment),
+                         '<p><a rel="nofollow" href="http://foo.com">http://foo.com</a></p>')
+        self.assertEqual(Markdown(no_follow=False, cache=cache).render(comment),
+                         '<p><a href="http://foo.com">http://foo.com</a></p>')
+
+        with override_settings(ST_ALLOWED_URL_PROTOCOLS={'https'}):
+            self.assertEqual(Markdown(cache=cache).render(comment),
+                             '<p><a rel="nofollow" href=""></a></p>')
+
+        self.assertEqual(len(cache), 3)
+
+    def test_markdown_cache_max_size(self):
+        """
+        Should evict the least recently used entries by size
+        """
+        cache = RenderCache(max_size=1000, alias=None)
+        cache.set('a', 'x' * 300)
+        cache.set('b', 'x' * 300)
+        cache.get('a')
+        cache.set('c', 'x' * 300)
+        self.assertEqual(cache.get('a'), 'x' * 300)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 'x' * 300)
+        self.assertLessEqual(cache.size, 1000)
+        cache.set('d', 'x' * 3000)
+        self.assertIsNone(cache.get('d'))
+
+    def test_markdown_cache_django(self):
+        """
+        Should fill the local cache from the django cache
+        """
+        cache = RenderCache(alias='default')
+        md = Markdown(cache=cache)
+        md.render("*foo*")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        key = cache.make_key("*foo*", md.cache_options())
+        self.assertEqual(cache.get(key), '<p><em>foo</em></p>')
+        self.assertEqual(len(cache), 1)
+
+    @override_settings(ST_MARKDOWN_CACHE_ALIAS='default')
+    def test_markdown_cache_alias(self):
+        """
+        Should take the alias from the settings, unless told not to use one
+        """
+        self.assertEqual(RenderCache().alias, 'default')
+        self.assertIsNone(RenderCache(alias=None).alias)
+        self.assertIsNone(RenderCache(alias=False).alias)
+
+    def test_markdown_render_many(self):
+        """
+        Should render every text, in order
+        """
+        comments = ["foo *%d* :airplane:" % i for i in range(10)]
+        expected = [Markdown().render(c) for c in comments]
+        md = Markdown()
+        self.assertListEqual(md.render_many(comments), expected)
+        self.assertListEqual(md.render_many([]), [])
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertListEqual(
+                md.render_many(iter(comments), executor=executor, chunk_size=3),
+                expected)
+
+    def test_markdown_render_many_process_pool(self):
+        """
+        Should render the texts in a process pool
+        """
+        comments = ["foo *%d* http://foo.bar/image.png" % i for i in range(10)]
+        expected = [Markdown().render(c) for c in comments]
+        md = Markdown(cache=RenderCache(alias=None))
+        executor = ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context('fork'))
+
+        with executor:
+            self.assertListEqual(
+                md.render_many(comments, executor=executor, chunk_size=4),
+                expected)
+
+    def test_markdown_render_incremental(self):
+        """
+        Should reuse the HTML of the unchanged blocks
+        """
+        comment = (
+            "# title\n\n"
+            "foo *bar*\n\n"
+            "* a\n"
+            "* b\n\n"
+            "http://foo.bar/image.png\n\n"
+            "> quote :airplane:"
+        )
+        cache = RenderCache(alias=None)
+        md = Markdown(cache=cache)
+        self.assertEqual(md.render_incremental(comment), Markdown().render(comment))
+
+        edited = comment.replace("foo *bar*", "foo *baz*")
+        cache.set(cache.make_key("# title\n\n", (md.cache_options(), [])), '<h1>cached</h1>\n')
+        self.assertEqual(
+            md.render_incremental(edited),
+            Markdown().render(edited).replace('<h1>title</h1>', '<h1>cached</h1>'))
+
+    def test_markdown_render_incremental_django(self):
+        """
+        Should look up and store the blocks with a single round trip each
+        """
+        comment = "\n\n".join("foo *%d*" % i for i in range(20))
+        cache = RenderCache(alias='default')
+        md = Markdown(cache=cache)
+        django_cache = caches['default']
+
+        # Whole document lookups only
+        with mock.patch.object(cache, 'get', wraps=cache.get) as get, \
+                mock.patch.object(django_cache, 'get_many', wraps=django_cache.get_many) as get_many, \
+                mock.patch.object(django_cache, 'set_many', wraps=django_cache.set_many) as set_many:
+            self.assertEqual(md.render_incremental(comment), Markdown().render(comment))
+            self.assertEqual(get.call_count, 1)
+            self.assertEqual(get_many.call_count, 1)
+            self.assertEqual(set_many.call_count, 1)
+
+            cache.clear()
+            edited = comment.replace("foo *3*", "bar")
+            self.assertEqual(md.render_incremental(edited), Markdown().render(edited))
+            self.assertEqual(get_many.call_count, 2)
+            self.assertEqual(len(set_many.call_args[0][0]), 1)
+
+    def test_markdown_render_incremental_references(self):
+        """
+        Should re-render every block when the references change
+        """
+        comment = "[foo][1]\n\nbar\n\n[1]: http://foo.com"
+        cache = RenderCache(alias=None)
+        md = Markdown(cache=cache)
+        self.assertEqual(md.render_incremental(comment), Markdown().render(comment))
+        edited = comment.replace("http://foo.com", "http://bar.com")
+        self.assertEqual(md.render_incremental(edited), Markdown().render(edited))
+
+        comment = "foo[^1]\n\n[^1]: bar"
+        self.assertEqual(md.render_incremental(comment), Markdown().render(comment))
+        self.assertEqual(Markdown().render_incremental(comment), Markdown().render(comment))
+
+    def test_markdown_render_incremental_footnote_mentions(self):
+        """
+        Should cache the mention placeholders of texts with footnotes
+        """
+        comment = "hi @nitely[^1]\n\n[^1]: note"
+        cache = RenderCache(alias=None)
+        md = Markdown(cache=cache)
+        self.assertIn('href="/user/%s/">@nitely</a>' % self.user.pk, md.render_incremental(comment))
+        self.assertIn(
+            '\x00@nitely\x00', cache.get(cache.make_key(comment, md.cache_options())))
+
+        self.user.username = 'renamed'
+        self.user.save()
+        self.assertNotIn('comment-mention', md.render_incremental(comment))
+        self.assertNotIn('comment-mention', md.render(comment))
+
+    def test_markdown_iter_render(self):
+        """
+        Should yield the HTML of each top level block
+        """
+        comment = (
+            "\n\n# title\n\n"
+            "foo *bar*[^1]\n\n"
+            "* a\n"
+            "* b\n\n"
+            "https://www.youtube.com/watch?v=Z0UISCEe52Y\n\n"
+            "[^1]: note\n\n\n"
+        )
+        md = Markdown()
+        chunks = list(md.iter_render(comment))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(''.join(chunks), md.render(comment))
+        self.assertEqual(list(md.iter_render("")), [])
+        self.assertEqual(list(md.iter_render("  \n\n ")), [])
+
+    def test_markdown_iter_render_cache(self):
+        """
+        Should yield the cached HTML at once
+        """
+        cache = RenderCache(alias=None)
+        md = Markdown(cache=cache)
+        md.render("foo\n\nbar")
+        self.assertEqual(list(md.iter_render("foo\n\nbar")), ['<p>foo</p>\n<p>bar</p>'])
+
+    def test_markdown_arender(self):
+        """
+        Should render without blocking the event loop
+        """
+        md = Markdown()
+        comments = ["foo *%d* :airplane:" % i for i in range(10)]
+        loop = asyncio.new_event_loop()
+
+        try:
+            with mock.patch('sp_markdown.sp_markdown.sync_to_async') as sync_to_async:
+                self.assertEqual(
+                    loop.run_until_complete(md.arender("*foo*")),
+                    '<p><em>foo</em></p>')
+                loop.run_until_complete(md.arender_many(["foo", "bar"]))
+                self.assertFalse(sync_to_async.called)
+
+            # The URL gets cached, the test DB can't be shared with other threads
+            expected = md.render("@nitely")
+            self.assertIn('comment-mention', expected)
+            threads = []
+            render_mentions = md.render_mentions
+
+            def record_thread(htmls):
+                threads.append(threading.current_thread().name)
+                return render_mentions(htmls)
+
+            md.render_mentions = record_thread
+
+            with ThreadPoolExecutor(thread_name_prefix='render') as executor:
+                self.assertEqual(
+                    loop.run_until_complete(md.arender("@nitely", executor=executor)),
+                    expected)
+                self.assertEqual(
+                    loop.run_until_complete(md.arender_many(["@nitely"], executor=executor)),
+                    [expected])
+
+            self.assertEqual(len(threads), 2)
+            self.assertFalse(any(t.startswith('render') for t in threads))
+            del md.render_mentions
+            self.assertListEqual(
+                loop.run_until_complete(md.arender_many(comments, chunk_size=3)),
+                [md.render(c) for c in comments])
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                self.assertListEqual(
+                    loop.run_until_complete(md.arender_many(comments, executor=executor)),
+                    [md.render(c) for c in comments])
+        finally:
+            loop.close()
+
+    def test_markdown_rule_stats(self):
+        """
+        Should record attempts, matches and times per rule
+        """
+        stats = RuleStats()
+        md = Markdown(stats=stats)
+        comment = "http://foo.bar/image.png\n\nfoo *bar* :airplane:"
+        self.assertEqual(md.render(comment), Markdown().render(comment))
+        result = stats.snapshot()
+        # Neither block starts with "[poll"
+        self.assertNotIn('block.poll', result)
+        self.assertEqual(result['block.block_link']['attempts'], 1)
+        self.assertEqual(result['block.block_link']['matches'], 1)
+        self.assertEqual(result['block.paragraph']['matches'], 1)
+        self.assertEqual(result['inline.emoji']['matches'], 1)
+        self.assertEqual(result['inline.emphasis']['matches'], 1)
+        self.assertGreaterEqual(result['inline.text']['matches'], 3)
+        self.assertGreater(result['inline.text']['time'], 0)
+        self.assertGreater(result['block.block_link']['hook_time'], 0)
+
+        md.render(comment)
+        self.assertEqual(stats.snapshot()['block.block_link']['matches'], 2)
+        stats.reset()
+        self.assertEqual(stats.snapshot(), {})
+
+    def test_markdown_youtube_params(self):
+        """
+        Should take the timestamp from any param, the last one wins
+        """
+        comment = (
+            "https://www.youtube.com/watch?v=O1QQajfobPw&a=1&b=2&c=3&d=4&e=5&f=6&g=7&h=8&i=9&j=10&t=1m\n"
+            "https://youtu.be/O1QQajfobPw?t=1s&t=2m?t=1h&&\n"
+            "https://youtu.be/O1QQajfobPw?t=1mbad\n"
+        )
+        self.assertListEqual(
+            Markdown().render(comment).splitlines(),
+            [
+                '<span class="video"><iframe src="https://www.youtube.com/embed/O1QQajfobPw?html5=1&start=60" '
+                'allowfullscreen></iframe></span>',
+                '<span class="video"><iframe src="https://www.youtube.com/embed/O1QQajfobPw?html5=1&start=3600" '
+                'allowfullscreen></iframe></span>',
+                '<span class="video"><iframe src="https://www.youtube.com/embed/O1QQajfobPw?html5=1" '
+                'allowfullscreen></iframe></span>'
+            ])
+
+    def test_markdown_poll(self):
+        """
+        Should render polls as typed
+        """
+        comment = (
+            "[poll name=foo]\n"
+            "# title\n"
+            "1. opt 1\n"
+            "2. opt 2\n"
+            "[/poll]"
+        )
+        self.assertEqual(
+            Markdown().render(comment),
+            '<p>[poll name=foo]<br>\n# title<br>\n1. opt 1<br>\n2. opt 2<br>\n[/poll]</p>')
+
+    def test_markdown_adversarial(self):
+        """
+        Should render crafted block links, polls and references in linear time
+        """
+        attack_vectors = (
+            'https://youtu.be/xxxxxxxxxxx' + '?' * 5000 + '&',
+            'https://www.youtube.com/watch?v=xxxxxxxxxxx' + '&t=1' * 5000,
+            'http://a' + '/' * 20000 + 'x',
+            'http://a/' + 'b.png/' * 5000 + 'x',
+            'http://a/' + '.mp3.' * 5000 + 'x',
+            '[poll name=foo]\n' + '1. opt\n' * 20000,
+            '[poll name=foo]\n#' + ' ' * 20000 + '\n1. a\n',
+            '[poll ' + 'x' * 20000 + '\n' + 'foo\n' * 5000,
+            '[poll x\n\n' * 8000,
+            '[poll x]\n\n' * 8000,
+            '[poll name=foo]\nfoo\n\n' * 8000,
+        )
+
+        for vector in attack_vectors:
+            start = time.time()
+            Markdown().render(vector)
+            self.assertLess(time.time() - start, 2)
+
+        # References can span lines, but not blank lines
+        self.assertEqual(Markdown().render('[foo\nbar]: http://x'), '')
+        self.assertEqual(
+            Markdown().render('[foo\n\nbar]: http://x'),
+            '<p>[foo</p>\n<p>bar]: http://x</p>')
+
+    def test_classify_link(self):
+        """
+        Should dispatch block links by host and extension
+        """
+        links = (
+            ('https://youtu.be/afyK1HSFfgw', 'youtube_link'),
+            ('https://www.youtube.com/watch?v=<bad>.png', 'image_link'),
+            ('https://player.vimeo.com/video/11111111', 'vimeo_link'),
+            ('https://www.gfycat.com/foo', 'gfycat_link'),
+            ('http://foo.bar/foo.mp3?x.png', 'audio_link'),
+            ('http://foo.bar/foo.png?x.mp3?', 'image_link'),
+            ('http://foo.bar/foo.webm', 'video_link'),
+            ('http://foo.bar/.png', 'block_link'),
+            ('http://foo.bar/png', 'block_link'),
+            ('http://vimeo.com', 'block_link'),
+        )
+
+        for link, expected in links:
+            self.assertEqual(classify_link(link)[0], expected)
+
+        self.assertIs(
+            classify_link('https://youtu.be/afyK1HSFfgw'),
+            classify_link('https://youtu.be/afyK1HSFfgw'))
+        self.assertEqual(
+            classify_link('http://foo.bar/foo.png?x.mp3?')[1].group('image_name'), 'foo')
+
+    def test_emoji_scanner(self):
+        """
+        Should resolve emoji names to their class names
+        """
+        scanner = EmojiScanner(['+1', 'foo_bar'])
+        self.assertEqual(
+            scanner.name_classes, {'+1': 'plus1', 'foo_bar': 'foo-bar'})
+        self.assertEqual(scanner.match(':foo_bar: :+1:').group('emoji'), 'foo_bar')
+        self.assertIsNone(scanner.match('foo_bar:'))
+        self.assertEqual(
+            markdown(':+1::bademoji::+1:'),
+            '<p><i class="tw tw-plus1" title=":+1:"></i>:bademoji:'
+            '<i class="tw tw-plus1" title=":+1:"></i></p>')
+
+    def test_emoji_fragments(self):
+        """
+        Should reuse the emoji HTML, one table per emoji implementation
+        """
+        class MyRenderer(Renderer):
+            def emoji(self, name_class, name_raw):
+                return '<%s>' % name_raw
+
+        renderer = Renderer()
+        self.assertIs(renderer.emoji_fragments(), Renderer().emoji_fragments())
+        self.assertEqual(
+            renderer.emoji_fragments()['+1'],
+            renderer.emoji(name_class='plus1', name_raw='+1'))
+        self.assertEqual(MyRenderer().emoji_fragments()['+1'], '<+1>')
+        self.assertEqual(
+            MyRenderer().emoji_fragment(name_class='foo', name_raw='foo'), '<foo>')
+
+        with self.assertRaises(TypeError):
+            renderer.emoji_fragments()['+1'] = ''
+
+    def test_markdown_unicode_emoji_lazy(self):
+        """
+        Should not load the emoji data to render text without emojis
+        """
+        scanner = UnicodeEmojiScanner(unicode_emojis, first_chars)
+        self.assertIsNone(scanner.match('hello world'))
+        self.assertIsNone(scanner._trie)
+        self.assertEqual(scanner.match('\U0001f44d').group('emoji'), '+1')
+
+        data = emoji._data
+        emoji._data = None
+
+        try:
+            self.assertEqual(markdown('hello *world* 1 <b>'), '<p>hello <em>world</em> 1 &lt;b&gt;</p>')
+            self.assertIsNone(emoji._data)
+        finally:
+            emoji._data = data
+
+    def test_markdown_unicode_emoji(self):
+        """
+        Should render unicode emojis, with modifiers and ZWJ sequences
+        """
+        comment = (
+            '\U0001f44d \U0001f44d\U0001f3fd '
+            '\U0001f468\u200d\U0001f469\u200d\U0001f467 \xa9 \xa9\ufe0f')
+        self.assertEqual(
+            markdown(comment),
+            '<p><i class="tw tw-plus1" title=":+1:"></i> '
+            '<i class="tw tw-plus1-tone3" title=":+1_tone3:"></i> '
+            '<i class="tw tw-family-mwg" title=":family_mwg:"></i> '
+            '© <i class="tw tw-copyright" title=":copyright:"></i></p>')
+
+    def test_emoji_data(self):
+        """
+        Should look up the compact emoji data
+        """
+        self.assertIn('+1', emojis)
+        self.assertIn('zzz', emojis)
+        self.assertNotIn('+', emojis)
+        self.assertNotIn('zzzz', emojis)
+        self.assertNotIn(None, emojis)
+        self.assertEqual(len(emojis), len(set(emojis)))
+        self.assertEqual(unicode_emojis['\U0001f44d'], '+1')
+        self.assertNotIn('\U0001f44d\U0001f44d', unicode_emojis)
+
+        for sequence in unicode_emojis:
+            self.assertRegex(sequence, '^[%s]' % first_chars)
+
+    def test_extract(self):
+        """
+        Should collect mentions, links, embeds and emojis without rendering
+        """
+        comment = (
+            "@nitely and @fakeone :+1: \U0001f44d [foo](http://foo.bar) <a@b.c>\n\n"
+            "https://youtu.be/afyK1HSFfgw\n\n"
+            "```\n@esteban :smile:\n```\n\n"
+            "> no mentions here")
+
+        with self.assertNumQueries(0):
+            result = extract(comment)
+
+        self.assertEqual(result['mentions'], ['nitely', 'fakeone'])
+        self.assertEqual(result['links'], ['http://foo.bar', 'mailto:a@b.c'])
+        self.assertEqual(result['images'], [])
+        self.assertEqual(result['emojis'], ['+1', '+1'])
+        self.assertEqual(result['block_links'], [{
+            'type': 'youtube_link',
+            'video_id': 'afyK1HSFfgw',
+            'start_hours': None,
+            'start_minutes': None,
+            'start_seconds': None}])
+
+    def test_text_scanner(self):
+        """
+        Should match the same text runs as the lookahead regex
+        """
+        stops = r'\\<!\[_*`:@~'
+        regex = re.compile(r'^[\s\S]+?(?=[%s]|https?://| *\n|$)' % stops)
+        scanner = TextScanner(stops)
+        texts = (
+            '', 'a', 'foo bar', 'foo *bar*', 'foo  \nbar', '  \n', 'a\n',
+            'foo http://bar', 'foohttps://bar', 'http://foo', 'https://foo',
+            'foo http:bar', 'foo:bar', 'xhttps:', 'a' * 1000 + '@b')
+
+        for text in texts:
+            expected = regex.match(text)
+            m = scanner.match(text)
+            self.assertEqual(
+                m and m.group(0), expected and expected.group(0), text)
+
+    def test_inline_dispatch_table(self):
+        """
+        Should only try the rules that can match the first char
+        """
+        lexer = InlineLexer(Renderer())
+        buckets, default = lexer.dispatch_table(lexer.default_rules)
+        self.assertEqual(buckets[':'], ('emoji', 'unicode_emoji', 'text'))
+        self.assertEqual(buckets['@'], ('mention', 'unicode_emoji', 'text'))
+        self.assertEqual(default, ('unicode_emoji', 'text'))
+        self.assertIs(
+            lexer.dispatch_table(list(lexer.default_rules))[0], buckets)
+
+        class MyLexer(InlineLexer):
+            default_rules = ['foo'] + InlineLexer.default_rules
+
+        lexer = MyLexer(Renderer())
+        buckets, default = lexer.dispatch_table(lexer.default_rules)
+        self.assertEqual(buckets[':'], ('foo', 'emoji', 'unicode_emoji', 'text'))
+        self.assertEqual(default, ('foo', 'unicode_emoji', 'text'))
+
+    def test_block_dispatch_table(self):
+        """
+        Should skip poll and block_link unless the block may start with them
+        """
+        lexer = BlockLexer()
+        buckets, default = lexer.dispatch_table(lexer.default_rules)
+        self.assertNotIn('poll', default)
+        self.assertNotIn('block_link', default)
+        self.assertEqual(buckets['['][0], 'poll')
+        self.assertEqual(buckets['h'][0], 'block_link')
+        self.assertEqual(
+            markdown('[poll name=foo]\n1. a\n2. b\n[/poll]\n\nhttp://foo.bar'),
+            Markdown().render('[poll name=foo]\n1. a\n2. b\n[/poll]') + '\n' +
+            Markdown().render('http://foo.bar'))
+
+    def test_unanchor(self):
+        """
+        Should match at a position the same as on the sliced text
+        """
+        patterns = (
+            re.compile(r'^\b_((?:__|[^_])+?)_\b|^\*((?:\*\*|[^\*])+?)\*(?!\*)'),
+            re.compile(r'^ *\[([^^\]]+)\]: *'),
+            re.compile(r'^[]|^]+'),
+            re.compile(r'^(?:a|^b)'))
+        texts = ('a_foo_ b', 'x*foo* b', 'x [foo]: bar', 'x]|^]x', 'xa', 'xb')
+
+        for pattern in patterns:
+            unanchored = unanchor(pattern)
+
+            for text in texts:
+                for pos in range(len(text)):
+                    expected = pattern.match(text[pos:])
+                    m = unanchored.match(text, pos)
+                    self.assertEqual(
+                        m and m.group(0), expected and expected.group(0),
+                        (pattern.pattern, text, pos))
+
+        self.assertEqual(
+            markdown('a_foo_ _bar_ foo_bar_baz'),
+            '<p>a<em>foo</em> <em>bar</em> foo_bar_baz</p>')
+
+    def test_token_handlers(self):
+        """
+        Should map every token type to its output method, once per class
+        """
+        class MyContext(RenderContext):
+            def output_foo(self):
+                return 'foo'
+
+        handlers = RenderContext.token_handlers()
+        self.assertIs(handlers, RenderContext.token_handlers())
+        self.assertIs(handlers['embed'], RenderContext.output_embed)
+        self.assertIs(handlers['list_start'], RenderContext.output_list)
+        self.assertNotIn('foo', handlers)
+        self.assertIs(MyContext.token_handlers()['foo'], MyContext.output_foo)
+        self.assertEqual(
+            markdown('- a\n- b\n\n> c\n\nfoo[^1]\n\n[^1]: d'),
+            '<ul>\n<li>a</li>\n<li>b</li>\n</ul>\n'
+            '<blockquote><p>c</p>\n</blockquote>\n'
+            '<p>foo<sup class="footnote-ref" id="fnref-1"><a href="#fn-1">1</a></sup></p>\n'
+            '<div class="footnotes">\n<hr>\n<ol>'
+            '<li id="fn-1"><p>d<a href="#fnref-1" class="footnote">&#8617;</a></p></li>\n'
+            '</ol>\n</div>')
+
+    def test_providers(self):
+        """
+        Should embed the links of a registered provider
+        """
+        class SoundCloudProvider(Provider):
+            name = 'soundcloud_link'
+            hosts = ('soundcloud.com',)
+            pattern = re.compile(
+                r'^https?://soundcloud\.com/(?P<track>[\w\-]+/[\w\-]+)$')
+
+            def parse(self, m):
+                return {'track': m.group('track')}
+
+            def render(self, renderer, track):
+                return '<iframe src="https://w.soundcloud.com/%s"></iframe>\n' % track
+
+        link = 'https://soundcloud.com/foo/bar'
+        self.assertEqual(classify_link(link)[0], 'block_link')
+        self.assertEqual(
+            [p.name for p in providers.for_host('www.youtube.com')], ['youtube_link'])
+        version = providers.version()
+
+        providers.register(SoundCloudProvider())
+
+        try:
+            self.assertNotEqual(providers.version(), version)
+            self.assertEqual(classify_link(link)[0], 'soundcloud_link')
+            self.assertEqual(
+                markdown(link),
+                '<iframe src="https://w.soundcloud.com/foo/bar"></iframe>')
+            self.assertEqual(
+                extract(link)['block_links'],
+                [{'type': 'soundcloud_link', 'track': 'foo/bar'}])
+        finally:
+            providers.unregister('soundcloud_link')
+
+        self.assertEqual(providers.version(), version)
+        self.assertEqual(classify_link(link)[0], 'block_link')
+        self.assertNotIn('soundcloud_link', providers)
+
+    def test_markdown_facades(self):
+        """
+        Should render embed placeholders and not preload media
+        """
+        comment = (
+            "https://www.youtube.com/watch?v=Z0UISCEe52Y&t=1m13s\n"
+            "https://vimeo.com/11111111\n"
+            "http://foo.bar/foo.mp3\n"
+            "http://foo.bar/foo.mp4")
+        md = Markdown(facades=True)
+        self.assertEqual(
+            md(comment),
+            '<span class="video video-facade" data-provider="youtube_link" '
+            'data-src="https://www.youtube.com/embed/Z0UISCEe52Y?html5=1&amp;start=73">'
+            '<img src="https://i.ytimg.com/vi/Z0UISCEe52Y/hqdefault.jpg" alt="" loading="lazy">'
+            '</span>\n'
+            '<span class="video video-facade" data-provider="vimeo_link" '
+            'data-src="https://player.vimeo.com/video/11111111"></span>\n'
+            '<audio controls preload="none"><source src="http://foo.bar/foo.mp3">'
+            '<a rel="nofollow" href="http://foo.bar/foo.mp3">http://foo.bar/foo.mp3</a></audio>\n'
+            '<video controls preload="none"><source src="http://foo.bar/foo.mp4">'
+            '<a rel="nofollow" href="http://foo.bar/foo.mp4">http://foo.bar/foo.mp4</a></video>')
+        self.assertNotIn('facade', Markdown()(comment))
+        self.assertNotEqual(md.cache_options(), Markdown().cache_options())
+
+    @override_settings(
+        ST_IMAGE_PROXY_URL='https://camo.example.com/',
+        ST_IMAGE_PROXY_KEY='secret')
+    def test_markdown_image_proxy(self):
+        """
+        Should load images through the proxy, lazily
+        """
+        src = 'http://foo.bar/foo.png?a=1&b=2'
+        signed = (
+            'https://camo.example.com/%s/%s' % (
+                hmac.new(b'secret', src.encode('utf-8'), hashlib.sha1).hexdigest(),
+                binascii.hexlify(src.encode('utf-8')).decode('ascii')))
+        md = Markdown(image_proxy=True)
+        self.assertEqual(
+            md('![foo](%s)\n\n%s\n\n![bar](/local.png)' % (src, src)),
+            '<p><img src="%(signed)s" alt="foo" loading="lazy" decoding="async"></p>\n'
+            '<p><img src="%(signed)s" alt="foo" title="foo" loading="lazy" decoding="async"></p>\n'
+            '<p><img src="/local.png" alt="bar" loading="lazy" decoding="async"></p>'
+            % {'signed': signed})
+        self.assertEqual(proxy_url(signed), signed)
+        self.assertNotEqual(
+            proxy_url('https://camo.example.com.evil.net/pixel.png'),
+            'https://camo.example.com.evil.net/pixel.png')
+        self.assertEqual(
+            proxy_url('//evil.net/pixel.png'), proxy_url('https://evil.net/pixel.png'))
+        self.assertTrue(proxy_url('https://evil.net/pixel.png').startswith(
+            'https://camo.example.com/'))
+        self.assertIn(
+            proxy_url('https://evil.net/pixel.png'),
+            md('![x](//evil.net/pixel.png)'))
+        self.assertEqual(
+            proxy_url('/\\evil.net/pixel.png'), proxy_url('https://evil.net/pixel.png'))
+        self.assertEqual(proxy_url('/local.png'), '/local.png')
+        self.assertEqual(proxy_url('javascript:foo'), 'javascript:foo')
+        self.assertEqual(
+            markdown('![foo](%s)' % src),
+            '<p><img src="http://foo.bar/foo.png?a=1&amp;b=2" alt="foo"></p>')
+
+        options = md.cache_options()
+        self.assertNotEqual(options, Markdown().cache_options())
+
+        with override_settings(ST_IMAGE_PROXY_KEY='other'):
+            self.assertNotEqual(md.cache_options(), options)
+
+    def test_render_tokens(self):
+        """
+        Should render a stored token stream same as the text
+        """
+        comment = (
+            "@nitely [foo][1] :+1:\n\n"
+            "- a\n- b\n\n"
+            "https://youtu.be/afyK1HSFfgw\n\n"
+            "http://foo.bar/foo.png\n\n"
+            "bar[^1]\n\n"
+            "[1]: http://foo.bar\n"
+            "[^1]: note")
+        md = Markdown()
+        stream = json.loads(json.dumps(md.lex(comment)))
+        self.assertEqual(stream['v'], tokens.VERSION)
+        self.assertIn(['list_item_start'], stream['t'])
+        self.assertEqual(md.render_tokens(stream), md(comment))
+        self.assertIn(
+            '<a rel="nofollow" href="http://foo.bar">', md.render_tokens(stream))
+        self.assertIn(
+            '<a href="http://foo.bar">', Markdown(no_follow=False).render_tokens(stream))
+
+        stream['v'] = 0
+        self.assertRaises(TokenVersionError, md.render_tokens, stream)
+
+        # Embeds of unregistered providers are rendered as links
+        stream = md.lex("https://gfycat.com/foo")
+        gfycat = providers['gfycat_link']
+        providers.unregister('gfycat_link')
+
+        try:
+            self.assertEqual(
+                md.render_tokens(stream),
+                '<p><a rel="nofollow" href="https://gfycat.com/foo">'
+                'https://gfycat.com/foo</a></p>')
+        finally:
+            providers.register(gfycat)
+
+        self.assertEqual(md.render_tokens(stream), md("https://gfycat.com/foo"))